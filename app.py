@@ -1,6 +1,14 @@
 import os
 import streamlit as st
 
+# Page configuration must be the first Streamlit call
+st.set_page_config(
+    page_title="Career Accelerator AI",
+    page_icon="🚀",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
 # ⚠️ CRITICAL: Set API key BEFORE any other imports
 if "GROQ_API_KEY" in st.secrets:
     os.environ["GROQ_API_KEY"] = st.secrets["GROQ_API_KEY"]
@@ -17,28 +25,61 @@ else:
     """)
     st.stop()
 # Now import other modules AFTER setting the environment variable
+import hmac
 import sys
 from pathlib import Path
+import uuid
 import warnings
 from datetime import datetime
-import re
 
 # FIX: Add the *src* folder to PYTHONPATH
 ROOT_DIR = Path(__file__).resolve().parent
 SRC_DIR = ROOT_DIR / "src"
 sys.path.insert(0, str(SRC_DIR))
 
-from newgroq.crew import Newgroq
+from newgroq.progress import TASK_SECTIONS
+from newgroq.cache import cache_key
+from newgroq.exports import EXPORTS, export_cache
+from newgroq.report import CareerPlan
+from newgroq.metrics import registry, serve_metrics
+from newgroq.routing import suggest_routes
+from newgroq.service import (
+    PREWARM,
+    get_crew_pool,
+    get_job_manager,
+    get_plan_history,
+    get_plan_warehouse,
+    get_user_store,
+)
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
-# Page configuration
-st.set_page_config(
-    page_title="Career Accelerator AI",
-    page_icon="🚀",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+@st.cache_resource
+def start_crew_pool():
+    """Pre-build crews once per server process so Generate skips construction.
+
+    Building the first crew is what imports crewai/litellm; it runs on a
+    daemon thread so it never holds up a page render.
+    """
+    pool = get_crew_pool()
+    if PREWARM:
+        pool.warm_up_async()
+    return pool
+
+@st.cache_resource
+def open_plan_warehouse():
+    """Map the precomputed plan file once per server process"""
+    return get_plan_warehouse()
+
+open_plan_warehouse()
+
+@st.cache_resource
+def start_metrics_server():
+    """Expose /metrics and /metrics.json when NEWGROQ_METRICS_PORT is set (on NEWGROQ_METRICS_HOST, localhost by default)"""
+    port = os.environ.get("NEWGROQ_METRICS_PORT")
+    return serve_metrics(int(port), os.environ.get("NEWGROQ_METRICS_HOST", "127.0.0.1")) if port else None
+
+start_metrics_server()
 
 # Custom CSS for better styling
 st.markdown("""
@@ -127,38 +168,258 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-def parse_crew_output(result):
-    """Parse CrewAI output into structured sections"""
-    result_text = str(result)
+AGENT_LABELS = {
+    'skill_gap_analysis_task': "👤 Agent 1: Senior Career Development Analyst",
+    'learning_path_design_task': "👤 Agent 2: Educational Curriculum Architect",
+    'action_plan_task': "👤 Agent 3: Executive Performance Coach",
+}
+
+AGENT_ACTIVITY = {
+    'skill_gap_analysis_task': "Analyzing skill gaps...",
+    'learning_path_design_task': "Designing learning path...",
+    'action_plan_task': "Creating action plan...",
+}
+
+@st.fragment(run_every=1)
+def job_progress_panel(job_id):
+    """Poll a background plan job; hand back to a full rerun once it finishes"""
+    job = get_job_manager().get(job_id)
+    if job is None or job.finished:
+        st.rerun()
     
-    sections = {
-        'skill_gap': '',
-        'learning_path': '',
-        'action_plan': '',
-        'full_output': result_text
-    }
+    snapshot = job.progress.snapshot()
+    st.progress(int(5 + 90 * snapshot['fraction']))
+    
+    for task_name in TASK_SECTIONS:
+        if task_name in snapshot['outputs']:
+            line = f"✅ {AGENT_LABELS[task_name]} - done"
+        elif task_name == snapshot['current'] and job.started_at:
+            line = f"{AGENT_LABELS[task_name]} - {AGENT_ACTIVITY[task_name]}"
+        else:
+            line = f"⏳ {AGENT_LABELS[task_name]} - waiting"
+        st.markdown(f'<div class="agent-status">{line}</div>', unsafe_allow_html=True)
+    
+    if not job.started_at:
+        st.caption("Your plan is queued and will start as soon as an agent team is free.")
+    
+    # Show each section as soon as its task lands, streaming the one in flight
+    tabs = st.tabs(["📋 Skill Gap Analysis", "🛤️ Learning Path", "📅 30-Day Action Plan"])
+    for tab, task_name in zip(tabs, TASK_SECTIONS):
+        with tab:
+            if task_name in snapshot['outputs']:
+                st.markdown(snapshot['outputs'][task_name])
+            elif task_name in snapshot['streams']:
+                st.markdown(snapshot['streams'][task_name] + " ▌")
+            else:
+                st.info("⏳ This section will appear as soon as its agent finishes.")
+    
+    if st.button("✖️ Cancel Generation"):
+        get_job_manager().cancel(job_id)
+        st.session_state.pop('plan_job', None)
+        st.rerun()
+
+def plan_state(name, job_id):
+    """Per-plan dict in session state, so widget data survives every rerun"""
+    return st.session_state.setdefault(name, {}).setdefault(job_id, {})
+
+SKILL_CHECKLIST = ["Technical Skill 1", "Technical Skill 2", "Technical Skill 3", "Soft Skill 1", "Soft Skill 2"]
+
+@st.fragment
+def skill_checklist(job_id):
+    st.markdown("Track your progress on key skills:")
+    checked = plan_state('skill_checklist', job_id)
+    for skill in SKILL_CHECKLIST:
+        checked[skill] = st.checkbox(skill, value=checked.get(skill, False), key=f"skill_{job_id}_{skill}")
+    done = sum(checked.values())
+    if done:
+        st.caption(f"{done}/{len(SKILL_CHECKLIST)} skills checked off")
+
+def current_user_id():
+    """Anonymous user id, kept in the URL so saved progress survives a reload"""
+    user_id = st.query_params.get('user')
+    if not user_id:
+        user_id = st.session_state.setdefault('user_id', uuid.uuid4().hex)
+        st.query_params['user'] = user_id
+    return user_id
+
+def saved(store) -> bool:
+    """Wait for this session's queued writes, reporting any that failed"""
+    try:
+        store.flush()
+        return True
+    except Exception:
+        st.error("⚠️ That could not be saved. Please try again.")
+        return False
+
+@st.fragment
+def resource_organizer(plan_id):
+    st.markdown("Keep track of your learning resources:")
+    store = get_user_store()
+    user_id = current_user_id()
+    course_name = st.text_input("Course/Resource Name", key=f"resource_name_{plan_id}")
+    course_url = st.text_input("URL", key=f"resource_url_{plan_id}")
+    if st.button("Save Resource", key=f"save_resource_{plan_id}"):
+        if course_name.strip():
+            store.add_resource(user_id, plan_id, course_name.strip(), course_url.strip())
+            if saved(store):
+                st.success(f"✅ Saved: {course_name}")
+        else:
+            st.warning("⚠️ Enter a course or resource name first.")
+    for resource in store.resources(user_id, plan_id):
+        st.markdown(f"- [{resource['name']}]({resource['url']})" if resource['url'] else f"- {resource['name']}")
+
+@st.fragment
+def progress_tracker(plan_id):
+    store = get_user_store()
+    user_id = current_user_id()
+    week = st.selectbox("Select Week", ["Week 1", "Week 2", "Week 3", "Week 4"], key=f"progress_week_{plan_id}")
+    entry = store.progress(user_id, plan_id).get(week, {'progress': 0, 'notes': ""})
+    progress = st.slider(f"Progress for {week}", 0, 100, entry['progress'], key=f"progress_{plan_id}_{week}")
+    st.progress(progress / 100)
+    notes = st.text_area("Notes/Reflections", value=entry['notes'], key=f"notes_{plan_id}_{week}")
+    if st.button("Save Progress", key=f"save_progress_{plan_id}"):
+        store.save_progress(user_id, plan_id, week, progress, notes)
+        if saved(store):
+            st.success(f"✅ Progress saved for {week}!")
+
+@st.fragment
+def feedback_form(plan_id):
+    store = get_user_store()
+    user_id = current_user_id()
+    submitted = store.feedback(user_id, plan_id)
+    rating = st.select_slider(
+        "Rate your experience:",
+        options=["Poor", "Fair", "Good", "Very Good", "Excellent"],
+        value=submitted['rating'] if submitted else "Good",
+        key=f"rating_{plan_id}"
+    )
+    feedback = st.text_area("Additional feedback (optional):", key=f"feedback_{plan_id}")
+    if st.button("Submit Feedback", use_container_width=True, key=f"submit_feedback_{plan_id}"):
+        store.add_feedback(user_id, plan_id, rating, feedback)
+        submitted = saved(store)
+    if submitted:
+        st.success("Thank you for your feedback! 🙏")
+
+@st.fragment
+def export_panel(job_id, inputs, career_plan, generated_at):
+    """Build a download on request; exports are cached per result, so reruns are free"""
+    format_col, action_col = st.columns([2, 1])
+
+    with format_col:
+        export_format = st.selectbox(
+            "Format",
+            list(EXPORTS),
+            format_func=lambda fmt: EXPORTS[fmt].label,
+            label_visibility="collapsed",
+            key=f"export_format_{job_id}"
+        )
+
+    with action_col:
+        prepared = st.session_state.setdefault('prepared_exports', {}).setdefault(job_id, set())
+        if export_format not in prepared:
+            if st.button("⚙️ Prepare Download", use_container_width=True, key=f"prepare_{job_id}"):
+                prepared.add(export_format)
+                st.rerun(scope="fragment")
+        else:
+            export = EXPORTS[export_format]
+            st.download_button(
+                label=f"📥 Download {export.label}",
+                data=export_cache.render(export_format, inputs, career_plan, generated_at),
+                file_name=f"career_plan_{generated_at.strftime('%Y%m%d_%H%M')}.{export.extension}",
+                mime=export.mime,
+                use_container_width=True,
+                key=f"download_{job_id}_{export_format}"
+            )
+
+@st.fragment
+def plan_history_search(user_id=None):
+    """Full-text search over generated plans, one page at a time; only ``user_id``'s if given"""
+    history = get_plan_history()
+    query = st.text_input(
+        "Search past plans",
+        placeholder='e.g. Kubernetes DevOps, goal:"data engineer", terraform*',
+        key="history_query"
+    )
+    if st.session_state.get('history_last_query') != query:
+        st.session_state['history_last_query'] = query
+        st.session_state['history_page'] = 1
+    page = st.session_state.get('history_page', 1)
+    
+    results = history.search(query, page=page, per_page=10, user_id=user_id)
+    st.caption(f"{results['total']} plan(s) · page {results['page']} of {results['pages']}")
+    for result in results['results']:
+        created = datetime.fromtimestamp(result['created_at']).strftime("%Y-%m-%d %H:%M")
+        with st.expander(f"🎯 {result['career_goal']} · {result['industry']} · {created}"):
+            st.markdown(result['snippet'])
+            if st.button("Show full plan", key=f"history_show_{result['id']}"):
+                record = history.get(result['id'], user_id=user_id)
+                st.markdown(record['plan'].full_report())
+    
+    prev_col, next_col = st.columns(2)
+    with prev_col:
+        if st.button("⬅️ Previous", disabled=page <= 1, key="history_prev"):
+            st.session_state['history_page'] = page - 1
+            st.rerun(scope="fragment")
+    with next_col:
+        if st.button("Next ➡️", disabled=page >= results['pages'], key="history_next"):
+            st.session_state['history_page'] = page + 1
+            st.rerun(scope="fragment")
+
+def render_admin_page():
+    """Latency, token and cache metrics for capacity planning (?admin=<NEWGROQ_ADMIN_TOKEN>)"""
+    st.markdown("## 🛠️ Performance Metrics")
+    metrics = registry.as_dict()
+    
+    st.markdown("### ⏱️ Latency and Size Percentiles")
+    rows = []
+    for name, series in sorted(metrics['histograms'].items()):
+        for entry in series:
+            quantiles = entry['quantiles']
+            rows.append({
+                'metric': name,
+                'labels': ", ".join(f"{k}={v}" for k, v in entry['labels'].items()),
+                'count': entry['count'],
+                'p50': quantiles['0.5'],
+                'p95': quantiles['0.95'],
+                'p99': quantiles['0.99'],
+            })
+    if rows:
+        st.dataframe(rows, use_container_width=True)
+    else:
+        st.info("No plans generated in this process yet.")
+    
+    st.markdown("### 🔢 Counters")
+    counters = [
+        {'metric': name, 'labels': ", ".join(f"{k}={v}" for k, v in entry['labels'].items()), 'value': entry['value']}
+        for name, series in sorted(metrics['counters'].items())
+        for entry in series
+    ]
+    if counters:
+        st.dataframe(counters, use_container_width=True)
+    
+    st.markdown("### 🧭 Model Routing")
+    suggestions = suggest_routes()
+    if suggestions:
+        st.caption("Smallest max_tokens tier covering each task's p95 output, from crewai.json `routing.tiers`.")
+        st.dataframe(suggestions, use_container_width=True)
+    else:
+        st.caption("No LLM calls recorded yet.")
+    
+    st.markdown("### 📦 Caches, Pool and Jobs")
+    st.json(metrics['gauges'])
+    
+    with st.expander("Prometheus exposition"):
+        st.code(registry.to_prometheus(), language="text")
+    
+    st.download_button(
+        label="📥 Download Metrics (JSON)",
+        data=registry.to_json(),
+        file_name="newgroq_metrics.json",
+        mime="application/json",
+    )
     
-    # Try to split by common patterns
-    if '# Skill Gap Analysis' in result_text or '## Skill Gap' in result_text:
-        parts = re.split(r'#+ ?(Skill Gap|Learning Path|Action Plan)', result_text, flags=re.IGNORECASE)
-        if len(parts) > 1:
-            for i in range(1, len(parts), 2):
-                section_name = parts[i].lower().replace(' ', '_')
-                content = parts[i+1] if i+1 < len(parts) else ''
-                if 'skill' in section_name:
-                    sections['skill_gap'] = content.strip()
-                elif 'learning' in section_name:
-                    sections['learning_path'] = content.strip()
-                elif 'action' in section_name:
-                    sections['action_plan'] = content.strip()
-    
-    # If parsing failed, use the full output for all sections
-    if not any([sections['skill_gap'], sections['learning_path'], sections['action_plan']]):
-        sections['skill_gap'] = result_text
-        sections['learning_path'] = result_text
-        sections['action_plan'] = result_text
-    
-    return sections
+    st.markdown("### 🔎 Plan History")
+    plan_history_search()
 
 def display_metrics(inputs):
     """Display key metrics in a nice format"""
@@ -180,6 +441,19 @@ def display_metrics(inputs):
 st.markdown('<div class="main-header">🚀 Career Accelerator AI</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">Powered by CrewAI | Your Personalized Career Development Platform</div>', unsafe_allow_html=True)
 
+def admin_authorized(token):
+    """The admin page lists every user's plans, so it stays off unless NEWGROQ_ADMIN_TOKEN is set"""
+    expected = os.environ.get("NEWGROQ_ADMIN_TOKEN", "")
+    return bool(expected) and hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8"))
+
+admin_token = st.query_params.get("admin")
+if admin_token is not None:
+    if not admin_authorized(admin_token):
+        st.error("⛔ The admin page needs a valid token.")
+        st.stop()
+    render_admin_page()
+    st.stop()
+
 # Sidebar for inputs
 with st.sidebar:
     st.image("https://cdn-icons-png.flaticon.com/512/3135/3135715.png", width=100)
@@ -252,6 +526,7 @@ with st.sidebar:
     
     # Reset button
     if st.button("🔄 Reset Form", use_container_width=True):
+        st.session_state.pop('plan_job', None)
         st.rerun()
     
     st.markdown("---")
@@ -265,8 +540,32 @@ with st.sidebar:
     Powered by **CrewAI** agents working together to analyze your profile and create a personalized development roadmap.
     """)
 
+# Submit generation as a background job so reruns never restart or cancel it
+if generate_button:
+    # Validate inputs
+    if not all([career_goal, industry, current_skills, experience_level, education]):
+        st.error("⚠️ Please fill in all required fields in the sidebar!")
+        st.stop()
+    
+    # Prepare inputs
+    inputs = {
+        'career_goal': career_goal,
+        'industry': industry,
+        'current_skills': current_skills,
+        'experience_level': experience_level,
+        'education': education,
+        'time_commitment': str(time_commitment)
+    }
+    
+    previous_job = st.session_state.get('plan_job')
+    if previous_job:
+        get_job_manager().cancel(previous_job['id'])
+    st.session_state['plan_job'] = {'id': get_job_manager().submit(inputs, user_id=current_user_id()), 'inputs': inputs}
+
+plan_job = st.session_state.get('plan_job')
+
 # Main content area
-if not generate_button:
+if plan_job is None:
     # Welcome screen
     st.markdown("## 👋 Welcome to Your Career Accelerator")
     
@@ -410,22 +709,15 @@ if not generate_button:
         - Update your plan
         - Celebrate wins
         """)
+    
+    st.markdown("---")
+    
+    with st.expander("🔎 Search Your Past Plans"):
+        plan_history_search(current_user_id())
 
 else:
-    # Validate inputs
-    if not all([career_goal, industry, current_skills, experience_level, education]):
-        st.error("⚠️ Please fill in all required fields in the sidebar!")
-        st.stop()
-    
-    # Prepare inputs
-    inputs = {
-        'career_goal': career_goal,
-        'industry': industry,
-        'current_skills': current_skills,
-        'experience_level': experience_level,
-        'education': education,
-        'time_commitment': str(time_commitment)
-    }
+    inputs = plan_job['inputs']
+    job = get_job_manager().get(plan_job['id'])
     
     # Display user inputs summary
     st.markdown("## 📝 Your Profile Summary")
@@ -436,48 +728,53 @@ else:
     # Progress tracking with agent status
     st.markdown("## 🤖 AI Agents at Work")
     
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    agent_status_container = st.container()
+    if job is None:
+        st.warning("⌛ This plan is no longer available. Please generate it again.")
+        st.session_state.pop('plan_job', None)
+        st.stop()
+    
+    if not job.finished:
+        job_progress_panel(job.id)
+        st.stop()
     
     try:
-        # Initialize the crew
-        with agent_status_container:
-            st.markdown('<div class="agent-status">🔧 Initializing AI agents...</div>', unsafe_allow_html=True)
-        progress_bar.progress(10)
-        
-        crew = Newgroq().crew()
-        
-        with agent_status_container:
-            st.markdown('<div class="agent-status">👤 Agent 1: Senior Career Development Analyst - Analyzing skill gaps...</div>', unsafe_allow_html=True)
-        progress_bar.progress(30)
-        
-        # Add a spinner for the actual crew execution
-        with st.spinner("🔄 AI agents are collaborating on your career plan..."):
-            # Run the crew
-            result = crew.kickoff(inputs=inputs)
-        
-        with agent_status_container:
-            st.markdown('<div class="agent-status">👤 Agent 2: Educational Curriculum Architect - Designing learning path...</div>', unsafe_allow_html=True)
-        progress_bar.progress(60)
-        
-        with agent_status_container:
-            st.markdown('<div class="agent-status">👤 Agent 3: Executive Performance Coach - Creating action plan...</div>', unsafe_allow_html=True)
-        progress_bar.progress(90)
-        
-        progress_bar.progress(100)
-        
-        with agent_status_container:
-            st.markdown('<div class="agent-status">✅ All agents completed their analysis!</div>', unsafe_allow_html=True)
-        
-        # Display success message
-        st.balloons()
+        if job.error is not None:
+            raise job.error
+        
+        # Repeated profiles are served from the result cache
+        plan = job.result
+        
+        st.progress(100)
+        for task_name in TASK_SECTIONS:
+            st.markdown(f'<div class="agent-status">✅ {AGENT_LABELS[task_name]} - done</div>', unsafe_allow_html=True)
+        if plan.get('warehouse'):
+            generated = datetime.fromtimestamp(plan['warehouse']['generated_at']).strftime('%B %d, %Y')
+            st.markdown(f'<div class="agent-status">⚡ Loaded a ready-made plan for this profile (prepared {generated})</div>', unsafe_allow_html=True)
+        elif plan['cached']:
+            st.markdown('<div class="agent-status">⚡ Loaded a previously generated plan for this profile</div>', unsafe_allow_html=True)
+        elif plan.get('coalesced'):
+            st.markdown('<div class="agent-status">⚡ Shared a plan that was already being generated for this profile</div>', unsafe_allow_html=True)
+        st.markdown('<div class="agent-status">✅ All agents completed their analysis!</div>', unsafe_allow_html=True)
+        
+        # Display success message once per plan, not on every rerun
+        if st.session_state.get('celebrated_job') != job.id:
+            st.balloons()
+            st.session_state['celebrated_job'] = job.id
         st.markdown('<div class="success-box">🎉 <strong>Success!</strong> Your personalized career development plan is ready!</div>', unsafe_allow_html=True)
         
+        timings = plan.get('timings')
+        if timings and not plan['cached']:
+            st.caption(
+                f"⏱️ {timings['schedule'].title()} run: {timings.get('wall_seconds', 0.0):.1f}s measured "
+                f"vs {timings['sequential_seconds']:.1f}s one task after another "
+                f"(critical path {timings['critical_path_seconds']:.1f}s)"
+            )
+        
         st.markdown("---")
         
-        # Parse results
-        sections = parse_crew_output(result)
+        career_plan = CareerPlan.from_payload(plan)
+        # Saved progress, resources and feedback follow the profile, not the job
+        plan_id = cache_key(inputs)
         
         # Display the complete output in tabs for better organization
         st.markdown("## 📊 Your Personalized Career Development Plan")
@@ -491,127 +788,45 @@ else:
         
         with tab1:
             st.markdown("### 🎯 Skills You Need to Develop")
-            st.markdown(sections['skill_gap'] if sections['skill_gap'] else sections['full_output'])
+            st.markdown(career_plan.skill_gap or "_This section was not generated._")
             st.markdown("---")
             st.info("💡 **Tip**: Focus on high-priority skills first. Consider your strengths and how quickly you can develop each skill.")
             
             # Add a checklist feature
             with st.expander("✅ Create Your Skill Development Checklist"):
-                st.markdown("Track your progress on key skills:")
-                st.checkbox("Technical Skill 1")
-                st.checkbox("Technical Skill 2")
-                st.checkbox("Technical Skill 3")
-                st.checkbox("Soft Skill 1")
-                st.checkbox("Soft Skill 2")
+                skill_checklist(job.id)
         
         with tab2:
             st.markdown("### 📚 Your Personalized Learning Roadmap")
-            st.markdown(sections['learning_path'] if sections['learning_path'] else sections['full_output'])
+            st.markdown(career_plan.learning_path or "_This section was not generated._")
             st.markdown("---")
             st.info("💡 **Tip**: Bookmark recommended courses now. Set up a dedicated learning schedule in your calendar.")
             
             # Add resource tracking
             with st.expander("📚 Resource Organizer"):
-                st.markdown("Keep track of your learning resources:")
-                course_name = st.text_input("Course/Resource Name")
-                course_url = st.text_input("URL")
-                if st.button("Save Resource"):
-                    st.success(f"✅ Saved: {course_name}")
+                resource_organizer(plan_id)
         
         with tab3:
             st.markdown("### ✅ Your Daily Tasks and Milestones")
-            st.markdown(sections['action_plan'] if sections['action_plan'] else sections['full_output'])
+            st.markdown(career_plan.action_plan or "_This section was not generated._")
             st.markdown("---")
             st.info("💡 **Tip**: Set daily reminders for your tasks. Review progress every Sunday.")
             
             # Add progress tracker
             with st.expander("📊 Progress Tracker"):
-                week = st.selectbox("Select Week", ["Week 1", "Week 2", "Week 3", "Week 4"])
-                progress = st.slider(f"Progress for {week}", 0, 100, 0)
-                st.progress(progress / 100)
-                notes = st.text_area("Notes/Reflections")
-                if st.button("Save Progress"):
-                    st.success(f"✅ Progress saved for {week}!")
+                progress_tracker(plan_id)
         
         with tab4:
             st.markdown("### 📄 Complete Detailed Report")
-            st.markdown(sections['full_output'])
+            st.markdown(career_plan.full_report())
         
         # Download section
         st.markdown("---")
         st.markdown("## 💾 Save Your Plan")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Create downloadable content
-            download_content = f"""# Career Development Plan
-Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M")}
-
-## 📋 Profile Summary
-- **Career Goal**: {career_goal}
-- **Industry**: {industry}
-- **Experience Level**: {experience_level}
-- **Education**: {education}
-- **Current Skills**: {current_skills}
-- **Time Commitment**: {time_commitment} hours/week
-
----
-
-## 🎯 Skill Gap Analysis
-{sections['skill_gap'] if sections['skill_gap'] else 'See complete report below'}
-
----
-
-## 🛤️ Learning Path Design
-{sections['learning_path'] if sections['learning_path'] else 'See complete report below'}
-
----
-
-## 📅 30-Day Action Plan
-{sections['action_plan'] if sections['action_plan'] else 'See complete report below'}
-
----
-
-## 📄 Complete Analysis
-{sections['full_output']}
-
----
-
-*Generated by Career Accelerator AI - Powered by CrewAI*
-"""
-            
-            st.download_button(
-                label="📥 Download Complete Plan (Markdown)",
-                data=download_content,
-                file_name=f"career_plan_{datetime.now().strftime('%Y%m%d_%H%M')}.md",
-                mime="text/markdown",
-                use_container_width=True
-            )
-        
-        with col2:
-            # Create a simplified version
-            simplified_content = f"""Career Plan Summary - {datetime.now().strftime("%Y-%m-%d")}
-
-Goal: {career_goal} in {industry}
-
-Quick Action Items:
-1. Review skill gaps daily
-2. Enroll in recommended courses
-3. Complete Week 1 tasks
-4. Build first project
-5. Update resume and LinkedIn
-
-Time Commitment: {time_commitment} hrs/week
-"""
-            
-            st.download_button(
-                label="📥 Download Quick Reference (TXT)",
-                data=simplified_content,
-                file_name=f"quick_reference_{datetime.now().strftime('%Y%m%d')}.txt",
-                mime="text/plain",
-                use_container_width=True
-            )
+        # Generation time comes from the job, so the export cache key is stable
+        generated_at = datetime.fromtimestamp(job.finished_at or job.created_at)
+        export_panel(job.id, inputs, career_plan, generated_at)
         
         # Next steps
         st.markdown("---")
@@ -658,18 +873,9 @@ Time Commitment: {time_commitment} hrs/week
         feedback_col1, feedback_col2, feedback_col3 = st.columns([1, 2, 1])
         
         with feedback_col2:
-            rating = st.select_slider(
-                "Rate your experience:",
-                options=["Poor", "Fair", "Good", "Very Good", "Excellent"],
-                value="Good"
-            )
-            feedback = st.text_area("Additional feedback (optional):")
-            if st.button("Submit Feedback", use_container_width=True):
-                st.success("Thank you for your feedback! 🙏")
+            feedback_form(plan_id)
         
     except Exception as e:
-        progress_bar.progress(0)
-        status_text.empty()
         st.error(f"❌ An error occurred while generating your plan")
         
         with st.expander("🔍 Error Details"):
@@ -698,6 +904,7 @@ Time Commitment: {time_commitment} hrs/week
             """)
         
         if st.button("🔄 Try Again"):
+            st.session_state.pop('plan_job', None)
             st.rerun()
 
 # Footer
@@ -712,3 +919,6 @@ st.markdown("""
     <p style="font-size: 0.8rem; color: #999;">© 2024 Career Accelerator AI</p>
 </div>
 """, unsafe_allow_html=True)
+
+# Warm the crewai stack only after the page has been sent
+start_crew_pool()
@@ -0,0 +1,58 @@
+"""Build time and query latency of the course catalog search index.
+
+Queries are every catalog skill crossed with each level (and no level).
+
+Usage: python benchmarks/bench_catalog.py [--rounds 20]
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from newgroq.catalog import CATALOG_PATH, CourseIndex, build_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="passes over the query set")
+    parser.add_argument("--limit", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        skills = sorted({skill for line in f if line.strip() for skill in json.loads(line)['skills']})
+    queries = [(skill, level) for skill in skills for level in (None, "beginner", "intermediate", "advanced")]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "course_index.bin"
+        start = time.perf_counter()
+        counts = build_index(CATALOG_PATH, path)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        index = CourseIndex(path)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        samples = []
+        for _ in range(args.rounds):
+            for skill, level in queries:
+                start = time.perf_counter()
+                index.search(skill, level, args.limit)
+                samples.append((time.perf_counter() - start) * 1000)
+        index.close()
+
+    samples.sort()
+    print(f"index: {counts['documents']} entries, {counts['terms']} terms, {counts['bytes']} bytes")
+    print(f"build {build_ms:.2f}ms, load {load_ms:.3f}ms")
+    print(
+        f"{len(samples)} queries: p50={statistics.median(samples):.4f}ms "
+        f"p95={samples[int(0.95 * len(samples))]:.4f}ms p99={samples[int(0.99 * len(samples))]:.4f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Tail latency of LLM calls with and without hedging, against the stub LLM.
+
+The stub answers after --latency-ms, but --spike-rate of its calls take an
+extra --spike-ms. The first pass runs unhedged and also seeds the p95
+response-time history the hedged pass takes its deadline from.
+
+Usage: python benchmarks/bench_hedge.py [--calls 200] [--spike-rate 0.05] [--spike-ms 2000]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+MESSAGES = [{"role": "user", "content": "Outline a 12 week plan to become an ML engineer."}]
+
+
+def _settings(path: Path, hedging: bool, args):
+    from newgroq.settings import load_settings
+
+    path.write_text(json.dumps({
+        "rate_limits": {"requests_per_minute": 1_000_000, "tokens_per_minute": 1_000_000_000},
+        "hedging": {
+            "enabled": hedging,
+            "min_samples": 20,
+            "min_deadline_seconds": 0.0,
+            "timeout_seconds": args.timeout,
+        },
+    }))
+    load_settings.cache_clear()
+
+
+def run(calls: int) -> dict:
+    from newgroq.llm import build_llm
+    from newgroq.metrics import registry
+
+    llm = build_llm("stub/hedge", max_tokens=300)
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        llm.call(MESSAGES)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    counters = registry.as_dict()['counters']
+
+    def total(name):
+        return sum(entry['value'] for entry in counters.get(name, []))
+
+    return {
+        'p50_ms': samples[len(samples) // 2],
+        'p95_ms': samples[min(len(samples) - 1, int(0.95 * len(samples)))],
+        'p99_ms': samples[min(len(samples) - 1, int(0.99 * len(samples)))],
+        'hedges': total("llm_hedges_total"),
+        'hedge_wins': total("llm_hedge_wins_total"),
+        'hedge_completion_tokens': total("llm_hedge_completion_tokens_total"),
+        'completion_tokens': total("llm_completion_tokens_total"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--spike-rate", type=float, default=0.05)
+    parser.add_argument("--spike-ms", type=float, default=2000.0)
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-call timeout_seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        settings = Path(workdir) / "crewai.json"
+        os.environ.update({
+            "NEWGROQ_SETTINGS": str(settings),
+            "CREWAI_DISABLE_TELEMETRY": "true",
+            "OTEL_SDK_DISABLED": "true",
+            "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+        })
+        import stub_llm
+
+        stub_llm.register(latency_ms=args.latency_ms, spike_rate=args.spike_rate, spike_ms=args.spike_ms)
+        previous = {}
+        for hedging in (False, True):
+            _settings(settings, hedging, args)
+            result = run(args.calls)
+            # Counters are cumulative, so report this pass's share
+            for key in ('hedges', 'hedge_wins', 'hedge_completion_tokens', 'completion_tokens'):
+                result[key], previous[key] = result[key] - previous.get(key, 0), result[key]
+            extra = result['hedge_completion_tokens'] / max(1, result['completion_tokens'])
+            print(
+                f"hedging={'on ' if hedging else 'off'} p50={result['p50_ms']:.0f}ms p95={result['p95_ms']:.0f}ms "
+                f"p99={result['p99_ms']:.0f}ms hedges={result['hedges']:.0f} wins={result['hedge_wins']:.0f} "
+                f"extra completion tokens={extra:.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
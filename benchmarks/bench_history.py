@@ -0,0 +1,78 @@
+"""Full-text plan history search latency over a large synthetic history.
+
+Usage: python benchmarks/bench_history.py [--plans 200000] [--queries 200]
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from newgroq.history import PlanHistory
+
+SKILLS = [
+    "Python", "SQL", "Kubernetes", "Docker", "Terraform", "AWS", "Azure", "GCP",
+    "PyTorch", "TensorFlow", "Spark", "Airflow", "Kafka", "React", "TypeScript",
+    "Go", "Rust", "Linux", "Ansible", "Prometheus", "Grafana", "Tableau", "Figma",
+]
+GOALS = [
+    ("DevOps Engineer", "DevOps"), ("Data Engineer", "Data Science"),
+    ("Machine Learning Engineer", "Technology/AI"), ("Cloud Architect", "Cloud Computing"),
+    ("Security Analyst", "Cybersecurity"), ("Product Manager", "Product Management"),
+    ("Frontend Engineer", "Software Development"),
+]
+QUERIES = [
+    "Kubernetes DevOps", "all plans recommending Terraform for Cloud", 'goal:"data engineer" airflow',
+    "pytorch", "kube*", "industry:Cybersecurity SIEM", "Grafana Prometheus monitoring",
+]
+
+
+def synthetic_records(count: int, rng: random.Random):
+    for _ in range(count):
+        goal, industry = rng.choice(GOALS)
+        skills = rng.sample(SKILLS, 4)
+        inputs = {'career_goal': goal, 'industry': industry, 'current_skills': ", ".join(skills[:2])}
+        plan = {'tasks': {
+            'skill_gap_analysis_task': f"Priority gaps: {skills[2]} and {skills[3]} for a {goal}.",
+            'learning_path_design_task': f"Take a {skills[2]} course, then build a {skills[3]} project.",
+            'action_plan_task': f"Day 1: set up {skills[2]}. Week 2: deploy with {skills[3]}. Weekly review.",
+        }}
+        yield inputs, plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plans", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        history = PlanHistory(Path(workdir) / "history.db")
+        start = time.perf_counter()
+        records = list(synthetic_records(args.plans, rng))
+        for offset in range(0, len(records), 10_000):
+            history.record_many(records[offset:offset + 10_000])
+        print(f"indexed {args.plans} plans in {time.perf_counter() - start:.1f}s")
+
+        samples = []
+        for i in range(args.queries):
+            query = QUERIES[i % len(QUERIES)]
+            page = rng.randint(1, 5)
+            begin = time.perf_counter()
+            history.search(query, page=page, per_page=20)
+            samples.append((time.perf_counter() - begin) * 1000)
+        samples.sort()
+        print(
+            f"search (page of 20): p50={statistics.median(samples):.2f}ms "
+            f"p95={samples[int(0.95 * len(samples))]:.2f}ms max={samples[-1]:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
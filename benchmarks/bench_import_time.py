@@ -0,0 +1,90 @@
+"""Import-time profile of the app's startup modules versus the crew stack.
+
+Runs each import in a fresh interpreter under ``python -X importtime`` and
+summarizes the log by top-level package. Fails if the modules app.py imports
+at startup pull in crewai or litellm, or take longer than --budget-ms.
+
+Usage: python benchmarks/bench_import_time.py [--top 15] [--budget-ms 300] [--output report.json]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# What app.py imports before the first page paint
+APP_STARTUP = "import newgroq.progress, newgroq.exports, newgroq.report, newgroq.metrics, newgroq.service"
+# What the first Generate click (or the background pre-warm) imports
+CREW_STACK = "import newgroq.crew, newgroq.memo"
+HEAVY_PACKAGES = ("crewai", "litellm")
+
+# "import time:      self [us] |  cumulative | imported package"
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)")
+
+
+def profile_import(statement: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"), CREWAI_DISABLE_TELEMETRY="true")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True, cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        last_line = (proc.stderr.strip().splitlines() or ["unknown error"])[-1]
+        return {'error': last_line}
+
+    packages, total_us = {}, 0
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+        # Top-level imports carry the whole cost of their subtree
+        if len(indent) == 1:
+            total_us += int(cumulative_us)
+    return {
+        'total_ms': total_us / 1000,
+        'modules': sum(1 for line in proc.stderr.splitlines() if _LINE_RE.match(line)),
+        'packages_ms': {name: us / 1000 for name, us in sorted(packages.items(), key=lambda kv: -kv[1])},
+    }
+
+
+def print_profile(name: str, profile: dict, top: int):
+    if 'error' in profile:
+        print(f"{name}: could not import ({profile['error']})")
+        return
+    print(f"{name}: {profile['total_ms']:.1f}ms across {profile['modules']} modules")
+    for package, ms in list(profile['packages_ms'].items())[:top]:
+        print(f"    {package:30} {ms:9.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="packages listed per profile")
+    parser.add_argument("--budget-ms", type=float, default=300.0, help="max app startup import time")
+    parser.add_argument("--output", type=Path, help="write the profiles as JSON here")
+    args = parser.parse_args()
+
+    report = {'app_startup': profile_import(APP_STARTUP), 'crew_stack': profile_import(CREW_STACK)}
+    for name, profile in report.items():
+        print_profile(name, profile, args.top)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    startup = report['app_startup']
+    if 'error' in startup:
+        sys.exit(f"FAIL: app startup imports failed: {startup['error']}")
+    heavy = [name for name in HEAVY_PACKAGES if name in startup['packages_ms']]
+    if heavy:
+        sys.exit(f"FAIL: app startup imports {', '.join(heavy)}")
+    if startup['total_ms'] > args.budget_ms:
+        sys.exit(f"FAIL: app startup imports took {startup['total_ms']:.1f}ms (budget {args.budget_ms}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Near-duplicate profile lookup latency with a large ProfileIndex.
+
+Queries are real near-duplicates of indexed profiles (one skill dropped,
+added or swapped), which should mostly hit, plus profiles differing only in
+weekly hours, experience or education, which must never hit.
+
+Usage: python benchmarks/bench_similarity.py [--profiles 100000] [--queries 2000]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from newgroq.similarity import ProfileIndex, profile_exact, profile_tokens
+
+SKILLS = [
+    "Python", "SQL", "Java", "Go", "Rust", "C++", "JavaScript", "TypeScript",
+    "React", "Docker", "Kubernetes", "Terraform", "AWS", "Azure", "GCP",
+    "Linux", "Bash", "Git", "CI/CD", "Jenkins", "Pandas", "NumPy", "Spark",
+    "Airflow", "Kafka", "TensorFlow", "PyTorch", "scikit-learn", "Statistics",
+    "Data analysis", "Data visualization", "Tableau", "Power BI", "Excel",
+    "Machine learning", "Deep learning", "NLP", "Computer vision", "MLOps",
+    "Networking", "Security", "Penetration testing", "SIEM", "Agile",
+    "Scrum", "Product strategy", "Roadmapping", "User research", "Figma",
+    "REST APIs", "GraphQL", "PostgreSQL", "MongoDB", "Redis", "Ansible",
+]
+GOALS = [
+    "Senior Machine Learning Engineer", "Data Scientist", "Data Engineer",
+    "DevOps Engineer", "Site Reliability Engineer", "Cloud Architect",
+    "Security Analyst", "Product Manager", "Backend Engineer",
+    "Frontend Engineer", "Full Stack Developer", "Analytics Engineer",
+]
+INDUSTRIES = [
+    "Technology/AI", "Data Science", "Software Development", "Cloud Computing",
+    "Cybersecurity", "Product Management", "DevOps",
+]
+EXPERIENCE = ["Entry level", "2 years as Junior Data Analyst", "5 years in software", "10+ years"]
+EDUCATION = ["Bachelor's in Computer Science", "Master's in Data Science", "Self-taught"]
+
+
+def random_profile(rng):
+    return {
+        'career_goal': rng.choice(GOALS),
+        'industry': rng.choice(INDUSTRIES),
+        'current_skills': ", ".join(rng.sample(SKILLS, rng.randint(5, 10))),
+        'experience_level': rng.choice(EXPERIENCE),
+        'education': rng.choice(EDUCATION),
+        'time_commitment': str(rng.choice(range(5, 45, 5))),
+    }
+
+
+def near_duplicate(profile, rng):
+    """Same profile with one skill dropped, added or swapped for another"""
+    skills = [s.strip() for s in profile['current_skills'].split(",")]
+    unused = [s for s in SKILLS if s not in skills]
+    edit = rng.choice(("drop", "add", "swap"))
+    if edit in ("drop", "swap"):
+        skills.remove(rng.choice(skills))
+    if edit in ("add", "swap"):
+        skills.append(rng.choice(unused))
+    rng.shuffle(skills)
+    return dict(profile, current_skills=", ".join(skills))
+
+
+def other_background(profile, rng):
+    """Same skills and goal, different hours, experience or education"""
+    field, values = rng.choice((
+        ('time_commitment', [str(h) for h in range(5, 45, 5)]),
+        ('experience_level', EXPERIENCE),
+        ('education', EDUCATION),
+    ))
+    return dict(profile, **{field: rng.choice([v for v in values if v != profile[field]])})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    index = ProfileIndex()
+    profiles = [random_profile(rng) for _ in range(args.profiles)]
+
+    start = time.perf_counter()
+    for i, profile in enumerate(profiles):
+        index.add_tokens(profile_tokens(profile), str(i), profile_exact(profile))
+    build_s = time.perf_counter() - start
+
+    timings = []
+    hits = false_hits = 0
+    for i in range(args.queries):
+        source = rng.choice(profiles)
+        near = i % 2 == 0
+        query = near_duplicate(source, rng) if near else other_background(source, rng)
+        start = time.perf_counter()
+        match = index.query(query)
+        timings.append(time.perf_counter() - start)
+        if match is not None:
+            if near:
+                hits += 1
+            elif profile_exact(profiles[int(match[0])]) != profile_exact(query):
+                false_hits += 1
+
+    timings.sort()
+    p50 = statistics.median(timings) * 1e3
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e3
+    print(f"profiles={len(index)} build={build_s:.2f}s")
+    near_queries = (args.queries + 1) // 2
+    print(f"queries={args.queries} near_duplicate_hit_rate={hits / near_queries:.1%} "
+          f"false_hits={false_hits} p50={p50:.3f}ms p99={p99:.3f}ms")
+    if false_hits:
+        sys.exit(f"FAIL: {false_hits} profiles with other hours, experience or education matched")
+    if p50 >= 1.0:
+        sys.exit(f"FAIL: median lookup {p50:.3f}ms is not sub-millisecond")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Write throughput of the SQLite user store under concurrent sessions.
+
+Each simulated session saves progress, resources and feedback from its own
+thread. Runs once with batching and once committing every row on its own
+(batch size 1) for comparison.
+
+Usage: python benchmarks/bench_store.py [--sessions 32] [--writes 500]
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from newgroq.store import UserStore
+
+
+def session(store: UserStore, user: int, writes: int):
+    user_id, plan_id = f"user-{user}", f"plan-{user % 7}"
+    for i in range(writes):
+        kind = i % 10
+        if kind < 8:
+            store.save_progress(user_id, plan_id, f"Week {i % 4 + 1}", i % 101, f"note {i}")
+        elif kind == 8:
+            store.add_resource(user_id, plan_id, f"Course {i}", f"https://example.com/{i}")
+        else:
+            store.add_feedback(user_id, plan_id, "Good", f"comment {i}")
+
+
+def run(path: Path, sessions: int, writes: int, batch_size: int) -> dict:
+    store = UserStore(path, batch_size=batch_size)
+    threads = [threading.Thread(target=session, args=(store, user, writes)) for user in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.flush(timeout=600)
+    elapsed = time.perf_counter() - start
+    stats = store.stats()
+    store.close()
+    total = sessions * writes
+    return {
+        'batch_size': batch_size,
+        'writes': total,
+        'seconds': elapsed,
+        'writes_per_second': total / elapsed,
+        'transactions': stats['batches'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--writes", type=int, default=500, help="writes per session")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for batch_size in (args.batch_size, 1):
+            result = run(Path(workdir) / f"store_{batch_size}.db", args.sessions, args.writes, batch_size)
+            print(
+                f"batch_size={result['batch_size']:<4} {result['writes']} writes in {result['seconds']:.2f}s "
+                f"= {result['writes_per_second']:,.0f} writes/s over {result['transactions']} transactions"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Latency of the deterministic skill gap diff against the skill taxonomy.
+
+Profiles are every taxonomy role name crossed with a few skill lists, with
+and without a seniority prefix.
+
+Usage: python benchmarks/bench_taxonomy.py [--rounds 200]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from newgroq.taxonomy import TAXONOMY_PATH, SkillTaxonomy
+
+SKILL_LISTS = [
+    "Python, Basic ML algorithms, Data analysis, SQL",
+    "Java, Spring Boot, REST APIs, MySQL, Git, Docker",
+    "Excel, Tableau, communication, stakeholder management",
+    "Linux, bash, AWS, Terraform, CI/CD, Kubernetes, Prometheus, on-call",
+    "",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200, help="passes over the profile set")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    taxonomy = SkillTaxonomy(TAXONOMY_PATH)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    profiles = [
+        {'career_goal': f"{prefix}{role['name']}", 'industry': "Technology/AI", 'current_skills': skills}
+        for role in taxonomy.roles.values()
+        for prefix in ("", "Senior ")
+        for skills in SKILL_LISTS
+    ]
+    samples = []
+    for _ in range(args.rounds):
+        for inputs in profiles:
+            start = time.perf_counter()
+            taxonomy.analyze(inputs)
+            samples.append((time.perf_counter() - start) * 1_000_000)
+
+    samples.sort()
+    print(f"taxonomy: {len(taxonomy.skills)} skills, {len(taxonomy.roles)} roles, load {load_ms:.2f}ms")
+    print(
+        f"{len(samples)} diffs: p50={statistics.median(samples):.1f}us "
+        f"p95={samples[int(0.95 * len(samples))]:.1f}us p99={samples[int(0.99 * len(samples))]:.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Deterministic fake LLM output shared by the stub provider and the stub server"""
+import hashlib
+import random
+
+WORDS = (
+    "python sql docker kubernetes mlops statistics pipelines testing cloud "
+    "architecture mentoring communication portfolio certification projects "
+    "deployment monitoring feature engineering deep learning review practice"
+).split()
+
+
+def _prompt_text(messages) -> str:
+    return "\n".join(str(m.get("content", "")) for m in messages or [])
+
+
+def fake_markdown(seed: str, tokens: int) -> str:
+    """Markdown of roughly ``tokens`` words, deterministic for a given seed"""
+    rng = random.Random(hashlib.sha256(seed.encode("utf-8")).hexdigest())
+    lines = ["## Summary"]
+    words = 0
+    section = 1
+    while words < tokens:
+        if words and words % 60 < 8:
+            lines.append(f"\n### Phase {section}")
+            section += 1
+        line = " ".join(rng.choice(WORDS) for _ in range(8))
+        lines.append(f"- {line.capitalize()}")
+        words += 8
+    return "\n".join(lines)
@@ -0,0 +1,208 @@
+"""Multi-session load test against the local stub chat-completions server.
+
+Starts stub_server.py in-process (or uses --base-url), points every agent at
+it and drives --requests plan generations, --users at a time, either
+directly through the service layer (--mode kickoff) or as headless Streamlit
+sessions of app.py clicking Generate (--mode app). Reports throughput,
+p50/p95/p99 latency and error rates. Runs entirely offline.
+
+Usage:
+    python benchmarks/load_test.py --users 16 --requests 64 --latency-ms 400 --error-rate 0.05
+    python benchmarks/load_test.py --mode app --users 8 --output load.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_server import add_backend_arguments, backend_from_args, base_url, serve
+
+GOALS = [
+    "Senior Machine Learning Engineer",
+    "Data Engineer",
+    "Cloud Solutions Architect",
+    "Security Analyst",
+    "Product Manager",
+    "Site Reliability Engineer",
+]
+INDUSTRIES = ["Technology/AI", "Data Science", "Cloud Computing", "Cybersecurity", "Product Management", "DevOps"]
+
+
+def profile(index: int, same: bool) -> Dict[str, str]:
+    """Default sidebar profile, varied per simulated user unless ``same``"""
+    slot = 0 if same else index
+    return {
+        'career_goal': GOALS[slot % len(GOALS)],
+        'industry': INDUSTRIES[(slot // len(GOALS)) % len(INDUSTRIES)],
+        'current_skills': "Python, Basic ML algorithms, Data analysis, SQL" + ("" if same else f", skill {index}"),
+        'experience_level': "2 years as Junior Data Analyst",
+        'education': "Bachelor's in Computer Science",
+        'time_commitment': str(5 + 5 * (slot % 8)),
+    }
+
+
+def _offline_environment(workdir: Path, args, url: str):
+    settings = workdir / "crewai.json"
+    settings.write_text(json.dumps({
+        "rate_limits": {"requests_per_minute": args.rpm, "tokens_per_minute": args.tpm, "max_retries": 5},
+    }))
+    os.environ.update({
+        "NEWGROQ_LLM_MODEL": args.model,
+        "NEWGROQ_LLM_BASE_URL": url,
+        "NEWGROQ_SETTINGS": str(settings),
+        "NEWGROQ_CACHE_DIR": str(workdir / "cache"),
+        "NEWGROQ_HISTORY_PATH": str(workdir / "history.db"),
+        "NEWGROQ_STORE_PATH": str(workdir / "user_data.db"),
+        "NEWGROQ_CREW_POOL_SIZE": str(args.users),
+        "NEWGROQ_JOB_WORKERS": str(args.users),
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "CREWAI_TRACING_ENABLED": "false",
+        "OTEL_SDK_DISABLED": "true",
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+        "OPENAI_API_KEY": "offline",
+        "GROQ_API_KEY": "offline",
+    })
+
+
+def kickoff_session(inputs: Dict[str, str], use_cache: bool, timeout: float):
+    from newgroq.service import generate_plan
+
+    generate_plan(inputs, use_cache=use_cache)
+
+
+def app_session(inputs: Dict[str, str], use_cache: bool, timeout: float):
+    """One headless browser session: fill the sidebar, click Generate, wait for the plan"""
+    from streamlit.testing.v1 import AppTest
+
+    from newgroq.service import get_job_manager
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+    at.secrets["GROQ_API_KEY"] = "offline"
+    at.run()
+    sidebar = at.sidebar
+    next(w for w in sidebar.text_input if "Career Goal" in w.label).set_value(inputs['career_goal'])
+    sidebar.selectbox[0].set_value(inputs['industry'])
+    sidebar.text_area[0].set_value(inputs['current_skills'])
+    sidebar.slider[0].set_value(int(inputs['time_commitment']))
+    next(b for b in sidebar.button if "Generate" in b.label).click()
+    at.run()
+    job = get_job_manager().wait(at.session_state['plan_job']['id'], timeout=timeout)
+    if job is None or not job.finished:
+        raise TimeoutError(f"Plan was not ready within {timeout}s")
+    if job.error is not None:
+        raise job.error
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def run(args) -> Dict[str, Any]:
+    session = app_session if args.mode == "app" else kickoff_session
+    latencies: List[float] = []
+    errors: Counter = Counter()
+    lock = threading.Lock()
+
+    def one(index: int):
+        inputs = profile(index, args.same_profile)
+        start = time.perf_counter()
+        try:
+            session(inputs, args.cache, args.timeout)
+        except Exception as e:
+            with lock:
+                errors[type(e).__name__] += 1
+        else:
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users, thread_name_prefix="load-user") as pool:
+        list(pool.map(one, range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    from newgroq.metrics import registry
+
+    counters = registry.as_dict()['counters']
+    latencies.sort()
+    failed = sum(errors.values())
+    return {
+        'mode': args.mode,
+        'users': args.users,
+        'requests': args.requests,
+        'succeeded': len(latencies),
+        'failed': failed,
+        'error_rate': failed / args.requests if args.requests else 0.0,
+        'errors': dict(errors),
+        'seconds': elapsed,
+        'plans_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'latency_seconds': {
+            'p50': percentile(latencies, 0.5),
+            'p95': percentile(latencies, 0.95),
+            'p99': percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else 0.0,
+        },
+        'coalesced': sum(
+            entry['value'] for entry in counters.get('plan_requests_total', [])
+            if entry['labels'].get('source') == 'coalesced'
+        ),
+        'llm_calls': sum(entry['value'] for entry in counters.get('llm_calls_total', [])),
+        'llm_retries': sum(entry['value'] for entry in counters.get('llm_retries_total', [])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=("kickoff", "app"), default="kickoff")
+    parser.add_argument("--users", type=int, default=8, help="concurrent sessions")
+    parser.add_argument("--requests", type=int, help="total plan generations (default: --users)")
+    parser.add_argument("--same-profile", action="store_true", help="every session submits the default profile")
+    parser.add_argument("--cache", action="store_true", help="let repeats hit the result cache")
+    parser.add_argument("--timeout", type=float, default=300.0, help="per-session limit in seconds")
+    parser.add_argument("--rpm", type=float, default=1_000_000, help="client-side requests per minute")
+    parser.add_argument("--tpm", type=float, default=1_000_000_000, help="client-side tokens per minute")
+    parser.add_argument("--model", default="openai/newgroq-stub")
+    parser.add_argument("--base-url", help="use an already running stub_server.py instead of starting one")
+    parser.add_argument("--output", type=Path, help="write the report JSON here")
+    parser.add_argument("--max-error-rate", type=float, default=0.0, help="exit non-zero above this error rate")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    args.requests = args.requests or args.users
+
+    backend = None
+    url = args.base_url
+    if url is None:
+        backend = backend_from_args(args)
+        url = base_url(serve(backend))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        _offline_environment(Path(workdir), args, url)
+        report = run(args)
+    if backend is not None:
+        report['server'] = backend.stats()
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n")
+    if report['error_rate'] > args.max_error_rate:
+        sys.exit(f"{report['failed']} of {report['requests']} plan generations failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Offline benchmark suite for the Newgroq pipeline.
+
+Runs entirely locally: every agent is pointed at the deterministic stub LLM in
+stub_llm.py, telemetry is disabled and caches live in a temp directory.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --no-baseline
+
+Results are compared against benchmarks/baseline.json (or --baseline): any
+benchmark whose median is more than --tolerance slower than the stored
+median exits non-zero, as does any benchmark the baseline has no entry for;
+refresh it with --save-baseline after an intended change.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+INPUTS = {
+    'career_goal': 'Senior Machine Learning Engineer',
+    'industry': 'Technology/AI',
+    'current_skills': 'Python, Basic ML algorithms, Data analysis, SQL',
+    'experience_level': '2 years as Junior Data Analyst',
+    'education': "Bachelor's in Computer Science",
+    'time_commitment': '15'
+}
+
+# Medians faster than this are too noisy to flag as regressions
+NOISE_FLOOR_MS = 0.05
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def _offline_environment(workdir: Path):
+    """Keep the run local: stub model, no telemetry, generous rate limits"""
+    settings = workdir / "crewai.json"
+    settings.write_text(json.dumps({
+        "rate_limits": {"requests_per_minute": 1_000_000, "tokens_per_minute": 1_000_000_000},
+    }))
+    os.environ.update({
+        "NEWGROQ_LLM_MODEL": "stub/benchmark",
+        "NEWGROQ_SETTINGS": str(settings),
+        "NEWGROQ_CACHE_DIR": str(workdir / "cache"),
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "CREWAI_TRACING_ENABLED": "false",
+        "OTEL_SDK_DISABLED": "true",
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+        "GROQ_API_KEY": os.environ.get("GROQ_API_KEY", "offline"),
+    })
+
+
+def measure(fn, iterations: int, warmup: int = 1):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'iterations': iterations,
+        'median_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(0.95 * len(samples)))],
+        'min_ms': samples[0],
+    }
+
+
+def run_suite(args) -> dict:
+    import stub_llm
+    from newgroq.crew import Newgroq
+
+    stub = stub_llm.register(latency_ms=args.latency_ms, tokens=args.tokens)
+    results = {}
+
+    results['newgroq_construct'] = measure(lambda: Newgroq(), args.iterations)
+    results['crew_build'] = measure(lambda: Newgroq().crew(), args.iterations)
+
+    crew_outputs = []
+    context_saved = []
+
+    def kickoff():
+        crew = Newgroq().crew()
+        crew_outputs.append(crew.kickoff(inputs=INPUTS))
+        context_saved.append(crew.context_tokens_saved)
+
+    results['crew_kickoff'] = measure(kickoff, args.kickoff_iterations)
+    results.update(measure_rendering(crew_outputs[-1], args.iterations))
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'latency_ms': args.latency_ms,
+            'tokens': args.tokens,
+            'llm_calls': stub.calls,
+            'context_tokens_saved_per_run': context_saved[-1],
+        },
+        'results': results,
+    }
+
+
+def measure_rendering(result, iterations: int) -> dict:
+    """Benchmarks of everything done with a finished CrewOutput"""
+    from newgroq.compact import compact_context
+    from newgroq.exports import EXPORTS, PlanDocument, export_cache
+    from newgroq.report import CareerPlan, build_markdown_report, build_quick_reference
+
+    results = {}
+    upstream = "\n\n----------\n\n".join(output.raw for output in result.tasks_output[:-1])
+    results['context_compaction'] = measure(lambda: compact_context(upstream), iterations)
+
+    results['plan_extract'] = measure(lambda: CareerPlan.from_crew_output(result), iterations)
+    plan = CareerPlan.from_crew_output(result)
+    results['full_report_view'] = measure(plan.full_report, iterations)
+    generated_at = datetime(2024, 1, 1)
+
+    def assemble_downloads():
+        build_markdown_report(INPUTS, plan, generated_at)
+        build_quick_reference(INPUTS, generated_at)
+
+    results['download_assembly'] = measure(assemble_downloads, iterations)
+
+    def export_all_cold():
+        for fmt in EXPORTS:
+            EXPORTS[fmt].build(PlanDocument(INPUTS, plan, generated_at))
+
+    results['export_all_formats_cold'] = measure(export_all_cold, iterations)
+    results['export_cached'] = measure(
+        lambda: export_cache.render('html', INPUTS, plan, generated_at), iterations
+    )
+    return results
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Names of benchmarks slower than the baseline allows, or missing from it"""
+    regressions = []
+    meta = baseline.get('meta', {})
+    if (meta.get('python'), meta.get('machine')) != (platform.python_version(), platform.machine()):
+        print(f"note: baseline is from Python {meta.get('python')} on {meta.get('machine')}")
+    # An unbaselined benchmark would otherwise never be gated
+    for name in sorted(set(current['results']) - set(baseline.get('results', {}))):
+        print(f"{name:28} {'no baseline':>12} -> {current['results'][name]['median_ms']:10.3f}ms  MISSING")
+        regressions.append(name)
+    for name, base in baseline.get('results', {}).items():
+        now = current['results'].get(name)
+        if now is None:
+            continue
+        limit = base['median_ms'] * (1 + tolerance)
+        slower = now['median_ms'] > limit and now['median_ms'] - base['median_ms'] > NOISE_FLOOR_MS
+        status = "REGRESSION" if slower else "ok"
+        print(f"{name:28} {base['median_ms']:10.3f}ms -> {now['median_ms']:10.3f}ms  {status}")
+        if slower:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--kickoff-iterations", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="stub LLM latency per call")
+    parser.add_argument("--tokens", type=int, default=300, help="stub LLM output size in words")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="fail if slower than this results JSON")
+    parser.add_argument("--no-baseline", action="store_true", help="skip the regression check")
+    parser.add_argument("--save-baseline", type=Path, help="write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, e.g. 0.25 = 25%%")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        _offline_environment(Path(workdir))
+        current = run_suite(args)
+
+    text = json.dumps(current, indent=2)
+    print(text)
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.write_text(text + "\n")
+
+    if not args.no_baseline and args.save_baseline is None:
+        if not args.baseline.exists():
+            sys.exit(f"No baseline at {args.baseline}; create one with --save-baseline or pass --no-baseline")
+        regressions = compare(current, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            sys.exit(
+                f"FAIL: {len(regressions)} benchmark(s) regressed or have no baseline: {', '.join(regressions)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
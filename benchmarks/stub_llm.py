@@ -0,0 +1,101 @@
+"""Deterministic offline stand-in for Groq, registered as a litellm custom provider.
+
+Responses are generated from a hash of the prompt, so the same prompt always
+gets the same markdown, with configurable latency and output size. A
+``spike_rate`` fraction of calls takes an extra ``spike_ms``, to exercise
+tail-latency handling. Use the model name ``stub/<anything>`` once
+``register()`` has been called.
+"""
+import random
+import time
+from typing import Iterator
+
+import litellm
+from litellm import CustomLLM
+from litellm.types.utils import Choices, GenericStreamingChunk, Message, ModelResponse, Usage
+
+from fake_output import _prompt_text, fake_markdown
+
+
+class StubLLM(CustomLLM):
+    """litellm provider answering in CrewAI's ReAct format after a fixed delay"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        tokens: int = 300,
+        tokens_per_second: float = 0.0,
+        spike_rate: float = 0.0,
+        spike_ms: float = 0.0,
+        seed: int = 0,
+    ):
+        super().__init__()
+        self.latency_ms = latency_ms
+        self.tokens = tokens
+        self.tokens_per_second = tokens_per_second
+        self.spike_rate = spike_rate
+        self.spike_ms = spike_ms
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.spikes = 0
+
+    def _delay(self):
+        delay = self.latency_ms
+        if self.spike_rate and self._rng.random() < self.spike_rate:
+            self.spikes += 1
+            delay += self.spike_ms
+        time.sleep(delay / 1000)
+
+    def _answer(self, messages) -> str:
+        self.calls += 1
+        body = fake_markdown(_prompt_text(messages), self.tokens)
+        return f"Thought: I now can give a great answer\nFinal Answer: {body}"
+
+    def completion(self, *args, **kwargs) -> ModelResponse:
+        messages = kwargs.get("messages")
+        self._delay()
+        text = self._answer(messages)
+        if self.tokens_per_second:
+            time.sleep(len(text.split()) / self.tokens_per_second)
+        prompt_tokens = len(_prompt_text(messages)) // 4
+        completion_tokens = len(text) // 4
+        return ModelResponse(
+            model=kwargs.get("model", "stub"),
+            choices=[Choices(index=0, finish_reason="stop", message=Message(role="assistant", content=text))],
+            usage=Usage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+    def streaming(self, *args, **kwargs) -> Iterator[GenericStreamingChunk]:
+        self._delay()
+        words = self._answer(kwargs.get("messages")).split(" ")
+        for index, word in enumerate(words):
+            if self.tokens_per_second:
+                time.sleep(1 / self.tokens_per_second)
+            last = index == len(words) - 1
+            yield {
+                "text": word if last else word + " ",
+                "is_finished": last,
+                "finish_reason": "stop" if last else "",
+                "index": 0,
+                "tool_use": None,
+                "usage": None,
+            }
+
+
+def register(
+    latency_ms: float = 0.0,
+    tokens: int = 300,
+    tokens_per_second: float = 0.0,
+    spike_rate: float = 0.0,
+    spike_ms: float = 0.0,
+) -> StubLLM:
+    """Install the stub as litellm's ``stub`` provider and return it"""
+    handler = StubLLM(latency_ms, tokens, tokens_per_second, spike_rate, spike_ms)
+    litellm.custom_provider_map = [
+        entry for entry in litellm.custom_provider_map if entry.get("provider") != "stub"
+    ] + [{"provider": "stub", "custom_handler": handler}]
+    return handler
@@ -0,0 +1,259 @@
+"""Local OpenAI-compatible chat-completions server standing in for Groq.
+
+Speaks the ``/v1/chat/completions`` protocol litellm uses, with and without
+``stream``. Answers come from a script of ``{"match": ..., "response": ...}``
+rules (first rule whose ``match`` occurs in the prompt wins), else from the
+deterministic markdown generator in fake_output.py, always in CrewAI's ReAct
+format. Latency, latency spikes, streaming token rate and 429s are
+injectable; ``GET /stats`` reports what the server has done.
+
+Usage:
+    python benchmarks/stub_server.py --port 8765 --latency-ms 300 --error-rate 0.05
+    NEWGROQ_LLM_MODEL=openai/newgroq-stub NEWGROQ_LLM_BASE_URL=http://127.0.0.1:8765/v1 \\
+        OPENAI_API_KEY=offline crewai run
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_output import _prompt_text, fake_markdown
+
+
+class StubBackend:
+    """Response script and injected faults shared by every request"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        tokens: int = 300,
+        tokens_per_second: float = 0.0,
+        spike_rate: float = 0.0,
+        spike_ms: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 1.0,
+        script: Optional[List[Dict[str, str]]] = None,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.tokens = tokens
+        self.tokens_per_second = tokens_per_second
+        self.spike_rate = spike_rate
+        self.spike_ms = spike_ms
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.script = script or []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {'requests': 0, 'completions': 0, 'streams': 0, 'rate_limited': 0, 'spikes': 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counts[name] += 1
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return bool(rate) and self._rng.random() < rate
+
+    def rate_limited(self) -> bool:
+        self._count('requests')
+        if self._roll(self.error_rate):
+            self._count('rate_limited')
+            return True
+        return False
+
+    def delay(self):
+        delay = self.latency_ms
+        if self._roll(self.spike_rate):
+            self._count('spikes')
+            delay += self.spike_ms
+        time.sleep(delay / 1000)
+
+    def answer(self, messages) -> str:
+        prompt = _prompt_text(messages)
+        text = next((rule['response'] for rule in self.script if rule['match'] in prompt), None)
+        if text is None:
+            text = fake_markdown(prompt, self.tokens)
+        if "Final Answer:" in text:
+            return text
+        return f"Thought: I now can give a great answer\nFinal Answer: {text}"
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.counts)
+
+
+def _usage(messages, text: str) -> Dict[str, int]:
+    prompt_tokens = len(_prompt_text(messages)) // 4
+    completion_tokens = len(text) // 4
+    return {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    backend: StubBackend
+    protocol_version = "HTTP/1.1"
+
+    def _json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/stats", "/v1/stats"):
+            self._json(200, self.backend.stats())
+        elif self.path.rstrip("/") in ("/models", "/v1/models"):
+            self._json(200, {'object': 'list', 'data': [{'id': 'newgroq-stub', 'object': 'model'}]})
+        else:
+            self._json(404, {'error': {'message': f"No route for {self.path}"}})
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._json(404, {'error': {'message': f"No route for {self.path}"}})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        backend = self.backend
+        if backend.rate_limited():
+            # Same shape and wording as Groq, so retry_after_seconds() can parse it
+            message = (
+                "Rate limit reached for model `newgroq-stub` on tokens per minute (TPM). "
+                f"Please try again in {backend.retry_after}s."
+            )
+            self._json(
+                429,
+                {'error': {'message': message, 'type': 'tokens', 'code': 'rate_limit_exceeded'}},
+                {'retry-after': str(backend.retry_after)},
+            )
+            return
+        backend.delay()
+        messages = request.get('messages') or []
+        text = backend.answer(messages)
+        model = request.get('model', 'newgroq-stub')
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        if request.get('stream'):
+            backend._count('streams')
+            self._stream(completion_id, created, model, messages, text, request)
+            return
+        backend._count('completions')
+        self._json(200, {
+            'id': completion_id,
+            'object': 'chat.completion',
+            'created': created,
+            'model': model,
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': text},
+                'finish_reason': 'stop',
+            }],
+            'usage': _usage(messages, text),
+        })
+
+    def _stream(self, completion_id: str, created: int, model: str, messages, text: str, request):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def send(delta: Dict[str, Any], finish_reason: Optional[str] = None, usage=None):
+            chunk = {
+                'id': completion_id,
+                'object': 'chat.completion.chunk',
+                'created': created,
+                'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+            }
+            if usage is not None:
+                chunk['usage'] = usage
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        send({'role': 'assistant', 'content': ''})
+        words = text.split(" ")
+        for index, word in enumerate(words):
+            if self.backend.tokens_per_second:
+                time.sleep(1 / self.backend.tokens_per_second)
+            send({'content': word if index == len(words) - 1 else word + " "})
+        include_usage = (request.get('stream_options') or {}).get('include_usage')
+        send({}, 'stop', _usage(messages, text) if include_usage else None)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(backend: StubBackend, port: int = 0, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``backend`` on a daemon thread; port 0 picks a free port"""
+    handler = type("StubHandler", (_Handler,), {'backend': backend})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-llm-http", daemon=True).start()
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/v1"
+
+
+def add_backend_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay before every response")
+    parser.add_argument("--tokens", type=int, default=300, help="generated answer size in words")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="streaming rate, 0 = unthrottled")
+    parser.add_argument("--spike-rate", type=float, default=0.0, help="fraction of calls with an extra delay")
+    parser.add_argument("--spike-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered with a 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="seconds suggested by 429 responses")
+    parser.add_argument("--script", type=Path, help="JSON list of {match, response} rules")
+
+
+def backend_from_args(args) -> StubBackend:
+    return StubBackend(
+        latency_ms=args.latency_ms,
+        tokens=args.tokens,
+        tokens_per_second=args.tokens_per_second,
+        spike_rate=args.spike_rate,
+        spike_ms=args.spike_ms,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        script=json.loads(args.script.read_text()) if args.script else None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+
+    server = serve(backend_from_args(args), args.port, args.host)
+    print(f"Serving chat completions at {base_url(server)} (GET /stats for counters)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+from newgroq.cache import PROFILE_FIELDS, cache_key
+
+
+def profile_id(record: Dict[str, Any]) -> str:
+    """Record id, or a hash of its inputs when the file has no ``id`` field"""
+    return str(record.get('id') or cache_key(record))
+
+
+def read_profiles(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream profiles from a JSONL file, skipping blank lines"""
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})") from e
+
+
+def completed_ids(path: Path) -> Set[str]:
+    """Ids already written successfully to an output JSONL file"""
+    done = set()
+    if not path.exists():
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write can leave a truncated last line
+                continue
+            if record.get('status') == 'ok':
+                done.add(str(record['id']))
+    return done
+
+
+def truncate_partial_line(path: Path, chunk_size: int = 64 * 1024) -> int:
+    """Cut a crash-truncated last line off a JSONL file; returns the bytes removed.
+
+    Appending after such a line would glue the next record onto it.
+    """
+    if not path.exists():
+        return 0
+    with open(path, "rb+") as f:
+        size = f.seek(0, 2)
+        end = size
+        # Walk back from the end to the last newline
+        while end > 0:
+            start = max(0, end - chunk_size)
+            f.seek(start)
+            chunk = f.read(end - start)
+            if end == size and chunk.endswith(b"\n"):
+                return 0
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                end = start + newline + 1
+                break
+            end = start
+        f.truncate(end)
+    return size - end
+
+
+class BatchRunner:
+    """Generate plans for a JSONL file of profiles with bounded concurrency.
+
+    Profiles are streamed, at most ``concurrency`` are in flight at once, and
+    each result is appended to the output file as soon as it finishes. Ids
+    already recorded as ``ok`` in the output are skipped, so an interrupted
+    batch can be resumed by re-running the same command; a line cut short by
+    the interruption is dropped first.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[Dict[str, Any]], Dict[str, Any]],
+        concurrency: int = 4,
+        log: Optional[Callable[[str], None]] = print,
+    ):
+        self.generate = generate
+        self.concurrency = concurrency
+        self.log = log or (lambda message: None)
+        self._write_lock = threading.Lock()
+        self.counts = {'ok': 0, 'error': 0, 'skipped': 0}
+
+    def run(self, input_path: Path, output_path: Path) -> Dict[str, int]:
+        input_path, output_path = Path(input_path), Path(output_path)
+        done = completed_ids(output_path)
+        removed = truncate_partial_line(output_path)
+        if removed:
+            self.log(f"Dropped a partial last line ({removed} bytes) from {output_path}")
+        slots = threading.BoundedSemaphore(self.concurrency)
+
+        with open(output_path, "a", encoding="utf-8") as out, \
+                ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch") as executor:
+            for record in read_profiles(input_path):
+                record_id = profile_id(record)
+                if record_id in done:
+                    self.counts['skipped'] += 1
+                    continue
+                done.add(record_id)
+                slots.acquire()
+                future = executor.submit(self._process, record_id, record, out)
+                future.add_done_callback(lambda _: slots.release())
+        return dict(self.counts)
+
+    def _process(self, record_id: str, record: Dict[str, Any], out):
+        inputs = {field: str(record.get(field, "")) for field in PROFILE_FIELDS}
+        start = time.perf_counter()
+        try:
+            plan = self.generate(inputs)
+            result = {'id': record_id, 'status': 'ok', 'plan': plan}
+        except Exception as e:
+            result = {'id': record_id, 'status': 'error', 'error': str(e)}
+        result['elapsed_seconds'] = round(time.perf_counter() - start, 3)
+
+        with self._write_lock:
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            self.counts[result['status']] += 1
+        self.log(f"[{result['status']}] {record_id} ({result['elapsed_seconds']}s)")
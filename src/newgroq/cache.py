@@ -0,0 +1,198 @@
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Inputs that make up a career profile, in the order the tasks use them
+PROFILE_FIELDS = (
+    'career_goal',
+    'industry',
+    'current_skills',
+    'experience_level',
+    'education',
+    'time_commitment',
+)
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("NEWGROQ_CACHE_DIR", ".newgroq_cache"))
+
+
+def _normalize_text(value) -> str:
+    return re.sub(r"\s+", " ", str(value)).strip().lower()
+
+
+def normalize_skills(skills) -> str:
+    """Lowercase, dedupe and sort a comma-separated skills string"""
+    parts = {_normalize_text(s) for s in str(skills).split(",")}
+    return ", ".join(sorted(p for p in parts if p))
+
+
+def normalize_inputs(inputs: Dict[str, Any]) -> Dict[str, str]:
+    """Canonical form of the profile inputs used for cache keys"""
+    normalized = {}
+    for field in PROFILE_FIELDS:
+        value = inputs.get(field, "")
+        if field == 'current_skills':
+            normalized[field] = normalize_skills(value)
+        else:
+            normalized[field] = _normalize_text(value)
+    return normalized
+
+
+def cache_key(inputs: Dict[str, Any]) -> str:
+    """Stable hash of the normalized inputs"""
+    canonical = json.dumps(normalize_inputs(inputs), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """Hit/miss/eviction counters for a ResultCache"""
+
+    def __init__(self):
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stores = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'stores': self.stores,
+        }
+
+
+class ResultCache:
+    """Two-tier plan cache: in-process LRU with TTL in front of a JSON file store.
+
+    Entries are keyed by ``cache_key(inputs)``. The disk tier survives restarts
+    and is shared by every process pointed at the same directory. ``namespace``
+    selects the subdirectory, so other payloads (e.g. per-task outputs) can
+    reuse the same machinery without colliding with plans.
+
+    Plans are copied on the way in and out, so callers may modify what they
+    stored or got back without changing the cached entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        namespace: str = "plans",
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = Path(cache_dir) / namespace if cache_dir else None
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _remember(self, key: str, created_at: float, plan: Dict[str, Any]):
+        self._memory[key] = (created_at, plan)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def get(self, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self.get_by_key(cache_key(inputs))
+
+    def get_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, plan = entry
+                if not self._expired(created_at):
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return copy.deepcopy(plan)
+                del self._memory[key]
+                self.stats.expirations += 1
+
+        # File I/O and parsing outside the lock, so a disk read never stalls memory hits
+        record, expired = self._read(key)
+        with self._lock:
+            if expired:
+                self.stats.expirations += 1
+            if record is None:
+                self.stats.misses += 1
+                return None
+            # A set() that raced this read is newer than the file we read
+            if key not in self._memory:
+                self._remember(key, record['created_at'], record['plan'])
+            self.stats.disk_hits += 1
+        return copy.deepcopy(record['plan'])
+
+    def set(self, inputs: Dict[str, Any], plan: Dict[str, Any]) -> str:
+        key = cache_key(inputs)
+        self.set_by_key(key, plan, inputs=normalize_inputs(inputs))
+        return key
+
+    def set_by_key(self, key: str, plan: Dict[str, Any], inputs: Optional[Dict[str, Any]] = None):
+        created_at = time.time()
+        plan = copy.deepcopy(plan)
+        with self._lock:
+            self._remember(key, created_at, plan)
+            self.stats.stores += 1
+        record = {'created_at': created_at, 'plan': plan}
+        if inputs is not None:
+            record['inputs'] = inputs
+        self._write(key, record)
+
+    def _read(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """The record stored on disk for ``key``, and whether an expired one was removed"""
+        if not self.cache_dir:
+            return None, False
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None, False
+        if self._expired(record.get('created_at', 0)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None, True
+        return record, False
+
+    def _write(self, key: str, record: Dict[str, Any]):
+        if not self.cache_dir:
+            return
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = self.cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, self._path(key))
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
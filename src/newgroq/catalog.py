@@ -0,0 +1,219 @@
+import bisect
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from newgroq.cache import DEFAULT_CACHE_DIR
+
+CATALOG_PATH = Path(__file__).resolve().parent / "data" / "courses.jsonl"
+DEFAULT_INDEX_PATH = Path(os.environ.get("NEWGROQ_COURSE_INDEX_PATH", DEFAULT_CACHE_DIR / "course_index.bin"))
+
+MAGIC = b"NGCI"
+VERSION = 1
+# magic, version, documents, terms, average document length,
+# then byte offsets of the document, term and postings tables and the blobs
+_HEADER = struct.Struct("<4sHIIdQQQQQ")
+# record offset, record length, document length in tokens, level
+_DOC = struct.Struct("<QIHB")
+# term offset, term length, postings offset, document frequency
+_TERM = struct.Struct("<QHQI")
+# document id, weighted term frequency
+_POSTING = struct.Struct("<IH")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Matching a catalog entry's skills counts this many times more than its title
+SKILL_WEIGHT = 3
+
+LEVELS = ("all", "beginner", "intermediate", "advanced")
+_LEVEL_ALIASES = {
+    'entry': 'beginner', 'junior': 'beginner', 'basic': 'beginner', 'beginner': 'beginner', 'novice': 'beginner',
+    'intermediate': 'intermediate', 'mid': 'intermediate', 'medium': 'intermediate',
+    'advanced': 'advanced', 'senior': 'advanced', 'expert': 'advanced', 'lead': 'advanced',
+}
+_WORD_RE = re.compile(r"[a-z0-9+#/]+")
+_STOPWORDS = {"a", "an", "and", "or", "the", "of", "in", "for", "to", "with", "on", "your", "how", "i", "ii"}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words with a light plural strip, so "pipelines" finds "pipeline" """
+    tokens = []
+    for word in _WORD_RE.findall(str(text).lower()):
+        word = word.strip("/")
+        if not word or word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def normalize_level(level: Optional[str]) -> Optional[str]:
+    """Canonical catalog level for free text like "Senior" or "entry level", else None"""
+    for word in _WORD_RE.findall(str(level or "").lower()):
+        if word in _LEVEL_ALIASES:
+            return _LEVEL_ALIASES[word]
+    return None
+
+
+def _document_terms(entry: Dict[str, Any]) -> Counter:
+    terms = Counter(tokenize(entry['title']))
+    terms.update(tokenize(entry.get('provider', "")))
+    for skill in entry.get('skills', []):
+        for token in tokenize(skill):
+            terms[token] += SKILL_WEIGHT
+    return terms
+
+
+def build_index(catalog_path: Path = CATALOG_PATH, index_path: Path = DEFAULT_INDEX_PATH) -> Dict[str, int]:
+    """Build the BM25 inverted index for a JSONL catalog and write it atomically"""
+    with open(catalog_path, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+
+    records, lengths, postings = [], [], defaultdict(list)
+    for doc_id, entry in enumerate(entries):
+        terms = _document_terms(entry)
+        for term, count in terms.items():
+            postings[term].append((doc_id, min(count, 0xFFFF)))
+        lengths.append(min(sum(terms.values()), 0xFFFF))
+        records.append(json.dumps(entry, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+    terms = sorted(postings)
+    encoded_terms = [term.encode("utf-8") for term in terms]
+
+    doc_table = _HEADER.size
+    term_table = doc_table + _DOC.size * len(entries)
+    postings_table = term_table + _TERM.size * len(terms)
+    term_blob = postings_table + _POSTING.size * sum(len(p) for p in postings.values())
+    record_blob = term_blob + sum(len(t) for t in encoded_terms)
+    average = sum(lengths) / len(lengths) if lengths else 0.0
+
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(
+            MAGIC, VERSION, len(entries), len(terms), average,
+            doc_table, term_table, postings_table, term_blob, record_blob,
+        ))
+        offset = record_blob
+        for entry, record, length in zip(entries, records, lengths):
+            f.write(_DOC.pack(offset, len(record), length, LEVELS.index(entry.get('level', 'all'))))
+            offset += len(record)
+        term_offset, postings_offset = term_blob, postings_table
+        for term, encoded in zip(terms, encoded_terms):
+            f.write(_TERM.pack(term_offset, len(encoded), postings_offset, len(postings[term])))
+            term_offset += len(encoded)
+            postings_offset += _POSTING.size * len(postings[term])
+        for term in terms:
+            for posting in postings[term]:
+                f.write(_POSTING.pack(*posting))
+        for encoded in encoded_terms:
+            f.write(encoded)
+        for record in records:
+            f.write(record)
+    os.replace(tmp_path, index_path)
+    return {'documents': len(entries), 'terms': len(terms), 'bytes': index_path.stat().st_size}
+
+
+class CourseIndex:
+    """Read-only BM25 search over a memory-mapped course catalog index.
+
+    Only the sorted term list is materialized at load; postings, document
+    lengths and records are read straight from the mapping per query.
+    """
+
+    def __init__(self, index_path: Path = DEFAULT_INDEX_PATH):
+        self.path = Path(index_path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic, version, self.documents, self.term_count, self.average_length,
+            self._doc_table, self._term_table, _, _, _,
+        ) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} course index")
+        self._terms = [self._term(i) for i in range(self.term_count)]
+
+    def _term(self, index: int) -> str:
+        offset, length, _, _ = _TERM.unpack_from(self._map, self._term_table + index * _TERM.size)
+        return self._map[offset:offset + length].decode("utf-8")
+
+    def _postings(self, term: str) -> List[Tuple[int, int]]:
+        index = bisect.bisect_left(self._terms, term)
+        if index == len(self._terms) or self._terms[index] != term:
+            return []
+        _, _, offset, count = _TERM.unpack_from(self._map, self._term_table + index * _TERM.size)
+        return list(_POSTING.iter_unpack(self._map[offset:offset + count * _POSTING.size]))
+
+    def _doc(self, doc_id: int) -> Tuple[int, int, int, int]:
+        return _DOC.unpack_from(self._map, self._doc_table + doc_id * _DOC.size)
+
+    def record(self, doc_id: int) -> Dict[str, Any]:
+        offset, length, _, _ = self._doc(doc_id)
+        return json.loads(self._map[offset:offset + length])
+
+    def search(self, query: str, level: Optional[str] = None, limit: int = 5) -> List[Tuple[float, Dict[str, Any]]]:
+        """Best ``limit`` catalog entries for ``query`` by BM25, as (score, entry).
+
+        With a ``level``, only entries at that level or marked for all levels
+        are returned.
+        """
+        wanted = normalize_level(level)
+        allowed = None if wanted is None else {LEVELS.index('all'), LEVELS.index(wanted)}
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self._postings(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (self.documents - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings:
+                _, _, length, doc_level = self._doc(doc_id)
+                if allowed is not None and doc_level not in allowed:
+                    continue
+                norm = K1 * (1 - B + B * length / self.average_length)
+                scores[doc_id] += idf * tf * (K1 + 1) / (tf + norm)
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(score, self.record(doc_id)) for doc_id, score in best]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+_index: Optional[CourseIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_course_index() -> CourseIndex:
+    """Process-wide course index, built first if missing or older than the catalog"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            path = DEFAULT_INDEX_PATH
+            if not path.exists() or path.stat().st_mtime < CATALOG_PATH.stat().st_mtime:
+                build_index(CATALOG_PATH, path)
+            _index = CourseIndex(path)
+    return _index
+
+
+def format_results(results: List[Tuple[float, Dict[str, Any]]]) -> str:
+    """One compact line per entry, to keep the agent's context small"""
+    lines = []
+    for _, entry in results:
+        details = ", ".join(
+            part for part in (entry.get('provider'), entry.get('kind'), entry.get('level'),
+                              f"~{entry['hours']}h" if entry.get('hours') else "")
+            if part
+        )
+        url = f" {entry['url']}" if entry.get('url') else ""
+        lines.append(f"- {entry['title']} ({details}){url}")
+    return "\n".join(lines)
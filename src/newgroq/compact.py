@@ -0,0 +1,126 @@
+import re
+from typing import List, Optional, Tuple
+
+from newgroq.ratelimit import estimate_tokens
+
+# CrewAI joins upstream task outputs with this divider
+DIVIDER = "----------"
+# Longest skill / phase / resource name kept from one line
+MAX_TERM_CHARS = 80
+
+_HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.+?)\s*#*\s*$")
+_ITEM_RE = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+(.+)$")
+_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*|__([^_]+)__")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)|(https?://[^\s)>\]]+)")
+_PRIORITY_RE = re.compile(r"\b(critical|high|medium|low)\b(?:\s*priority)?|\bpriority\s*[:\-]?\s*(\w+)", re.IGNORECASE)
+_RESOURCE_RE = re.compile(
+    r"\b(courses?|certifications?|certificates?|books?|projects?|tutorials?|bootcamps?|"
+    r"coursera|udemy|edx|udacity|kaggle|aws|azure|gcp)\b",
+    re.IGNORECASE,
+)
+_TERM_END_RE = re.compile(r"\s*(?::|\s[-–—]\s|\(|;|\.\s|\.$)")
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-{3,}")
+
+
+def _unlink(text: str) -> str:
+    return _LINK_RE.sub(lambda m: m.group(1) or m.group(3), text)
+
+
+def _clean(text: str) -> str:
+    return re.sub(r"[*_`]+", "", _unlink(text)).strip()
+
+
+def _term(text: str) -> str:
+    """Name an item leads with: its bold text, else everything before the first separator"""
+    bold = _BOLD_RE.search(text)
+    term = (bold.group(1) or bold.group(2)) if bold else _TERM_END_RE.split(_unlink(text), 1)[0]
+    term = _clean(term)
+    return term[:MAX_TERM_CHARS].rstrip() if term else ""
+
+
+def _priority(text: str) -> str:
+    match = _PRIORITY_RE.search(text)
+    if not match:
+        return ""
+    return (match.group(1) or match.group(2) or "").capitalize()
+
+
+def _links(text: str) -> List[str]:
+    return [m.group(2) or m.group(3) for m in _LINK_RE.finditer(text)]
+
+
+def _essentials(text: str, lead: Optional[str] = None) -> str:
+    """One compact line for a list item or table row: name, priority and links"""
+    term = _term(text if lead is None else lead)
+    if not term:
+        return ""
+    priority = _priority(text)
+    if priority and priority.lower() not in term.lower():
+        term += f" [{priority}]"
+    links = _links(text)
+    if links:
+        term += " " + " ".join(links)
+    return term
+
+
+def compact_markdown(text: str) -> str:
+    """Structured essentials of a task's markdown output.
+
+    Keeps headings (phase titles), one line per list item or table row with
+    its leading skill/resource name, priority and links, and the dividers
+    between upstream outputs. Free-text paragraphs are dropped unless they
+    name a resource or priority, in which case only those parts survive.
+    """
+    lines: List[str] = []
+    header_row = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped == DIVIDER:
+            lines.append(DIVIDER)
+            continue
+        heading = _HEADING_RE.match(line)
+        if heading:
+            lines.append(f"{heading.group(1)} {_clean(heading.group(2))}")
+            continue
+        if stripped.startswith("|"):
+            if _TABLE_SEPARATOR_RE.match(stripped):
+                # The row above was the table's column headers
+                if header_row:
+                    lines.pop()
+                header_row = False
+                continue
+            cells = [cell for cell in (c.strip() for c in stripped.strip("|").split("|")) if cell]
+            row = _essentials(stripped, cells[0]) if cells else ""
+            header_row = bool(row)
+            if row:
+                lines.append(f"- {row}")
+            continue
+        header_row = False
+        item = _ITEM_RE.match(line)
+        if item:
+            essentials = _essentials(item.group(1))
+            if essentials:
+                lines.append(f"- {essentials}")
+            continue
+        if _RESOURCE_RE.search(stripped) or _PRIORITY_RE.search(stripped):
+            names = [_clean(bold or alt) for bold, alt in _BOLD_RE.findall(stripped)] + _links(stripped)
+            if names:
+                lines.append("- " + ", ".join(names))
+    return "\n".join(lines)
+
+
+def compact_context(context: str) -> Tuple[str, int]:
+    """Compacted upstream context for a downstream task and the tokens it saves.
+
+    Output with no recognisable structure is passed through unchanged, so a
+    task never loses its context to compaction.
+    """
+    compacted = compact_markdown(context)
+    if not compacted.strip(DIVIDER + "\n "):
+        return context, 0
+    saved = estimate_tokens(context) - estimate_tokens(compacted)
+    if saved <= 0:
+        return context, 0
+    return compacted, saved
@@ -1,15 +1,80 @@
 from crewai import Agent, Crew, Process, Task
-from crewai.project import CrewBase, agent, crew, task
+from crewai.project import CrewBase, agent, before_kickoff, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from pydantic import Field
 from typing import List
 import os
+import uuid
+
+from newgroq.compact import compact_context
+from newgroq.llm import build_llm
+from newgroq.metrics import registry
+from newgroq.routing import agent_tasks, task_route
+from newgroq.schedule import DAG, SEQUENTIAL, apply_dag_schedule, task_dependencies
+from newgroq.taxonomy import with_skill_gap_facts
+from newgroq.tools import CourseSearchTool
+
+class CompactingCrew(Crew):
+    """Crew that hands the tasks in ``compact_tasks`` only the essentials of their context.
+
+    ``context_tokens_saved`` accumulates the prompt tokens compaction removed
+    over the crew's lifetime.
+    """
+
+    compact_tasks: List[str] = Field(default_factory=list)
+    context_tokens_saved: int = 0
+
+    def _get_context(self, task, task_outputs):
+        context = super()._get_context(task, task_outputs)
+        if not context or task.name not in self.compact_tasks:
+            return context
+        compacted, saved = compact_context(context)
+        self.context_tokens_saved += saved
+        registry.inc("context_tokens_saved_total", saved, {'task': task.name})
+        return compacted
+
 
 @CrewBase
 class Newgroq():
-    """Newgroq crew with 3 tasks"""
+    """Newgroq crew with 3 tasks (4 in dag mode, where the action plan is drafted in parallel)"""
 
     agents: List[BaseAgent]
     tasks: List[Task]
+
+    # "dag" runs tasks by their depends_on keys in tasks.yaml, in parallel where possible
+    schedule: str = os.environ.get("NEWGROQ_SCHEDULE", SEQUENTIAL)
+    # Tasks marked compact_context in tasks.yaml get compacted upstream outputs; "0" disables
+    compact: bool = os.environ.get("NEWGROQ_COMPACT_CONTEXT", "1") != "0"
+
+    def _routed_llm(self, agent_name: str, task_name: str, **kwargs):
+        """LLM for an agent performing one task, with model and max_tokens routed from crewai.json"""
+        return build_llm(**task_route(task_name, self.agents_config[agent_name].get('llm')), **kwargs)
+
+    def _agent_llm(self, agent_name: str, **kwargs):
+        """LLM an agent is built with, routed for the last task tasks.yaml gives it"""
+        # CrewBase swaps the tasks' agent names for Agent objects while building,
+        # so capture the mapping the first time an agent is created
+        if not hasattr(self, '_agent_tasks'):
+            self._agent_tasks = agent_tasks(self.tasks_config)
+        return self._routed_llm(agent_name, self._agent_tasks.get(agent_name, agent_name), **kwargs)
+
+    def _task_agent(self, agent_name: str, task_name: str) -> Agent:
+        """The agent for one task, copied with that task's LLM when its route differs.
+
+        An agent serving several tasks (the action planner drafts and then
+        finalizes the plan) would otherwise run all of them on one route.
+        """
+        agent = getattr(self, agent_name)()
+        llm = self._routed_llm(agent_name, task_name, stream=agent.llm.stream)
+        if (llm.model, llm.max_tokens) == (agent.llm.model, agent.llm.max_tokens):
+            return agent
+        return agent.model_copy(update={'id': uuid.uuid4(), 'llm': llm})
+
+    @before_kickoff
+    def add_skill_gap_facts(self, inputs):
+        # The gap is diffed against the skill taxonomy so the analyzer only phrases it
+        return with_skill_gap_facts(inputs or {})
+
     # --------------------------
     # Agents
     # --------------------------
@@ -17,22 +82,28 @@ class Newgroq():
     def skill_gap_analyzer(self) -> Agent:
         return Agent(
             config=self.agents_config['skill_gap_analyzer'], 
+            llm=self._agent_llm('skill_gap_analyzer'),
             verbose=True,
             allow_delegation=False
         )
 
     @agent
     def learning_path_designer(self) -> Agent:
+        # Grounded catalog lookups replace courses recalled (and described) from model memory
         return Agent(
             config=self.agents_config['learning_path_designer'], 
+            llm=self._agent_llm('learning_path_designer'),
+            tools=[CourseSearchTool()],
             verbose=True,
             allow_delegation=False
         )
 
     @agent
     def action_planner(self) -> Agent:
+        # Stream the final task so its tokens can be shown while it generates
         return Agent(
             config=self.agents_config['action_planner'], 
+            llm=self._agent_llm('action_planner', stream=True),
             verbose=True,
             allow_delegation=False
         )
@@ -44,21 +115,28 @@ class Newgroq():
     def skill_gap_analysis_task(self) -> Task:
         return Task(
             config=self.tasks_config['skill_gap_analysis_task'], 
-            agent=self.skill_gap_analyzer(),
+            agent=self._task_agent('skill_gap_analyzer', 'skill_gap_analysis_task'),
         )
 
     @task
     def learning_path_design_task(self) -> Task:
         return Task(
             config=self.tasks_config['learning_path_design_task'], 
-            agent=self.learning_path_designer(),
+            agent=self._task_agent('learning_path_designer', 'learning_path_design_task'),
+        )
+
+    @task
+    def action_plan_draft_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['action_plan_draft_task'],
+            agent=self._task_agent('action_planner', 'action_plan_draft_task'),
         )
 
     @task
     def action_plan_task(self) -> Task:
         return Task(
             config=self.tasks_config['action_plan_task'], 
-            agent=self.action_planner(),
+            agent=self._task_agent('action_planner', 'action_plan_task'),
         )
 
     # --------------------------
@@ -67,9 +145,22 @@ class Newgroq():
     @crew
     def crew(self) -> Crew:
         """Creates the Career Accelerator crew"""
-        return Crew(
-            agents=self.agents,
-            tasks=self.tasks,
+        # dag_only tasks (the action plan draft) exist to run alongside another task
+        tasks = [
+            task for task in self.tasks
+            if self.schedule == DAG or not self.tasks_config[task.name].get('dag_only')
+        ]
+        if self.schedule == DAG:
+            apply_dag_schedule(tasks, task_dependencies(self.tasks_config))
+        compact_tasks = [
+            name for name, config in self.tasks_config.items() if config.get('compact_context')
+        ] if self.compact else []
+        # Token usage is summed over the crew's agents, so include per-task copies
+        agents = list({id(task.agent): task.agent for task in tasks}.values())
+        return CompactingCrew(
+            agents=agents,
+            tasks=tasks,
             process=Process.sequential,
             verbose=True,
+            compact_tasks=compact_tasks,
         )
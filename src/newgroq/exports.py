@@ -0,0 +1,295 @@
+import hashlib
+import html
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from newgroq.report import CareerPlan, build_markdown_report, build_quick_reference
+
+_DAY_RE = re.compile(r"^[#*\s\-]*Day\s+(\d+)(?:\s*[-–]\s*(\d+))?\s*\**\s*[:\-–]?\s*\**\s*(.*)$", re.IGNORECASE)
+_WEEK_RE = re.compile(r"^[#*\s\-]*Week\s+(\d+)\b\s*\**\s*[:\-–]?\s*\**\s*(.*)$", re.IGNORECASE)
+_BULLET_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(.*)$")
+
+
+@dataclass(frozen=True)
+class Export:
+    label: str
+    extension: str
+    mime: str
+    build: Callable[["PlanDocument"], str]
+
+
+class PlanDocument:
+    """One plan prepared for export; shared parsing is done once, lazily.
+
+    Every format reads from the same instance, so the action plan's
+    day/week breakdown is parsed at most once however many formats are
+    generated.
+    """
+
+    def __init__(self, inputs: Dict[str, str], plan: CareerPlan, generated_at: datetime):
+        self.inputs = inputs
+        self.plan = plan
+        self.generated_at = generated_at
+        self._schedule: Optional[List[Tuple[int, int, str]]] = None
+
+    def schedule(self) -> List[Tuple[int, int, str]]:
+        """(first day, last day, summary) entries parsed from the action plan"""
+        if self._schedule is None:
+            self._schedule = parse_schedule(self.plan.action_plan)
+        return self._schedule
+
+
+def _clean(text: str) -> str:
+    return re.sub(r"[*_`#]+", "", text).strip(" :-–")
+
+
+def parse_schedule(action_plan: str) -> List[Tuple[int, int, str]]:
+    """Day ranges from "Day 3: ..." lines, falling back to "Week N" headings.
+
+    A day or week line without text takes the bullets that follow it.
+    """
+    days: List[List] = []
+    weeks: List[List] = []
+    current: Optional[List] = None
+    for line in action_plan.splitlines():
+        day = _DAY_RE.match(line)
+        week = _WEEK_RE.match(line)
+        if day:
+            first = int(day.group(1))
+            last = int(day.group(2) or first)
+            current = [first, last, [_clean(day.group(3))] if _clean(day.group(3)) else []]
+            days.append(current)
+        elif week:
+            first = (int(week.group(1)) - 1) * 7 + 1
+            current = [first, first + 6, [_clean(week.group(2))] if _clean(week.group(2)) else []]
+            weeks.append(current)
+        elif current is not None:
+            bullet = _BULLET_RE.match(line)
+            if bullet and len(current[2]) < 3:
+                current[2].append(_clean(bullet.group(1)))
+
+    entries = days or weeks
+    return [
+        (first, min(last, 30), "; ".join(part for part in parts if part) or f"Day {first} tasks")
+        for first, last, parts in entries
+        if 1 <= first <= 30
+    ]
+
+
+def markdown_to_html(text: str) -> str:
+    """Small markdown subset (headings, lists, emphasis, links) to HTML"""
+    out = []
+    list_tag = None
+    paragraph: List[str] = []
+
+    def inline(value: str) -> str:
+        value = html.escape(value)
+        value = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", value)
+        value = re.sub(r"(?<!\*)\*(?!\s)(.+?)\*", r"<em>\1</em>", value)
+        value = re.sub(r"`(.+?)`", r"<code>\1</code>", value)
+        return re.sub(r"\[(.+?)\]\((https?://[^\s)]+)\)", r'<a href="\2">\1</a>', value)
+
+    def flush():
+        nonlocal list_tag
+        if paragraph:
+            out.append(f"<p>{inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        heading = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+        unordered = re.match(r"^[-*+]\s+(.*)$", stripped)
+        ordered = re.match(r"^\d+[.)]\s+(.*)$", stripped)
+        if not stripped or stripped == "---":
+            flush()
+            if stripped:
+                out.append("<hr>")
+        elif heading:
+            flush()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{inline(heading.group(2))}</h{level}>")
+        elif unordered or ordered:
+            tag = "ul" if unordered else "ol"
+            if paragraph or list_tag != tag:
+                flush()
+                out.append(f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{inline((unordered or ordered).group(1))}</li>")
+        else:
+            if list_tag:
+                flush()
+            paragraph.append(stripped)
+    flush()
+    return "\n".join(out)
+
+
+def build_markdown(document: PlanDocument) -> str:
+    return build_markdown_report(document.inputs, document.plan, document.generated_at)
+
+
+def build_text(document: PlanDocument) -> str:
+    return build_quick_reference(document.inputs, document.generated_at)
+
+
+def build_json(document: PlanDocument) -> str:
+    return json.dumps({
+        'generated_at': document.generated_at.isoformat(),
+        'profile': document.inputs,
+        'skill_gap': document.plan.skill_gap,
+        'learning_path': document.plan.learning_path,
+        'action_plan': document.plan.action_plan,
+        'schedule': [
+            {'first_day': first, 'last_day': last, 'summary': summary}
+            for first, last, summary in document.schedule()
+        ],
+    }, indent=2, ensure_ascii=False)
+
+
+def build_html(document: PlanDocument) -> str:
+    inputs = document.inputs
+    profile = "".join(
+        f"<li><strong>{html.escape(label)}:</strong> {html.escape(str(inputs[key]))}</li>"
+        for label, key in (
+            ("Career Goal", 'career_goal'),
+            ("Industry", 'industry'),
+            ("Experience Level", 'experience_level'),
+            ("Education", 'education'),
+            ("Current Skills", 'current_skills'),
+            ("Time Commitment (hrs/week)", 'time_commitment'),
+        )
+    )
+    sections = "".join(
+        f"<section><h2>{title}</h2>{markdown_to_html(text or 'Not available')}</section>"
+        for title, text in (
+            ("🎯 Skill Gap Analysis", document.plan.skill_gap),
+            ("🛤️ Learning Path Design", document.plan.learning_path),
+            ("📅 30-Day Action Plan", document.plan.action_plan),
+        )
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Career Development Plan - {html.escape(inputs['career_goal'])}</title>
+<style>
+body {{ font-family: -apple-system, Segoe UI, Roboto, sans-serif; max-width: 860px; margin: 2rem auto; padding: 0 1rem; color: #222; }}
+h1 {{ color: #667eea; }}
+h2 {{ color: #764ba2; border-bottom: 2px solid #667eea; padding-bottom: .3rem; }}
+section {{ margin-bottom: 2rem; }}
+</style>
+</head>
+<body>
+<h1>🚀 Career Development Plan</h1>
+<p>Generated on {document.generated_at.strftime("%Y-%m-%d %H:%M")}</p>
+<h2>📋 Profile Summary</h2>
+<ul>{profile}</ul>
+{sections}
+<footer><em>Generated by Career Accelerator AI - Powered by CrewAI</em></footer>
+</body>
+</html>
+"""
+
+
+def _ics_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_fold(line: str) -> List[str]:
+    """Split a content line into RFC 5545 75-octet folded lines"""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return [line]
+    parts, current = [], b""
+    for char in line:
+        encoded = char.encode("utf-8")
+        if len(current) + len(encoded) > (75 if not parts else 74):
+            parts.append(current.decode("utf-8"))
+            current = b""
+        current += encoded
+    parts.append(current.decode("utf-8"))
+    return [parts[0]] + [" " + part for part in parts[1:]]
+
+
+def build_ics(document: PlanDocument, start: Optional[date] = None) -> str:
+    """All-day calendar events for the 30-day plan, starting the next day"""
+    start = start or (document.generated_at.date() + timedelta(days=1))
+    # RFC 5545 requires DTSTAMP in UTC
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    uid_base = hashlib.sha1(document.plan.action_plan.encode("utf-8")).hexdigest()[:12]
+    entries = document.schedule() or [
+        ((week - 1) * 7 + 1, (week - 1) * 7 + 7, f"Week {week} checkpoint") for week in range(1, 5)
+    ]
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Career Accelerator AI//Newgroq//EN",
+        "CALSCALE:GREGORIAN",
+    ]
+    for first, last, summary in entries:
+        begin = start + timedelta(days=first - 1)
+        end = start + timedelta(days=last)
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid_base}-{first}-{last}@career-accelerator",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{begin.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{end.strftime('%Y%m%d')}",
+            f"SUMMARY:{_ics_escape(summary[:200])}",
+            f"DESCRIPTION:{_ics_escape(document.inputs['career_goal'] + ' - 30-day plan')}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(folded for line in lines for folded in _ics_fold(line)) + "\r\n"
+
+
+EXPORTS: Dict[str, Export] = {
+    'markdown': Export("Complete Plan (Markdown)", "md", "text/markdown", build_markdown),
+    'txt': Export("Quick Reference (TXT)", "txt", "text/plain", build_text),
+    'json': Export("Structured Data (JSON)", "json", "application/json", build_json),
+    'html': Export("Standalone Web Page (HTML)", "html", "text/html", build_html),
+    'ics': Export("30-Day Calendar (ICS)", "ics", "text/calendar", build_ics),
+}
+
+
+def result_hash(inputs: Dict[str, str], plan: CareerPlan, generated_at: datetime) -> str:
+    payload = json.dumps(
+        [inputs, plan.skill_gap, plan.learning_path, plan.action_plan, generated_at.isoformat()],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExportCache:
+    """Generated artifacts keyed by (result hash, format), built on first request"""
+
+    def __init__(self, max_documents: int = 128):
+        self.max_documents = max_documents
+        self._documents: "OrderedDict[str, Tuple[PlanDocument, Dict[str, bytes]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, fmt: str, inputs: Dict[str, str], plan: CareerPlan, generated_at: datetime) -> bytes:
+        key = result_hash(inputs, plan, generated_at)
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is None:
+                entry = (PlanDocument(dict(inputs), plan, generated_at), {})
+                self._documents[key] = entry
+                while len(self._documents) > self.max_documents:
+                    self._documents.popitem(last=False)
+            self._documents.move_to_end(key)
+            document, artifacts = entry
+            if fmt not in artifacts:
+                artifacts[fmt] = EXPORTS[fmt].build(document).encode("utf-8")
+            return artifacts[fmt]
+
+
+export_cache = ExportCache()
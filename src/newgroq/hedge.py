@@ -0,0 +1,129 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from newgroq.metrics import registry
+from newgroq.settings import load_settings
+
+T = TypeVar("T")
+
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-call")
+
+# Bound on one LLM call when crewai.json's hedging block sets no timeout_seconds;
+# without one a hung provider call holds its worker forever
+DEFAULT_TIMEOUT_SECONDS = 120.0
+
+
+class DeadlineExceeded(TimeoutError):
+    """No response (primary or hedge) arrived within the call's timeout"""
+
+
+class CallAbandoned(Exception):
+    """A primary or hedge request dropped before sending, as its call had already ended"""
+
+
+def hedge_settings(task_name: Optional[str] = None) -> Dict[str, Any]:
+    """The ``hedging`` block of crewai.json, with ``task_name``'s overrides applied"""
+    settings = dict(load_settings().get('hedging', {}))
+    overrides = settings.pop('tasks', {}).get(task_name, {})
+    settings.update(overrides)
+    return settings
+
+
+def hedge_deadline(metric: str, labels: Dict[str, Any], settings: Dict[str, Any]) -> Optional[float]:
+    """Seconds to wait before hedging a call, or None when hedging is off.
+
+    The deadline is the configured quantile (p95 by default) of ``metric``
+    for matching calls; until ``min_samples`` calls have been seen it falls
+    back to ``default_deadline_seconds``.
+    """
+    if not settings.get('enabled'):
+        return None
+    value, count = registry.quantile(metric, settings.get('quantile', 0.95), labels)
+    if count < settings.get('min_samples', 20):
+        return settings.get('default_deadline_seconds', 15.0)
+    return max(settings.get('min_deadline_seconds', 1.0), value)
+
+
+def _submit(fn: Callable[[], T]) -> Future:
+    # Run in a copy of the caller's context so event/tracing context carries over
+    return _executor.submit(contextvars.copy_context().run, fn)
+
+
+def hedged_call(
+    primary: Callable[[threading.Event, threading.Event], T],
+    hedge: Optional[Callable[[threading.Event], T]] = None,
+    deadline: Optional[float] = None,
+    timeout: Optional[float] = None,
+    producing: Optional[Callable[[], bool]] = None,
+    on_hedge: Optional[Callable[[], None]] = None,
+    on_loser: Optional[Callable[[Future], None]] = None,
+) -> Tuple[T, bool]:
+    """Run ``primary``; race ``hedge`` against it if it misses ``deadline``.
+
+    ``primary`` is called with two events: it sets the first once its
+    request is sent, and both ``deadline`` and ``timeout`` start counting
+    from then, so time spent queued on the rate limiter counts towards
+    neither. No hedge is fired while ``producing()`` reports the primary is
+    already streaming tokens. The first successful result wins; the other
+    call is cancelled if it has not started, otherwise abandoned and handed
+    to ``on_loser`` when it finishes.
+
+    The second event (the only argument to ``hedge``) is set once this call
+    returns or raises; requests still queued should then give up with
+    ``CallAbandoned`` instead of taking rate limit capacity and sending.
+
+    Returns the result and whether the hedge won.
+    """
+    sent = threading.Event()
+    abandoned = threading.Event()
+
+    def run_primary():
+        try:
+            return primary(sent, abandoned)
+        finally:
+            sent.set()
+
+    first = _submit(run_primary)
+    sent.wait()
+    limit = time.monotonic() + timeout if timeout else None
+
+    def remaining() -> Optional[float]:
+        return None if limit is None else max(0.0, limit - time.monotonic())
+
+    try:
+        wait_for = deadline if hedge is not None else None
+        if wait_for is not None and limit is not None:
+            wait_for = min(wait_for, remaining())
+        done, _ = wait([first], timeout=wait_for if wait_for is not None else remaining())
+        if not done and (hedge is None or (producing is not None and producing())):
+            done, _ = wait([first], timeout=remaining())
+        if done:
+            return first.result(), False
+        if limit is not None and remaining() <= 0:
+            raise DeadlineExceeded(f"LLM call did not finish within {timeout}s")
+
+        if on_hedge is not None:
+            on_hedge()
+        second = _submit(lambda: hedge(abandoned))
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        if not loser.cancel() and on_loser is not None:
+                            loser.add_done_callback(on_loser)
+                    return future.result(), future is second
+                error = error or future.exception()
+        if error is not None and not pending:
+            raise error
+        raise DeadlineExceeded(f"LLM call did not finish within {timeout}s")
+    finally:
+        # Anything still queued on the rate limiter gives up instead of sending
+        abandoned.set()
@@ -0,0 +1,257 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from newgroq.cache import DEFAULT_CACHE_DIR, cache_key
+from newgroq.report import CareerPlan
+
+DEFAULT_HISTORY_PATH = Path(os.environ.get("NEWGROQ_HISTORY_PATH", DEFAULT_CACHE_DIR / "history.db"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    profile_key TEXT NOT NULL,
+    career_goal TEXT NOT NULL,
+    industry TEXT NOT NULL,
+    current_skills TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    skill_gap TEXT NOT NULL,
+    learning_path TEXT NOT NULL,
+    action_plan TEXT NOT NULL,
+    timings TEXT,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    user_id TEXT
+);
+CREATE INDEX IF NOT EXISTS plans_profile ON plans (profile_key);
+CREATE INDEX IF NOT EXISTS plans_created ON plans (created_at);
+CREATE INDEX IF NOT EXISTS plans_user ON plans (user_id, id);
+CREATE VIRTUAL TABLE IF NOT EXISTS plans_fts USING fts5 (
+    career_goal, industry, current_skills, skill_gap, learning_path, action_plan,
+    content = 'plans', content_rowid = 'id', tokenize = 'porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS plans_fts_insert AFTER INSERT ON plans BEGIN
+    INSERT INTO plans_fts (rowid, career_goal, industry, current_skills, skill_gap, learning_path, action_plan)
+    VALUES (new.id, new.career_goal, new.industry, new.current_skills,
+            new.skill_gap, new.learning_path, new.action_plan);
+END;
+CREATE TRIGGER IF NOT EXISTS plans_fts_delete AFTER DELETE ON plans BEGIN
+    INSERT INTO plans_fts (plans_fts, rowid, career_goal, industry, current_skills, skill_gap, learning_path, action_plan)
+    VALUES ('delete', old.id, old.career_goal, old.industry, old.current_skills,
+            old.skill_gap, old.learning_path, old.action_plan);
+END;
+"""
+
+# Matches scored by relevance per search; older matches follow by recency
+RANK_WINDOW = 2000
+
+_INSERT = (
+    "INSERT INTO plans (created_at, profile_key, career_goal, industry, current_skills, inputs, "
+    "skill_gap, learning_path, action_plan, timings, prompt_tokens, completion_tokens, user_id) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Search syntax: words, "quoted phrases", prefix* and goal:/industry:/skills: filters
+_TERM_RE = re.compile(r'(?:(\w+):)?("[^"]+"|[^\s"]+)')
+_FIELDS = {'goal': 'career_goal', 'industry': 'industry', 'skills': 'current_skills'}
+# Phrasing words, so "all plans recommending Kubernetes for DevOps" searches for the last two
+_STOPWORDS = {
+    "a", "about", "all", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with",
+    "plan", "plans", "mention", "mentioning", "mentions", "recommend", "recommended",
+    "recommending", "recommends", "suggest", "suggesting", "suggests",
+}
+
+
+def fts_query(text: str) -> str:
+    """Turn free-text search into a safe FTS5 query; every term must match"""
+    parts = []
+    for field, term in _TERM_RE.findall(text):
+        prefix = term.endswith("*") and not term.startswith('"')
+        words = term.strip('"') if term.startswith('"') else re.sub(r"[^\w+#.-]", "", term.rstrip("*"))
+        if not words or (not field and not term.startswith('"') and words.lower() in _STOPWORDS):
+            continue
+        phrase = '"' + words.replace('"', '""') + '"' + ("*" if prefix else "")
+        column = _FIELDS.get(field.lower()) if field else None
+        parts.append(f"{column} : {phrase}" if column else phrase)
+    return " AND ".join(parts)
+
+
+class PlanHistory:
+    """Every generated plan with its inputs, timings and token counts.
+
+    Plan text is indexed in an FTS5 table kept in sync by triggers. Search
+    returns one page of ids, headline fields and a highlighted snippet; full
+    documents are only loaded by ``get``. Rows carry the id of the user the
+    plan was served to, and ``search``/``get`` given a ``user_id`` only see
+    that user's plans; plans served from a cache or a shared run get a row
+    of their own per user, with no tokens.
+    """
+
+    def __init__(self, path: Path = DEFAULT_HISTORY_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with self._write_lock:
+            # Databases created before plans had owners
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(plans)")}
+            if columns and 'user_id' not in columns:
+                conn.execute("ALTER TABLE plans ADD COLUMN user_id TEXT")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row(inputs: Dict[str, Any], plan: Dict[str, Any], created_at: float, user_id: Optional[str]) -> tuple:
+        sections = CareerPlan.from_payload(plan)
+        tokens = plan.get('tokens') or {}
+        timings = plan.get('timings')
+        return (
+            created_at,
+            cache_key(inputs),
+            str(inputs.get('career_goal', "")),
+            str(inputs.get('industry', "")),
+            str(inputs.get('current_skills', "")),
+            json.dumps(inputs, sort_keys=True),
+            sections.skill_gap,
+            sections.learning_path,
+            sections.action_plan,
+            json.dumps(timings) if timings else None,
+            int(tokens.get('prompt', 0)),
+            int(tokens.get('completion', 0)),
+            user_id,
+        )
+
+    def record(self, inputs: Dict[str, Any], plan: Dict[str, Any], user_id: Optional[str] = None) -> int:
+        """Store one plan, owned by ``user_id`` if given; returns its history id"""
+        with self._write_lock:
+            cursor = self._connect().execute(_INSERT, self._row(inputs, plan, time.time(), user_id))
+            return cursor.lastrowid
+
+    def record_many(
+        self,
+        records: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]],
+        user_id: Optional[str] = None,
+    ) -> int:
+        """Store many (inputs, plan) pairs in one transaction"""
+        now = time.time()
+        rows = [self._row(inputs, plan, now, user_id) for inputs, plan in records]
+        conn = self._connect()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(_INSERT, rows)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def search(self, text: str, page: int = 1, per_page: int = 20, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """One page of plans matching ``text``, only ``user_id``'s if given.
+
+        Relevance (bm25) ranking covers the newest ``RANK_WINDOW`` matches;
+        scoring every match of a broad term would cost tens of milliseconds
+        at a few hundred thousand plans. Pages past the window continue with
+        older matches, newest first. One user's plans are few enough to rank
+        all of them. With an empty query the most recent plans are listed.
+        """
+        page, per_page = max(1, page), max(1, min(per_page, 100))
+        offset = (page - 1) * per_page
+        conn = self._connect()
+        query = fts_query(text)
+        select = (
+            "SELECT p.id, p.created_at, p.career_goal, p.industry, "
+            "snippet(plans_fts, -1, '**', '**', '…', 16) "
+            "FROM plans_fts JOIN plans p ON p.id = plans_fts.rowid WHERE plans_fts MATCH ? "
+        )
+        if user_id is not None and query:
+            total = conn.execute(
+                "SELECT count(*) FROM plans_fts JOIN plans p ON p.id = plans_fts.rowid "
+                "WHERE plans_fts MATCH ? AND p.user_id = ?",
+                (query, user_id),
+            ).fetchone()[0]
+            rows = conn.execute(
+                select + "AND p.user_id = ? ORDER BY rank LIMIT ? OFFSET ?",
+                (query, user_id, per_page, offset),
+            ).fetchall()
+        elif user_id is not None:
+            total = conn.execute("SELECT count(*) FROM plans WHERE user_id = ?", (user_id,)).fetchone()[0]
+            rows = conn.execute(
+                "SELECT id, created_at, career_goal, industry, substr(action_plan, 1, 160) "
+                "FROM plans WHERE user_id = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+                (user_id, per_page, offset),
+            ).fetchall()
+        elif query:
+            total = conn.execute("SELECT count(*) FROM plans_fts WHERE plans_fts MATCH ?", (query,)).fetchone()[0]
+            boundary = conn.execute(
+                "SELECT rowid FROM plans_fts WHERE plans_fts MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                (query, RANK_WINDOW - 1),
+            ).fetchone()
+            oldest_ranked = boundary[0] if boundary else 0
+            rows = conn.execute(
+                select + "AND plans_fts.rowid >= ? ORDER BY rank LIMIT ? OFFSET ?",
+                (query, oldest_ranked, per_page, offset),
+            ).fetchall()
+            if boundary and len(rows) < per_page:
+                rows += conn.execute(
+                    select + "AND plans_fts.rowid < ? ORDER BY plans_fts.rowid DESC LIMIT ? OFFSET ?",
+                    (query, oldest_ranked, per_page - len(rows), max(0, offset - RANK_WINDOW)),
+                ).fetchall()
+        else:
+            total = conn.execute("SELECT count(*) FROM plans").fetchone()[0]
+            rows = conn.execute(
+                "SELECT id, created_at, career_goal, industry, substr(action_plan, 1, 160) "
+                "FROM plans ORDER BY id DESC LIMIT ? OFFSET ?",
+                (per_page, offset),
+            ).fetchall()
+        return {
+            'query': query,
+            'total': total,
+            'page': page,
+            'pages': max(1, -(-total // per_page)),
+            'results': [
+                {'id': id_, 'created_at': created_at, 'career_goal': goal, 'industry': industry, 'snippet': snippet}
+                for id_, created_at, goal, industry, snippet in rows
+            ],
+        }
+
+    def get(self, plan_id: int, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Full stored record for one history id, if it is ``user_id``'s when given"""
+        sql = (
+            "SELECT created_at, inputs, skill_gap, learning_path, action_plan, timings, "
+            "prompt_tokens, completion_tokens FROM plans WHERE id = ?"
+        )
+        params: Tuple = (plan_id,)
+        if user_id is not None:
+            sql += " AND user_id = ?"
+            params += (user_id,)
+        row = self._connect().execute(sql, params).fetchone()
+        if row is None:
+            return None
+        created_at, inputs, skill_gap, learning_path, action_plan, timings, prompt, completion = row
+        return {
+            'id': plan_id,
+            'created_at': created_at,
+            'inputs': json.loads(inputs),
+            'plan': CareerPlan(skill_gap, learning_path, action_plan),
+            'timings': json.loads(timings) if timings else None,
+            'tokens': {'prompt': prompt, 'completion': completion},
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {'plans': self._connect().execute("SELECT count(*) FROM plans").fetchone()[0]}
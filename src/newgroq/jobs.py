@@ -0,0 +1,170 @@
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from newgroq.progress import PlanProgress
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class Job:
+    """A plan generation submitted to the JobManager"""
+
+    def __init__(self, job_id: str, inputs: Dict[str, Any], user_id: Optional[str] = None):
+        self.id = job_id
+        self.inputs = inputs
+        self.user_id = user_id
+        self.progress = PlanProgress()
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+        self.cancel_requested = False
+        self.future: Optional[Future] = None
+        self.done = threading.Event()
+
+    @property
+    def status(self) -> str:
+        if self.cancel_requested:
+            return CANCELLED
+        if self.error is not None:
+            return FAILED
+        if self.result is not None:
+            return DONE
+        return RUNNING if self.started_at else QUEUED
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED, CANCELLED)
+
+
+class JobManager:
+    """Runs plan generations on a bounded worker pool, off the UI thread.
+
+    Jobs are addressed by id so a Streamlit session can keep only the id in
+    ``st.session_state`` and pick the job back up after any rerun. Finished
+    jobs are retained for ``retention_seconds`` and then pruned.
+
+    A running kickoff cannot be interrupted mid LLM call; cancelling it
+    marks the job cancelled and its result is dropped when it lands.
+
+    ``join``, if given, is asked for a future of an identical run already
+    in flight, both at submit time and when a worker picks the job up; a
+    job that gets one follows it through a callback instead of holding a
+    worker until it lands.
+    """
+
+    def __init__(
+        self,
+        run: Callable[..., Dict[str, Any]],
+        max_workers: int = 4,
+        retention_seconds: float = 3600,
+        join: Optional[Callable[..., Optional[Future]]] = None,
+    ):
+        self._run = run
+        self._join = join
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plan-job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, inputs: Dict[str, Any], user_id: Optional[str] = None) -> str:
+        self._prune()
+        job = Job(uuid.uuid4().hex, dict(inputs), user_id)
+        with self._lock:
+            self._jobs[job.id] = job
+        if not self._follow(job):
+            # Under the lock so a worker's _follow cannot be overwritten
+            with self._lock:
+                job.future = self._executor.submit(self._execute, job)
+        return job.id
+
+    def _follow(self, job: Job) -> bool:
+        """Attach ``job`` to an identical in-flight run instead of running it"""
+        future = (
+            self._join(job.inputs, progress=job.progress, user_id=job.user_id)
+            if self._join is not None else None
+        )
+        if future is None:
+            return False
+        job.started_at = time.time()
+        with self._lock:
+            job.future = future
+        future.add_done_callback(lambda done: self._settle(job, done))
+        return True
+
+    def _settle(self, job: Job, future: Future):
+        if not future.cancelled():
+            if future.exception() is not None:
+                job.error = future.exception()
+            elif not job.cancel_requested:
+                job.result = future.result()
+        self._finish(job)
+
+    def _execute(self, job: Job):
+        if job.cancel_requested:
+            self._finish(job)
+            return
+        if self._follow(job):
+            return
+        job.started_at = time.time()
+        try:
+            result = self._run(job.inputs, progress=job.progress, user_id=job.user_id)
+        except BaseException as e:
+            job.error = e
+        else:
+            if not job.cancel_requested:
+                job.result = result
+        finally:
+            self._finish(job)
+
+    @staticmethod
+    def _finish(job: Job):
+        job.finished_at = time.time()
+        job.done.set()
+
+    def get(self, job_id: Optional[str]) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id) if job_id else None
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.cancel_requested = True
+        with self._lock:
+            future = job.future
+        if future is not None and future.cancel():
+            self._finish(job)
+        return True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        job = self.get(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0, CANCELLED: 0}
+        for job in jobs:
+            counts[job.status] += 1
+        return counts
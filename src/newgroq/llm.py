@@ -0,0 +1,236 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from crewai import LLM
+
+from newgroq.hedge import (
+    DEFAULT_TIMEOUT_SECONDS,
+    CallAbandoned,
+    DeadlineExceeded,
+    hedge_deadline,
+    hedge_settings,
+    hedged_call,
+)
+from newgroq.metrics import awaiting_first_token, registry, stop_first_token, track_first_token
+from newgroq.ratelimit import call_with_retry, estimate_tokens, get_rate_limiter
+from newgroq.settings import load_settings
+
+
+def _usage(llm):
+    summary = llm.get_token_usage_summary() if hasattr(llm, 'get_token_usage_summary') else None
+    return (getattr(summary, 'prompt_tokens', 0) or 0, getattr(summary, 'completion_tokens', 0) or 0)
+
+
+def crew_token_usage(crew) -> Tuple[int, int]:
+    """Prompt and completion tokens used so far by every agent's LLM in ``crew``"""
+    prompt = completion = 0
+    for agent in crew.agents:
+        agent_prompt, agent_completion = _usage(agent.llm)
+        prompt += agent_prompt
+        completion += agent_completion
+    return prompt, completion
+
+
+class _UsageRecorder:
+    """LiteLLM-style callback adding a response's usage to the LLM that made it.
+
+    CrewAI only tracks usage on the LLM instance for streamed calls.
+    """
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        usage = response_obj.get('usage')
+        if usage is not None:
+            self.llm._track_token_usage_internal(usage.model_dump() if hasattr(usage, 'model_dump') else dict(usage))
+
+
+def _recording_usage(llm, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    if getattr(llm, 'stream', False):
+        return kwargs
+    return dict(kwargs, callbacks=list(kwargs.get('callbacks') or []) + [_UsageRecorder(llm)])
+
+
+class _CallUsage:
+    """Splits one call's token usage between the call and hedge overhead.
+
+    The primary and the hedge each run on their own LLM object; the first to
+    succeed before the call ends has its usage added to the LLM the call was
+    made on, and every other request's usage is counted under ``llm_hedge_*``.
+    """
+
+    def __init__(self, owner, labels: Dict[str, Any]):
+        self.owner = owner
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._claimed = False
+
+    def settle(self, llm, succeeded: bool, abandoned: threading.Event):
+        prompt, completion = _usage(llm)
+        with self._lock:
+            won = succeeded and not self._claimed and not abandoned.is_set()
+            self._claimed = self._claimed or won
+        if won:
+            self.owner._track_token_usage_internal({'prompt_tokens': prompt, 'completion_tokens': completion})
+        else:
+            registry.inc("llm_hedge_prompt_tokens_total", prompt, self.labels)
+            registry.inc("llm_hedge_completion_tokens_total", completion, self.labels)
+
+
+class RateLimitedLLM(LLM):
+    """LLM whose calls queue on the shared rate limiter and retry 429s.
+
+    Each call also records queue wait, wall time, time to first token (for
+    streamed calls), prompt/completion tokens and retries in the metrics
+    registry, labelled by agent role, model and task.
+
+    With ``hedging`` enabled in crewai.json, a call that has not answered
+    (or, when streamed, produced a token) by its task's p95 response time is
+    raced against a duplicate request to ``fallback_model``; the losing
+    request's tokens are counted under ``llm_hedge_*``, not the call's.
+    ``timeout_seconds`` (``DEFAULT_TIMEOUT_SECONDS`` unless set; null turns
+    it off) bounds each call from when the rate limiter admits it.
+    """
+
+    def _shadow(self) -> "RateLimitedLLM":
+        """Copy of this LLM with its own token usage, for one hedged request"""
+        # Not copy.copy: LLM.__new__ picks a provider class and needs the model
+        shadow = object.__new__(type(self))
+        shadow.__dict__.update(self.__dict__)
+        shadow._token_usage = {key: 0 for key in self._token_usage}
+        return shadow
+
+    def _hedge(self, messages, args, kwargs, tokens: int, usage: _CallUsage, model: str):
+        """Duplicate of a slow call, made without streaming or crew events"""
+        backup = LLM(
+            model=model,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            base_url=getattr(self, 'base_url', None),
+            is_litellm=True,
+        )
+        hedge_kwargs = {k: v for k, v in kwargs.items() if k not in ('from_task', 'from_agent')}
+
+        def run(abandoned: threading.Event):
+            if not get_rate_limiter().acquire(tokens, cancelled=abandoned):
+                raise CallAbandoned("hedge dropped before sending")
+            succeeded = False
+            try:
+                result = backup.call(messages, *args, **_recording_usage(backup, hedge_kwargs))
+                succeeded = True
+                return result
+            finally:
+                usage.settle(backup, succeeded, abandoned)
+
+        return run
+
+    def call(self, messages, *args, **kwargs):
+        limiter = get_rate_limiter()
+        tokens = estimate_tokens(messages, getattr(self, 'max_tokens', None))
+        max_retries = load_settings().get('rate_limits', {}).get('max_retries', 5)
+        agent = kwargs.get('from_agent')
+        labels = {
+            'agent': (getattr(agent, 'role', None) or 'unknown').strip(),
+            'model': self.model,
+            'task': getattr(kwargs.get('from_task'), 'name', None) or 'unknown',
+        }
+        hedging = hedge_settings(labels['task'])
+        deadline = hedge_deadline("llm_response_seconds", {'task': labels['task'], 'model': self.model}, hedging)
+        timeout = hedging.get('timeout_seconds', DEFAULT_TIMEOUT_SECONDS)
+        usage = _CallUsage(self, labels)
+
+        def attempt(
+            sent: Optional[threading.Event] = None,
+            abandoned: Optional[threading.Event] = None,
+            llm: Optional["RateLimitedLLM"] = None,
+        ):
+            llm = llm or self
+            start = time.perf_counter()
+            if not limiter.acquire(tokens, cancelled=abandoned):
+                raise CallAbandoned("retry dropped before sending")
+            registry.observe("llm_queue_wait_seconds", time.perf_counter() - start, labels)
+            if sent is not None:
+                sent.set()
+            start = time.perf_counter()
+            result = super(RateLimitedLLM, llm).call(messages, *args, **_recording_usage(llm, kwargs))
+            registry.observe("llm_response_seconds", time.perf_counter() - start, labels)
+            return result
+
+        def primary(sent: threading.Event, abandoned: threading.Event):
+            # On a copy, so a primary that loses never adds its tokens to this LLM
+            shadow = self._shadow()
+            succeeded = False
+            try:
+                result = call_with_retry(
+                    lambda: attempt(sent, abandoned, shadow), max_retries=max_retries, on_retry=on_retry
+                )
+                succeeded = True
+                return result
+            finally:
+                usage.settle(shadow, succeeded, abandoned)
+
+        def on_retry(retry, delay, error):
+            registry.inc("llm_retries_total", labels=labels)
+
+        def on_hedge():
+            registry.inc("llm_hedges_total", labels=labels)
+
+        def on_loser(future):
+            registry.inc("llm_hedge_losers_total", labels=labels)
+
+        task = kwargs.get('from_task') if getattr(self, 'stream', False) else None
+        prompt_before, completion_before = _usage(self)
+        track_first_token(task, labels)
+        start = time.perf_counter()
+        try:
+            if deadline is None and not timeout:
+                return call_with_retry(attempt, max_retries=max_retries, on_retry=on_retry)
+            result, hedge_won = hedged_call(
+                primary,
+                hedge=None if deadline is None else self._hedge(
+                    messages, args, kwargs, tokens, usage, hedging.get('fallback_model') or self.model
+                ),
+                deadline=deadline,
+                timeout=timeout,
+                producing=(lambda: not awaiting_first_token(task)) if task is not None else None,
+                on_hedge=on_hedge,
+                on_loser=on_loser,
+            )
+            if hedge_won:
+                registry.inc("llm_hedge_wins_total", labels=labels)
+            return result
+        except DeadlineExceeded:
+            registry.inc("llm_timeouts_total", labels=labels)
+            registry.inc("llm_errors_total", labels=labels)
+            raise
+        except Exception:
+            registry.inc("llm_errors_total", labels=labels)
+            raise
+        finally:
+            stop_first_token(task)
+            registry.observe("llm_call_seconds", time.perf_counter() - start, labels)
+            registry.inc("llm_calls_total", labels=labels)
+            prompt_after, completion_after = _usage(self)
+            registry.inc("llm_prompt_tokens_total", prompt_after - prompt_before, labels)
+            registry.inc("llm_completion_tokens_total", completion_after - completion_before, labels)
+            # Per-call output size drives the max_tokens tier suggestions in routing.py
+            registry.observe("llm_completion_tokens", completion_after - completion_before, labels)
+
+
+def build_llm(model: str, **kwargs) -> LLM:
+    # NEWGROQ_LLM_MODEL points every agent at one model, e.g. a local stub for benchmarks,
+    # and NEWGROQ_LLM_BASE_URL at an OpenAI-compatible server such as benchmarks/stub_server.py
+    base_url = os.environ.get("NEWGROQ_LLM_BASE_URL")
+    if base_url:
+        kwargs.setdefault('base_url', base_url)
+    # LLM.__new__ hands natively supported providers (openai/*, anthropic/*, ...) to their
+    # own client classes, which would skip RateLimitedLLM.call; LiteLLM keeps the subclass
+    kwargs.setdefault('is_litellm', True)
+    model = os.environ.get("NEWGROQ_LLM_MODEL") or model
+    llm = RateLimitedLLM(model=model, **kwargs)
+    if not isinstance(llm, RateLimitedLLM):
+        raise TypeError(f"{model!r} resolved to {type(llm).__name__}, bypassing rate limits and metrics")
+    return llm
@@ -32,6 +32,72 @@ def run():
         raise Exception(f"An error occurred while running the crew: {e}")
 
 
+def run_batch():
+    """
+    Run the crew for every profile in a JSONL file.
+    Usage: run_batch <profiles.jsonl> <results.jsonl> [concurrency]
+    """
+    from newgroq.batch import BatchRunner
+    from newgroq.service import generate_plan
+
+    if len(sys.argv) < 3:
+        raise Exception("Usage: run_batch <profiles.jsonl> <results.jsonl> [concurrency]")
+
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    try:
+        counts = BatchRunner(generate_plan, concurrency=concurrency).run(sys.argv[1], sys.argv[2])
+    except Exception as e:
+        raise Exception(f"An error occurred while running the batch: {e}")
+    print(f"Batch finished: {counts['ok']} ok, {counts['error']} failed, {counts['skipped']} already done")
+
+
+def precompute_warehouse():
+    """
+    Generate plans for the crewai.json warehouse matrix of stock profiles.
+    Only missing plans and ones older than refresh_days are regenerated, so
+    this can run on a schedule (e.g. nightly cron).
+    Usage: precompute_warehouse [concurrency] [--force]
+    """
+    from newgroq.service import run_crew
+    from newgroq.warehouse import DEFAULT_WAREHOUSE_PATH, precompute
+
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    concurrency = int(args[0]) if args else 4
+
+    def report_error(inputs, error):
+        print(f"Failed: {inputs['career_goal']} / {inputs['industry']}: {error}", file=sys.stderr)
+
+    try:
+        counts = precompute(
+            run_crew,
+            concurrency=concurrency,
+            force="--force" in sys.argv[1:],
+            on_error=report_error,
+        )
+    except Exception as e:
+        raise Exception(f"An error occurred while precomputing the warehouse: {e}")
+    print(
+        f"Warehouse {DEFAULT_WAREHOUSE_PATH}: {counts['generated']} generated, {counts['kept']} still fresh, "
+        f"{counts['failed']} failed of {counts['profiles']} profiles"
+    )
+
+
+def build_course_index():
+    """
+    Build the course catalog search index used by the learning path agent.
+    Usage: build_course_index [catalog.jsonl] [index.bin]
+    """
+    from newgroq.catalog import CATALOG_PATH, DEFAULT_INDEX_PATH, build_index
+
+    catalog = sys.argv[1] if len(sys.argv) > 1 else CATALOG_PATH
+    index = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_INDEX_PATH
+    try:
+        counts = build_index(catalog, index)
+    except Exception as e:
+        raise Exception(f"An error occurred while building the course index: {e}")
+    print(f"Indexed {counts['documents']} catalog entries, {counts['terms']} terms, {counts['bytes']} bytes -> {index}")
+
+
 # def train():
 #     """
 #     Train the crew for a given number of iterations.
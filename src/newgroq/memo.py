@@ -0,0 +1,117 @@
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from crewai import Crew, Task
+from crewai.tasks.task_output import TaskOutput
+
+from newgroq.cache import PROFILE_FIELDS, ResultCache, normalize_inputs
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+def _template(obj, field: str) -> str:
+    """Uninterpolated text of ``field``, even after a previous kickoff"""
+    return getattr(obj, f"_original_{field}", None) or getattr(obj, field, None) or ""
+
+
+def task_placeholders(task: Task) -> List[str]:
+    """Input names a task (and its agent) actually interpolate"""
+    texts = [_template(task, 'description'), _template(task, 'expected_output')]
+    if task.agent is not None:
+        texts += [_template(task.agent, f) for f in ('role', 'goal', 'backstory')]
+    return sorted({name for text in texts for name in _PLACEHOLDER_RE.findall(text)})
+
+
+def task_key(task: Task, inputs: Dict[str, Any], upstream: List[str]) -> str:
+    """Hash of the inputs a task interpolates, its upstream outputs and LLM route"""
+    normalized = normalize_inputs(inputs)
+    values = {
+        name: normalized[name] if name in PROFILE_FIELDS else str(inputs.get(name, ""))
+        for name in task_placeholders(task)
+    }
+    # A re-routed task (other model or max_tokens tier) must not reuse old outputs
+    llm = getattr(task.agent, 'llm', None)
+    route = [getattr(llm, 'model', None), getattr(llm, 'max_tokens', None)]
+    payload = json.dumps(
+        {'task': task.name, 'inputs': values, 'upstream': upstream, 'llm': route},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_output(task: Task, raw: str) -> TaskOutput:
+    return TaskOutput(
+        name=task.name,
+        description=task.description,
+        expected_output=task.expected_output,
+        agent=task.agent.role if task.agent else "",
+        raw=raw,
+    )
+
+
+def _plan(tasks: List[Task], raws: List[str]) -> Dict[str, Any]:
+    return {'tasks': {task.name: raw for task, raw in zip(tasks, raws)}}
+
+
+def kickoff_memoized(
+    crew: Crew,
+    inputs: Dict[str, Any],
+    memo: ResultCache,
+    precomputed: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Run ``crew`` re-executing only tasks whose memo key changed.
+
+    The cached prefix is reused and only the suffix starting at the first
+    changed task is executed, one task after another and with the context
+    a full run would give it. A cold run goes through ``crew.kickoff`` as
+    usual (including the DAG schedule's async tasks) and memoizes every
+    task output. ``precomputed`` outputs (by task name) count as hits for
+    their tasks.
+    """
+    tasks = crew.tasks
+    precomputed = precomputed or {}
+    raws: List[str] = []
+    for task in tasks:
+        if task.name in precomputed:
+            raws.append(precomputed[task.name])
+            continue
+        hit = memo.get_by_key(task_key(task, inputs, raws))
+        if hit is None:
+            break
+        raws.append(hit['raw'])
+    start = len(raws)
+
+    if start == 0:
+        crew.kickoff(inputs=inputs)
+        # Not result.tasks_output: after joining async tasks Crew keeps only their outputs
+        raws = [task.output.raw for task in tasks]
+        for index, task in enumerate(tasks):
+            memo.set_by_key(task_key(task, inputs, raws[:index]), {'raw': raws[index]})
+        return _plan(tasks, raws)
+
+    # Resume like Crew.replay does: interpolate, seed cached outputs, run the rest.
+    # Outputs accumulate as in Crew._execute_tasks; a task with an explicit
+    # context reads it from its upstream tasks' outputs instead
+    crew._interpolate_inputs(inputs)
+    outputs: List[TaskOutput] = []
+    for task, raw in zip(tasks, raws):
+        task.output = _cached_output(task, raw)
+        outputs.append(task.output)
+        if task.callback:
+            task.callback(task.output)
+    if start == len(tasks):
+        return _plan(tasks, raws)
+
+    for task in tasks[start:]:
+        context = crew._get_context(task, outputs)
+        # Same tool resolution as Crew: the task's own tools, else its agent's
+        tools = crew._prepare_tools(task.agent, task, task.tools or task.agent.tools or [])
+        output = task.execute_sync(agent=task.agent, context=context, tools=tools)
+        memo.set_by_key(task_key(task, inputs, raws), {'raw': output.raw})
+        raws.append(output.raw)
+        outputs.append(output)
+    return _plan(tasks, raws)
+
@@ -0,0 +1,237 @@
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Optional[Dict[str, Any]]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in (labels or {}).items()))
+
+
+def _escape(value: str) -> str:
+    """Label value escaped per the Prometheus text format"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Dict[str, str]] = None) -> str:
+    items = list(labels) + sorted((extra or {}).items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+class Histogram:
+    """Rolling percentiles over the most recent ``window`` observations"""
+
+    def __init__(self, window: int = 1024):
+        self._values = deque(maxlen=window)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self._values.append(value)
+        self.count += 1
+        self.sum += value
+
+    def quantiles(self, quantiles=QUANTILES) -> Dict[float, float]:
+        values = sorted(self._values)
+        if not values:
+            return {q: 0.0 for q in quantiles}
+        return {q: values[min(len(values) - 1, int(q * len(values)))] for q in quantiles}
+
+    def samples(self) -> List[float]:
+        return list(self._values)
+
+
+class MetricsRegistry:
+    """Counters, rolling histograms and pulled gauges for the whole process"""
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1, labels: Optional[Dict[str, Any]] = None):
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None):
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            series.setdefault(key, Histogram()).observe(value)
+
+    def quantile(self, name: str, q: float, match: Optional[Dict[str, Any]] = None) -> Tuple[float, int]:
+        """Quantile ``q`` over every series of ``name`` whose labels include ``match``.
+
+        Returns the value and the number of samples it was computed from.
+        """
+        wanted = set(_labels(match))
+        with self._lock:
+            values = sorted(
+                value
+                for labels, histogram in self._histograms.get(name, {}).items()
+                if wanted.issubset(labels)
+                for value in histogram.samples()
+            )
+        if not values:
+            return 0.0, 0
+        return values[min(len(values) - 1, int(q * len(values)))], len(values)
+
+    def register_collector(self, name: str, collect: Callable[[], Dict[str, float]]):
+        """Expose ``collect()``'s numeric values as ``<name>_<key>`` gauges"""
+        with self._lock:
+            self._collectors[name] = collect
+
+    def _gauges(self) -> Dict[str, float]:
+        with self._lock:
+            collectors = list(self._collectors.items())
+        gauges = {}
+        for prefix, collect in collectors:
+            for key, value in collect().items():
+                if isinstance(value, (int, float)):
+                    gauges[f"{prefix}_{key}"] = value
+        return gauges
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {
+                name: [{'labels': dict(k), 'value': v} for k, v in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [
+                    {
+                        'labels': dict(k),
+                        'count': h.count,
+                        'sum': h.sum,
+                        'quantiles': {str(q): v for q, v in h.quantiles().items()},
+                    }
+                    for k, h in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+        return {'counters': counters, 'histograms': histograms, 'gauges': self._gauges()}
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE newgroq_{name} counter")
+                for labels, value in series.items():
+                    lines.append(f"newgroq_{name}{_format_labels(labels)} {value}")
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE newgroq_{name} summary")
+                for labels, histogram in series.items():
+                    for q, value in histogram.quantiles().items():
+                        lines.append(f"newgroq_{name}{_format_labels(labels, {'quantile': str(q)})} {value}")
+                    lines.append(f"newgroq_{name}_sum{_format_labels(labels)} {histogram.sum}")
+                    lines.append(f"newgroq_{name}_count{_format_labels(labels)} {histogram.count}")
+        for name, value in sorted(self._gauges().items()):
+            lines.append(f"# TYPE newgroq_{name} gauge")
+            lines.append(f"newgroq_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+class Timer:
+    """Context manager observing elapsed seconds into a histogram"""
+
+    def __init__(self, name: str, labels: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.labels = labels
+        self.seconds = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._start
+        registry.observe(self.name, self.seconds, self.labels)
+
+
+# task id -> call start, for time-to-first-token on streamed calls
+_streaming_calls: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_streaming_lock = threading.Lock()
+_stream_listener_registered = False
+
+
+def _on_stream_chunk(source, event):
+    task_id = getattr(event, 'task_id', None)
+    with _streaming_lock:
+        started = _streaming_calls.pop(str(task_id), None) if task_id else None
+    if started is not None:
+        start, labels = started
+        registry.observe("llm_time_to_first_token_seconds", time.perf_counter() - start, labels)
+
+
+def track_first_token(task, labels: Dict[str, Any]):
+    """Start timing time-to-first-token for a streamed call made for ``task``"""
+    global _stream_listener_registered
+    if task is None:
+        return
+    with _streaming_lock:
+        if not _stream_listener_registered:
+            from crewai.events import LLMStreamChunkEvent, crewai_event_bus
+
+            crewai_event_bus.on(LLMStreamChunkEvent)(_on_stream_chunk)
+            _stream_listener_registered = True
+        _streaming_calls[str(task.id)] = (time.perf_counter(), labels)
+
+
+def awaiting_first_token(task) -> bool:
+    """True while a streamed call for ``task`` has not produced a chunk yet"""
+    with _streaming_lock:
+        return task is not None and str(task.id) in _streaming_calls
+
+
+def stop_first_token(task):
+    if task is not None:
+        with _streaming_lock:
+            _streaming_calls.pop(str(task.id), None)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/metrics.json"):
+            body, content_type = registry.to_json(), "application/json"
+        elif self.path.startswith("/metrics"):
+            body, content_type = registry.to_prometheus(), "text/plain; version=0.0.4"
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve /metrics (Prometheus text) and /metrics.json on a daemon thread.
+
+    Binds to localhost unless ``host`` says otherwise; the metrics carry
+    agent roles, task names and models.
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
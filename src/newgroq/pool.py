@@ -0,0 +1,123 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+def _build_newgroq_crew():
+    from newgroq.crew import Newgroq
+
+    return Newgroq().crew()
+
+
+def reset_crew(crew):
+    """Clear per-run state so a crew can be handed to the next request"""
+    for task in crew.tasks:
+        task.output = None
+        task.callback = None
+        if hasattr(task, 'start_time'):
+            task.start_time = None
+            task.end_time = None
+    crew.task_callback = None
+    crew.step_callback = None
+
+
+class _Durations:
+    """Running count, sum and max, so a long-lived pool keeps constant memory"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def average_ms(self) -> float:
+        return 1000 * self.total / self.count if self.count else 0.0
+
+
+class CrewPool:
+    """Process-wide pool of ready-built crews.
+
+    Building a Newgroq crew re-reads the YAML configs and constructs every
+    Agent, Task, LLM client and the Crew itself. The pool does that ahead of
+    time and hands crews out exclusively: a checked-out crew is never shared
+    between sessions, and it is reset before going back into the pool. Crews
+    whose run raised are discarded instead of being returned.
+    """
+
+    def __init__(self, factory: Optional[Callable] = None, size: int = 4):
+        self.factory = factory or _build_newgroq_crew
+        self.size = size
+        self._idle: List = []
+        self._lock = threading.Lock()
+        self._build_times = _Durations()
+        self._checkout_times = _Durations()
+        self.on_demand_builds = 0
+        self.discarded = 0
+
+    def _build(self):
+        start = time.perf_counter()
+        crew = self.factory()
+        with self._lock:
+            self._build_times.add(time.perf_counter() - start)
+        return crew
+
+    def warm_up(self, count: Optional[int] = None):
+        """Build crews until ``count`` (default: pool size) are idle"""
+        target = self.size if count is None else count
+        while True:
+            with self._lock:
+                if len(self._idle) >= target:
+                    return
+            crew = self._build()
+            with self._lock:
+                self._idle.append(crew)
+
+    def warm_up_async(self) -> threading.Thread:
+        thread = threading.Thread(target=self.warm_up, name="crew-pool-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    @contextmanager
+    def checkout(self):
+        start = time.perf_counter()
+        with self._lock:
+            crew = self._idle.pop() if self._idle else None
+        if crew is None:
+            crew = self._build()
+            with self._lock:
+                self.on_demand_builds += 1
+        with self._lock:
+            self._checkout_times.add(time.perf_counter() - start)
+
+        try:
+            yield crew
+        except BaseException:
+            with self._lock:
+                self.discarded += 1
+            raise
+        else:
+            reset_crew(crew)
+            with self._lock:
+                if len(self._idle) < self.size:
+                    self._idle.append(crew)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            builds, checkouts = self._build_times, self._checkout_times
+            return {
+                'size': self.size,
+                'idle': len(self._idle),
+                'builds': builds.count,
+                'on_demand_builds': self.on_demand_builds,
+                'discarded': self.discarded,
+                'avg_build_ms': builds.average_ms(),
+                'max_build_ms': 1000 * builds.max,
+                'checkouts': checkouts.count,
+                'avg_checkout_ms': checkouts.average_ms(),
+                'max_checkout_ms': 1000 * checkouts.max,
+            }
@@ -0,0 +1,117 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+# Task name -> plan section, in pipeline order
+TASK_SECTIONS = {
+    'skill_gap_analysis_task': 'skill_gap',
+    'learning_path_design_task': 'learning_path',
+    'action_plan_task': 'action_plan',
+}
+
+# task id -> (progress, task name) for routing streamed chunks
+_streams: Dict[str, tuple] = {}
+_streams_lock = threading.Lock()
+_stream_listener_registered = False
+
+
+class PlanProgress:
+    """Thread-safe record of how far a kickoff has got.
+
+    Task callbacks and LLM stream events write into it from whichever thread
+    the crew runs on; the UI reads consistent ``snapshot()`` copies.
+    """
+
+    def __init__(self, task_names: Optional[List[str]] = None):
+        self.task_names = list(task_names or TASK_SECTIONS)
+        self._outputs: Dict[str, str] = {}
+        self._streams: Dict[str, str] = {}
+        self._current: Optional[str] = self.task_names[0] if self.task_names else None
+        self._mirrors: List['PlanProgress'] = []
+        self._lock = threading.Lock()
+
+    def add_mirror(self, progress: 'PlanProgress'):
+        """Forward every update to ``progress``, after catching it up on this one"""
+        with self._lock:
+            self._mirrors.append(progress)
+            with progress._lock:
+                progress._outputs.update(self._outputs)
+                progress._streams = dict(self._streams)
+                progress._current = self._current
+
+    def task_completed(self, output):
+        name = getattr(output, 'name', None)
+        if name not in self.task_names:
+            return
+        with self._lock:
+            self._outputs[name] = output.raw
+            self._streams.pop(name, None)
+            pending = [n for n in self.task_names if n not in self._outputs]
+            self._current = pending[0] if pending else None
+            mirrors = list(self._mirrors)
+        for mirror in mirrors:
+            mirror.task_completed(output)
+
+    def add_chunk(self, task_name: str, chunk: str):
+        with self._lock:
+            if task_name in self.task_names and task_name not in self._outputs:
+                self._streams[task_name] = self._streams.get(task_name, "") + chunk
+            mirrors = list(self._mirrors)
+        for mirror in mirrors:
+            mirror.add_chunk(task_name, chunk)
+
+    def complete_plan(self, plan: Dict[str, Any]):
+        """Mark every task done from a finished (possibly cached) plan payload"""
+        with self._lock:
+            self._outputs.update(plan.get('tasks', {}))
+            self._streams.clear()
+            self._current = None
+            mirrors = list(self._mirrors)
+        for mirror in mirrors:
+            mirror.complete_plan(plan)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            done = sum(1 for n in self.task_names if n in self._outputs)
+            return {
+                'outputs': dict(self._outputs),
+                'streams': dict(self._streams),
+                'current': self._current,
+                'completed': done,
+                'fraction': done / len(self.task_names) if self.task_names else 1.0,
+            }
+
+
+def _on_stream_chunk(source, event):
+    task_id = getattr(event, 'task_id', None)
+    with _streams_lock:
+        target = _streams.get(str(task_id)) if task_id else None
+    if target is not None:
+        progress, task_name = target
+        progress.add_chunk(task_name, event.chunk)
+
+
+def _register_stream_listener():
+    global _stream_listener_registered
+    with _streams_lock:
+        if _stream_listener_registered:
+            return
+        _stream_listener_registered = True
+    from crewai.events import LLMStreamChunkEvent, crewai_event_bus
+
+    crewai_event_bus.on(LLMStreamChunkEvent)(_on_stream_chunk)
+
+
+def attach_progress(crew, progress: PlanProgress):
+    """Route ``crew``'s task completions and streamed tokens into ``progress``"""
+    _register_stream_listener()
+    crew.task_callback = progress.task_completed
+    with _streams_lock:
+        for task in crew.tasks:
+            task.callback = progress.task_completed
+            _streams[str(task.id)] = (progress, task.name)
+
+
+def detach_progress(crew):
+    with _streams_lock:
+        for task in crew.tasks:
+            _streams.pop(str(task.id), None)
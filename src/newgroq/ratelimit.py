@@ -0,0 +1,217 @@
+import random
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+from newgroq.metrics import registry
+from newgroq.settings import PROJECT_ROOT, load_settings
+
+T = TypeVar("T")
+
+_RETRY_IN_RE = re.compile(r"try again in (?:(\d+)m)?([\d.]+)(ms|s)", re.IGNORECASE)
+
+
+def _sleep(seconds: float, cancelled: Optional[threading.Event]):
+    if cancelled is None:
+        time.sleep(seconds)
+    else:
+        cancelled.wait(seconds)
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``capacity`` per minute"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float):
+        self.level -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """Request and token buckets shared by every LLM call in the process.
+
+    ``acquire`` blocks (queues) until both buckets can cover the call rather
+    than letting it fail with a 429. Waiters are served one at a time, so a
+    burst drains smoothly instead of stampeding when capacity frees up. A
+    waiter whose ``cancelled`` event is set leaves without taking anything.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def acquire(self, tokens: int = 1, cancelled: Optional[threading.Event] = None) -> bool:
+        """Take capacity for one call; False if ``cancelled`` was set first"""
+        with self._lock:
+            while True:
+                if cancelled is not None and cancelled.is_set():
+                    return False
+                now = time.monotonic()
+                wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(tokens, now))
+                if wait <= 0:
+                    self.requests.take(1)
+                    self.tokens.take(tokens)
+                    return True
+                self.waited_seconds += wait
+                _sleep(wait, cancelled)
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """RateLimiter whose bucket levels live in a SQLite file.
+
+    Every process pointed at the same file shares one pair of buckets;
+    ``BEGIN IMMEDIATE`` serializes the read-refill-take across processes.
+    """
+
+    def __init__(self, path: Path, requests_per_minute: float, tokens_per_minute: float):
+        super().__init__(requests_per_minute, tokens_per_minute)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(name TEXT PRIMARY KEY, level REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _wait_or_take(self, conn: sqlite3.Connection, tokens: int) -> float:
+        # Wall clock, not monotonic: the timestamps are compared across processes
+        now = time.time()
+        wait = 0.0
+        for name, bucket, amount in (("requests", self.requests, 1), ("tokens", self.tokens, tokens)):
+            row = conn.execute("SELECT level, updated FROM buckets WHERE name = ?", (name,)).fetchone()
+            bucket.level, bucket.updated = row if row else (bucket.capacity, now)
+            wait = max(wait, bucket.wait_time(amount, now))
+        if wait > 0:
+            return wait
+        for name, bucket, amount in (("requests", self.requests, 1), ("tokens", self.tokens, tokens)):
+            bucket.take(amount)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, level, updated) VALUES (?, ?, ?)",
+                (name, bucket.level, bucket.updated),
+            )
+        return 0.0
+
+    def acquire(self, tokens: int = 1, cancelled: Optional[threading.Event] = None) -> bool:
+        conn = self._connect()
+        with self._lock:
+            while True:
+                if cancelled is not None and cancelled.is_set():
+                    return False
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    wait = self._wait_or_take(conn, tokens)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                if wait <= 0:
+                    return True
+                self.waited_seconds += wait
+                _sleep(min(wait, 1.0), cancelled)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    if type(error).__name__ == "RateLimitError":
+        return True
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Server-requested delay from a Retry-After header or Groq's error message"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("retry-after") if hasattr(headers, "get") else None
+    if value is not None:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    match = _RETRY_IN_RE.search(str(error))
+    if match:
+        minutes, amount, unit = match.groups()
+        seconds = float(amount) / (1000 if unit.lower() == "ms" else 1)
+        return seconds + 60 * int(minutes or 0)
+    return None
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    max_retries: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    on_retry: Optional[Callable[[int, float, BaseException], None]] = None,
+) -> T:
+    """Call ``fn``, retrying 429s with jittered exponential backoff.
+
+    The delay is full-jitter exponential backoff, but never shorter than the
+    server's retry-after hint.
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt >= max_retries:
+                raise
+            backoff = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            delay = max(backoff, retry_after_seconds(e) or 0.0)
+            attempt += 1
+            if on_retry:
+                on_retry(attempt, delay, e)
+            time.sleep(delay)
+
+
+def estimate_tokens(messages, max_tokens: Optional[int] = None) -> int:
+    """Rough prompt + completion token count (~4 characters per token)"""
+    if isinstance(messages, str):
+        chars = len(messages)
+    else:
+        chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return chars // 4 + (max_tokens or 0)
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter sized from the ``rate_limits`` block of crewai.json"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            limits = load_settings().get("rate_limits", {})
+            rpm = limits.get("requests_per_minute", 30)
+            tpm = limits.get("tokens_per_minute", 6000)
+            shared_state = limits.get("shared_state")
+            if shared_state:
+                _limiter = SQLiteRateLimiter(PROJECT_ROOT / shared_state, rpm, tpm)
+            else:
+                _limiter = RateLimiter(rpm, tpm)
+            registry.register_collector("rate_limiter", lambda: {'waited_seconds': _limiter.waited_seconds})
+    return _limiter
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict
+
+from newgroq.progress import TASK_SECTIONS
+
+
+@dataclass(frozen=True, slots=True)
+class CareerPlan:
+    """The three task outputs of a plan, each stored exactly once.
+
+    The complete report is a view assembled from the parts on demand rather
+    than a fourth copy of the text.
+    """
+
+    skill_gap: str = ""
+    learning_path: str = ""
+    action_plan: str = ""
+
+    @classmethod
+    def from_tasks(cls, tasks: Dict[str, str]) -> "CareerPlan":
+        return cls(**{section: tasks.get(name, "") for name, section in TASK_SECTIONS.items()})
+
+    @classmethod
+    def from_crew_output(cls, result) -> "CareerPlan":
+        """Read each task's output straight from a CrewOutput"""
+        return cls.from_tasks({output.name: output.raw for output in result.tasks_output})
+
+    @classmethod
+    def from_payload(cls, plan: Dict[str, Any]) -> "CareerPlan":
+        """From a service plan payload; payloads cached before per-task
+        outputs were kept only have the final task's ``raw`` text"""
+        if plan.get('tasks'):
+            return cls.from_tasks(plan['tasks'])
+        return cls(action_plan=plan.get('raw', ""))
+
+    def sections(self):
+        """(section key, text) pairs in pipeline order"""
+        return [(section, getattr(self, section)) for section in TASK_SECTIONS.values()]
+
+    def full_report(self) -> str:
+        return "\n\n---\n\n".join(text for _, text in self.sections() if text)
+
+
+def build_markdown_report(inputs: Dict[str, str], plan: CareerPlan, generated_at: datetime) -> str:
+    """Downloadable markdown version of the full plan, each section once"""
+    return f"""# Career Development Plan
+Generated on: {generated_at.strftime("%Y-%m-%d %H:%M")}
+
+## 📋 Profile Summary
+- **Career Goal**: {inputs['career_goal']}
+- **Industry**: {inputs['industry']}
+- **Experience Level**: {inputs['experience_level']}
+- **Education**: {inputs['education']}
+- **Current Skills**: {inputs['current_skills']}
+- **Time Commitment**: {inputs['time_commitment']} hours/week
+
+---
+
+## 🎯 Skill Gap Analysis
+{plan.skill_gap or 'Not available'}
+
+---
+
+## 🛤️ Learning Path Design
+{plan.learning_path or 'Not available'}
+
+---
+
+## 📅 30-Day Action Plan
+{plan.action_plan or 'Not available'}
+
+---
+
+*Generated by Career Accelerator AI - Powered by CrewAI*
+"""
+
+
+def build_quick_reference(inputs: Dict[str, str], generated_at: datetime) -> str:
+    """Plain-text summary of the plan for quick reference"""
+    return f"""Career Plan Summary - {generated_at.strftime("%Y-%m-%d")}
+
+Goal: {inputs['career_goal']} in {inputs['industry']}
+
+Quick Action Items:
+1. Review skill gaps daily
+2. Enroll in recommended courses
+3. Complete Week 1 tasks
+4. Build first project
+5. Update resume and LinkedIn
+
+Time Commitment: {inputs['time_commitment']} hrs/week
+"""
@@ -0,0 +1,91 @@
+from typing import Any, Dict, List, Optional
+
+from newgroq.metrics import MetricsRegistry, registry
+from newgroq.settings import load_settings
+
+# Completion-token p95 must fit in a tier's max_tokens with this much room
+HEADROOM = 1.2
+
+
+def _routing() -> Dict[str, Any]:
+    return load_settings().get('routing', {})
+
+
+def tiers() -> Dict[str, Dict[str, Any]]:
+    """Tier name -> LLM parameters, smallest max_tokens first"""
+    configured = _routing().get('tiers', {})
+    return dict(sorted(configured.items(), key=lambda item: item[1].get('max_tokens', 0)))
+
+
+def task_route(task_name: str, default_model: Optional[str] = None) -> Dict[str, Any]:
+    """LLM parameters for one task.
+
+    The ``llm`` block of crewai.json supplies defaults, the task's tier
+    overrides them, and explicit values on the task's route win over both.
+    ``default_model`` (the agent's ``llm`` in agents.yaml) is used when the
+    route names no model.
+    """
+    settings = load_settings()
+    base = settings.get('llm', {})
+    route = dict(_routing().get('tasks', {}).get(task_name, {}))
+    tier_name = route.pop('tier', None)
+    params: Dict[str, Any] = {
+        'model': default_model or base.get('model'),
+        'temperature': base.get('temperature'),
+        'max_tokens': base.get('max_tokens'),
+    }
+    if tier_name is not None:
+        tier = tiers().get(tier_name)
+        if tier is None:
+            raise ValueError(f"Task {task_name!r} uses unknown tier {tier_name!r}")
+        params.update(tier)
+    params.update(route)
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def agent_tasks(tasks_config: Dict[str, Any]) -> Dict[str, str]:
+    """Agent name -> the task it performs, from the tasks.yaml ``agent`` keys"""
+    return {
+        config['agent']: task_name
+        for task_name, config in tasks_config.items()
+        if isinstance(config.get('agent'), str)
+    }
+
+
+def suggest_routes(metrics: MetricsRegistry = registry) -> List[Dict[str, Any]]:
+    """Per-task tier suggestions from observed completion tokens and latency.
+
+    A task is suggested the smallest tier whose max_tokens covers its p95
+    completion tokens with ``HEADROOM``; tasks whose p95 reaches their cap
+    are probably being truncated.
+    """
+    histograms = metrics.as_dict()['histograms']
+    latency = {
+        entry['labels'].get('task'): entry['quantiles']['0.95']
+        for entry in histograms.get('llm_call_seconds', [])
+    }
+    available = tiers()
+    suggestions = []
+    for entry in histograms.get('llm_completion_tokens', []):
+        task_name = entry['labels'].get('task')
+        if not task_name or task_name == 'unknown':
+            continue
+        p95 = entry['quantiles']['0.95']
+        current = task_route(task_name)
+        needed = p95 * HEADROOM
+        suggested = next(
+            (name for name, tier in available.items() if tier.get('max_tokens', 0) >= needed),
+            next(reversed(available), None),
+        )
+        suggestions.append({
+            'task': task_name,
+            'model': entry['labels'].get('model'),
+            'calls': entry['count'],
+            'p95_completion_tokens': p95,
+            'p95_call_seconds': latency.get(task_name, 0.0),
+            'max_tokens': current.get('max_tokens'),
+            'tier': _routing().get('tasks', {}).get(task_name, {}).get('tier'),
+            'suggested_tier': suggested,
+            'truncation_risk': bool(current.get('max_tokens')) and p95 >= 0.95 * current['max_tokens'],
+        })
+    return suggestions
@@ -0,0 +1,120 @@
+from typing import Any, Dict, List, Tuple
+
+SEQUENTIAL = "sequential"
+DAG = "dag"
+
+
+def task_dependencies(tasks_config: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """``depends_on`` lists from tasks.yaml, keyed by task name"""
+    return {
+        name: list(config.get('depends_on') or [])
+        for name, config in tasks_config.items()
+    }
+
+
+def dag_levels(dependencies: Dict[str, List[str]]) -> Dict[str, int]:
+    """Depth of each task in the dependency graph; tasks at one level are independent"""
+    levels: Dict[str, int] = {}
+
+    def visit(name: str, path: Tuple[str, ...] = ()) -> int:
+        if name in path:
+            raise ValueError(f"Task dependency cycle: {' -> '.join(path + (name,))}")
+        if name not in levels:
+            deps = dependencies.get(name, [])
+            levels[name] = 1 + max((visit(dep, path + (name,)) for dep in deps), default=-1)
+        return levels[name]
+
+    for name in dependencies:
+        visit(name)
+    return levels
+
+
+def apply_dag_schedule(tasks, dependencies: Dict[str, List[str]]):
+    """Wire explicit task dependencies and run independent tasks concurrently.
+
+    Each task gets its declared dependencies as ``context``. Tasks sharing a
+    dependency level with another task run with ``async_execution``; CrewAI
+    starts consecutive async tasks together and joins them at the next
+    synchronous task, which is why tasks must be listed level by level and
+    why each level after a parallel one needs a synchronous task to join it.
+    The last task always stays synchronous.
+    """
+    by_name = {task.name: task for task in tasks}
+    for name, deps in dependencies.items():
+        if name not in by_name:
+            continue
+        unknown = [dep for dep in deps if dep not in by_name]
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on unknown tasks: {', '.join(unknown)}")
+    levels = dag_levels({task.name: dependencies.get(task.name, []) for task in tasks})
+    order = [levels[task.name] for task in tasks]
+    if order != sorted(order):
+        raise ValueError("Tasks must be listed in dependency order, one level after another")
+    width = {level: order.count(level) for level in order}
+
+    for index, task in enumerate(tasks):
+        task.context = [by_name[dep] for dep in dependencies.get(task.name, [])]
+        task.async_execution = index + 1 < len(tasks) and width[levels[task.name]] > 1
+
+
+def critical_path(
+    durations: Dict[str, float],
+    dependencies: Dict[str, List[str]],
+) -> Tuple[float, List[str]]:
+    """Longest dependency chain by duration, and the tasks along it"""
+    finish: Dict[str, Tuple[float, List[str]]] = {}
+
+    def visit(name: str) -> Tuple[float, List[str]]:
+        if name not in finish:
+            upstream = [visit(dep) for dep in dependencies.get(name, []) if dep in durations]
+            start, path = max(upstream, default=(0.0, []))
+            finish[name] = (start + durations[name], path + [name])
+        return finish[name]
+
+    return max((visit(name) for name in durations), default=(0.0, []))
+
+
+def _duration(task) -> float:
+    start, end = getattr(task, 'start_time', None), getattr(task, 'end_time', None)
+    if start is None or end is None:
+        return 0.0
+    return (end - start).total_seconds()
+
+
+def crew_dependencies(tasks) -> Dict[str, List[str]]:
+    """Effective dependencies of built tasks: explicit context, else the previous task"""
+    dependencies = {}
+    for index, task in enumerate(tasks):
+        if isinstance(task.context, list):
+            dependencies[task.name] = [upstream.name for upstream in task.context]
+        else:
+            dependencies[task.name] = [tasks[index - 1].name] if index else []
+    return dependencies
+
+
+def timing_report(tasks) -> Dict[str, Any]:
+    """Per-task durations with sequential, critical-path and measured latency.
+
+    ``sequential_seconds`` is what the run costs one task after another;
+    ``critical_path_seconds`` is the lower bound under the tasks' dependencies;
+    ``wall_seconds`` is what the run actually took, first task start to last
+    task end, so ``overlap_seconds`` is the time parallel tasks really saved.
+    """
+    timed = [task for task in tasks if task.output is not None]
+    durations = {task.name: _duration(task) for task in timed}
+    latency, path = critical_path(durations, crew_dependencies(tasks))
+    spans = [
+        (task.start_time, task.end_time) for task in timed
+        if getattr(task, 'start_time', None) is not None and getattr(task, 'end_time', None) is not None
+    ]
+    wall = (max(end for _, end in spans) - min(start for start, _ in spans)).total_seconds() if spans else 0.0
+    sequential = sum(durations.values())
+    return {
+        'schedule': DAG if any(task.async_execution for task in tasks) else SEQUENTIAL,
+        'task_seconds': durations,
+        'sequential_seconds': sequential,
+        'critical_path_seconds': latency,
+        'critical_path': path,
+        'wall_seconds': wall,
+        'overlap_seconds': max(sequential - wall, 0.0) if spans else 0.0,
+    }
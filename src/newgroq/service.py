@@ -0,0 +1,287 @@
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+from newgroq.cache import ResultCache, cache_key
+from newgroq.history import PlanHistory
+from newgroq.jobs import JobManager
+from newgroq.metrics import Timer, registry
+from newgroq.pool import CrewPool
+from newgroq.progress import PlanProgress, attach_progress, detach_progress
+from newgroq.schedule import timing_report
+from newgroq.similarity import ProfileIndex
+from newgroq.singleflight import SingleFlight
+from newgroq.store import UserStore
+from newgroq.warehouse import PlanWarehouse
+
+# Minimum Jaccard similarity for reusing a stored plan for a new profile
+SIMILARITY_THRESHOLD = float(os.environ.get("NEWGROQ_SIMILARITY_THRESHOLD", "0.8"))
+CREW_POOL_SIZE = int(os.environ.get("NEWGROQ_CREW_POOL_SIZE", "4"))
+JOB_WORKERS = int(os.environ.get("NEWGROQ_JOB_WORKERS", "4"))
+# Import crewai and pre-build crews in the background at startup
+PREWARM = os.environ.get("NEWGROQ_PREWARM", "1") != "0"
+# Concurrent requests for the same profile share one crew run; "0" disables
+COALESCE = os.environ.get("NEWGROQ_COALESCE", "1") != "0"
+
+_cache: Optional[ResultCache] = None
+_task_memo: Optional[ResultCache] = None
+_profile_index: Optional[ProfileIndex] = None
+_crew_pool: Optional[CrewPool] = None
+_job_manager: Optional[JobManager] = None
+_user_store: Optional[UserStore] = None
+_plan_history: Optional[PlanHistory] = None
+_plan_warehouse: Optional[PlanWarehouse] = None
+_single_flight: Optional[SingleFlight] = None
+_lock = threading.Lock()
+
+
+def get_cache() -> ResultCache:
+    """Process-wide result cache shared by every session"""
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = ResultCache()
+            registry.register_collector("plan_cache", _cache.stats.as_dict)
+    return _cache
+
+
+def get_task_memo() -> ResultCache:
+    """Per-task output cache used to re-run only the changed pipeline suffix"""
+    global _task_memo
+    with _lock:
+        if _task_memo is None:
+            _task_memo = ResultCache(max_entries=1024, namespace="tasks")
+            registry.register_collector("task_memo", _task_memo.stats.as_dict)
+    return _task_memo
+
+
+def get_profile_index() -> ProfileIndex:
+    """Near-duplicate index over every plan in the result cache"""
+    global _profile_index
+    # Outside the lock: get_cache takes it too
+    cache = get_cache()
+    with _lock:
+        if _profile_index is None:
+            _profile_index = ProfileIndex(threshold=SIMILARITY_THRESHOLD)
+            if cache.cache_dir:
+                _profile_index.load_cache_dir(cache.cache_dir)
+    return _profile_index
+
+
+def get_crew_pool() -> CrewPool:
+    """Process-wide pool of pre-built Newgroq crews"""
+    global _crew_pool
+    with _lock:
+        if _crew_pool is None:
+            _crew_pool = CrewPool(size=CREW_POOL_SIZE)
+            registry.register_collector("crew_pool", _crew_pool.stats)
+    return _crew_pool
+
+
+def run_crew(inputs: Dict[str, Any], progress: Optional[PlanProgress] = None) -> Dict[str, Any]:
+    """Kick off a pooled Newgroq crew and return the plan payload"""
+    from newgroq.llm import crew_token_usage
+    from newgroq.memo import kickoff_memoized
+    from newgroq.taxonomy import precomputed_outputs, with_skill_gap_facts
+
+    # The memo resume path interpolates directly, bypassing before_kickoff hooks
+    inputs = with_skill_gap_facts(inputs)
+    with get_crew_pool().checkout() as crew:
+        if progress is not None:
+            attach_progress(crew, progress)
+        # Pooled crews keep their LLMs, so usage is the difference over this run
+        prompt_before, completion_before = crew_token_usage(crew)
+        saved_before = getattr(crew, 'context_tokens_saved', 0)
+        try:
+            plan = kickoff_memoized(crew, inputs, get_task_memo(), precomputed_outputs(inputs))
+        finally:
+            if progress is not None:
+                detach_progress(crew)
+        prompt_after, completion_after = crew_token_usage(crew)
+        plan['tokens'] = {
+            'prompt': prompt_after - prompt_before,
+            'completion': completion_after - completion_before,
+            'context_saved': getattr(crew, 'context_tokens_saved', 0) - saved_before,
+        }
+        plan['timings'] = timing_report(crew.tasks)
+        for task_name, seconds in plan['timings']['task_seconds'].items():
+            if seconds:
+                registry.observe("task_seconds", seconds, {'task': task_name})
+        if plan['timings']['wall_seconds']:
+            labels = {'schedule': plan['timings']['schedule']}
+            registry.observe("crew_wall_seconds", plan['timings']['wall_seconds'], labels)
+            registry.observe("crew_overlap_seconds", plan['timings']['overlap_seconds'], labels)
+        return plan
+
+
+def generate_plan(
+    inputs: Dict[str, Any],
+    use_cache: bool = True,
+    progress: Optional[PlanProgress] = None,
+    user_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return the plan for ``inputs``, serving repeats from the result cache.
+
+    Stock sidebar profiles are served from the precomputed plan warehouse,
+    exact repeats by the result cache, and profiles close enough to a
+    stored one (see ``SIMILARITY_THRESHOLD``) reuse its plan. A request
+    for a profile whose plan is already being generated waits for that run
+    instead of starting another. The returned payload has a ``cached``
+    flag, ``coalesced`` when it shared another request's run and, for
+    near-duplicates, the ``similarity`` of the matched profile. ``progress``
+    receives each task's output as soon as it completes. Whatever its
+    source, the plan is recorded in ``user_id``'s history.
+    """
+    cache = get_cache()
+    index = get_profile_index()
+    if use_cache:
+        with Timer("plan_lookup_seconds", {'source': 'warehouse'}):
+            plan = get_plan_warehouse().get(inputs)
+        if plan is not None:
+            registry.inc("plan_requests_total", labels={'source': 'warehouse'})
+            if progress is not None:
+                progress.complete_plan(plan)
+            _record_served(inputs, plan, user_id)
+            return dict(plan, cached=True)
+        with Timer("plan_lookup_seconds"):
+            plan = cache.get(inputs)
+            match = index.query(inputs) if plan is None else None
+            if match is not None:
+                key, similarity = match
+                plan = cache.get_by_key(key)
+        if plan is not None:
+            source = 'similar' if match is not None else 'cache'
+            registry.inc("plan_requests_total", labels={'source': source})
+            if progress is not None:
+                progress.complete_plan(plan)
+            _record_served(inputs, plan, user_id)
+            if match is not None:
+                return dict(plan, cached=True, similarity=similarity)
+            return dict(plan, cached=True)
+
+    if not COALESCE:
+        return dict(_generate(inputs, progress, user_id), cached=False)
+
+    # Every joined request follows the one shared run's progress
+    shared = PlanProgress()
+    if progress is not None:
+        shared.add_mirror(progress)
+    plan, coalesced = get_single_flight().do(
+        cache_key(inputs),
+        lambda: _generate(inputs, shared, user_id),
+        state=shared,
+        on_join=None if progress is None else lambda leader: leader.add_mirror(progress),
+    )
+    if coalesced:
+        registry.inc("plan_requests_total", labels={'source': 'coalesced'})
+        _record_served(inputs, plan, user_id)
+        return dict(plan, cached=False, coalesced=True)
+    return dict(plan, cached=False)
+
+
+def join_plan(
+    inputs: Dict[str, Any],
+    progress: Optional[PlanProgress] = None,
+    user_id: Optional[str] = None,
+) -> Optional[Future]:
+    """Future for an in-flight crew run of ``inputs``, or None if there is none to join.
+
+    Resolves to the same payload ``generate_plan`` would return for a
+    coalesced request, so a job can follow the run without holding a worker.
+    """
+    if not COALESCE:
+        return None
+    flight = get_single_flight().join(
+        cache_key(inputs),
+        on_join=None if progress is None else lambda leader: leader.add_mirror(progress),
+    )
+    if flight is None:
+        return None
+    registry.inc("plan_requests_total", labels={'source': 'coalesced'})
+    joined: Future = Future()
+
+    def publish(done: Future):
+        # The joiner's future can be cancelled on its own; the shared run is not
+        if not joined.set_running_or_notify_cancel():
+            return
+        if done.exception() is not None:
+            joined.set_exception(done.exception())
+        else:
+            _record_served(inputs, done.result(), user_id)
+            joined.set_result(dict(done.result(), cached=False, coalesced=True))
+
+    flight.add_done_callback(publish)
+    return joined
+
+
+def _record_served(inputs: Dict[str, Any], plan: Dict[str, Any], user_id: Optional[str]):
+    """Add a plan served without running the crew to ``user_id``'s history"""
+    if user_id is not None:
+        # The tokens were spent by the run that produced the plan, not this request
+        get_plan_history().record(inputs, dict(plan, tokens=None), user_id)
+
+
+def _generate(
+    inputs: Dict[str, Any],
+    progress: Optional[PlanProgress],
+    user_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run the crew and record the plan in the history, result cache and profile index"""
+    registry.inc("plan_requests_total", labels={'source': 'crew'})
+    with Timer("plan_generation_seconds"):
+        plan = run_crew(inputs, progress)
+    get_plan_history().record(inputs, plan, user_id)
+    key = get_cache().set(inputs, plan)
+    get_profile_index().add(inputs, key)
+    return plan
+
+
+def get_single_flight() -> SingleFlight:
+    """In-flight crew runs keyed by normalized profile, shared by identical requests"""
+    global _single_flight
+    with _lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+            registry.register_collector("single_flight", _single_flight.stats)
+    return _single_flight
+
+
+def get_job_manager() -> JobManager:
+    """Background plan generation shared by every Streamlit session"""
+    global _job_manager
+    with _lock:
+        if _job_manager is None:
+            _job_manager = JobManager(generate_plan, max_workers=JOB_WORKERS, join=join_plan)
+            registry.register_collector("jobs", _job_manager.stats)
+    return _job_manager
+
+
+def get_user_store() -> UserStore:
+    """Progress, resources and feedback saved from the results page"""
+    global _user_store
+    with _lock:
+        if _user_store is None:
+            _user_store = UserStore()
+            registry.register_collector("user_store", _user_store.stats)
+    return _user_store
+
+
+def get_plan_history() -> PlanHistory:
+    """Searchable record of every plan the crew has generated"""
+    global _plan_history
+    with _lock:
+        if _plan_history is None:
+            _plan_history = PlanHistory()
+            registry.register_collector("plan_history", _plan_history.stats)
+    return _plan_history
+
+
+def get_plan_warehouse() -> PlanWarehouse:
+    """Precomputed plans for the stock sidebar profiles, mapped once per process"""
+    global _plan_warehouse
+    with _lock:
+        if _plan_warehouse is None:
+            _plan_warehouse = PlanWarehouse()
+            registry.register_collector("plan_warehouse", _plan_warehouse.stats)
+    return _plan_warehouse
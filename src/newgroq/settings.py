@@ -0,0 +1,18 @@
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SETTINGS_PATH = Path(os.environ.get("NEWGROQ_SETTINGS", PROJECT_ROOT / "crewai.json"))
+
+
+@lru_cache(maxsize=None)
+def load_settings() -> Dict[str, Any]:
+    """Project settings from crewai.json, read once per process"""
+    try:
+        with open(SETTINGS_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
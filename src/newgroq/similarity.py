@@ -0,0 +1,154 @@
+import json
+import random
+import re
+import threading
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from newgroq.cache import normalize_inputs
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD_RE = re.compile(r"[a-z0-9+#.]+")
+_STOPWORDS = {"and", "or", "the", "of", "in", "with", "basic", "basics", "some"}
+
+
+def profile_tokens(inputs: Dict[str, Any]) -> FrozenSet[str]:
+    """Token set describing a profile for near-duplicate matching.
+
+    Skills are split into lowercase words so "Basic ML algorithms" and
+    "ML" still overlap; career goal words and the industry are prefixed so
+    they never collide with skill words.
+    """
+    normalized = normalize_inputs(inputs)
+    tokens = set()
+    for word in _WORD_RE.findall(normalized['current_skills']):
+        word = word.strip(".")
+        if word and word not in _STOPWORDS:
+            tokens.add(word)
+    for word in _WORD_RE.findall(normalized['career_goal']):
+        tokens.add(f"goal:{word}")
+    if normalized['industry']:
+        tokens.add(f"industry:{normalized['industry']}")
+    return frozenset(tokens)
+
+
+def profile_exact(inputs: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Fields a reused plan must match exactly: hours, experience and education"""
+    normalized = normalize_inputs(inputs)
+    return normalized['time_commitment'], normalized['experience_level'], normalized['education']
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """MinHash signatures using universal hashing over CRC32 token hashes"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+        # Vocabularies are small (skill words, goals, industries), so the
+        # per-token permutation vectors are worth memoizing
+        self._token_hashes = lru_cache(maxsize=65536)(self._permute)
+
+    def _permute(self, token: str) -> Tuple[int, ...]:
+        h = zlib.crc32(token.encode("utf-8"))
+        return tuple(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in self._perms)
+
+    def signature(self, tokens: FrozenSet[str]) -> Tuple[int, ...]:
+        vectors = [self._token_hashes(t) for t in tokens] or [self._permute("")]
+        if len(vectors) == 1:
+            return vectors[0]
+        return tuple(map(min, *vectors))
+
+
+class ProfileIndex:
+    """MinHash/LSH index from profile token sets to cached plan keys.
+
+    Signatures are split into ``bands`` bands of ``num_perm // bands`` rows;
+    profiles sharing any band bucket become candidates, and candidates are
+    verified with exact Jaccard similarity against ``threshold``. Only
+    profiles with the same ``profile_exact`` fields share buckets, since a
+    plan for other weekly hours or another background is not a near match.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 8):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._tokens: List[FrozenSet[str]] = []
+        self._exact: List[Tuple[str, ...]] = []
+        self._keys: List[str] = []
+        self._items: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _band_hashes(self, signature: Tuple[int, ...], exact: Tuple[str, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, hash((exact, signature[band * rows:(band + 1) * rows]))
+
+    def add(self, inputs: Dict[str, Any], key: str):
+        self.add_tokens(profile_tokens(inputs), key, profile_exact(inputs))
+
+    def add_tokens(self, tokens: FrozenSet[str], key: str, exact: Tuple[str, ...] = ()):
+        signature = self.hasher.signature(tokens)
+        with self._lock:
+            if key in self._items:
+                return
+            item = len(self._keys)
+            self._items[key] = item
+            self._keys.append(key)
+            self._tokens.append(tokens)
+            self._exact.append(exact)
+            for band, bucket in self._band_hashes(signature, exact):
+                self._buckets[band].setdefault(bucket, []).append(item)
+
+    def query(self, inputs: Dict[str, Any]) -> Optional[Tuple[str, float]]:
+        """Best (cache key, similarity) at or above the threshold, if any"""
+        tokens = profile_tokens(inputs)
+        exact = profile_exact(inputs)
+        signature = self.hasher.signature(tokens)
+        candidates = set()
+        for band, bucket in self._band_hashes(signature, exact):
+            candidates.update(self._buckets[band].get(bucket, ()))
+
+        best = None
+        for item in candidates:
+            # Bucket hashes can collide, so check the exact fields too
+            if self._exact[item] != exact:
+                continue
+            score = jaccard(tokens, self._tokens[item])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (self._keys[item], score)
+        return best
+
+    def load_cache_dir(self, plans_dir: Path) -> int:
+        """Index every plan stored by ResultCache under ``plans_dir``"""
+        count = 0
+        for path in Path(plans_dir).glob("*.json"):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if 'inputs' in record:
+                self.add(record['inputs'], path.stem)
+                count += 1
+        return count
@@ -0,0 +1,96 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Flight:
+    def __init__(self, state: Any):
+        self.future: Future = Future()
+        # A running future cannot be cancelled, so no waiter can cancel the shared call
+        self.future.set_running_or_notify_cancel()
+        self.state = state
+        self.waiters = 1
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the call on its own thread; callers that
+    arrive while it is in flight wait on the same future and get its result
+    or exception. ``join`` hands out that future instead of blocking, for
+    callers that should not hold a thread while they wait. A waiter that
+    gives up (``timeout``) stops waiting but cannot cancel the shared call,
+    which runs on for its leader; the key is released when the call
+    finishes, so later callers start a fresh one.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        state: Any = None,
+        on_join: Optional[Callable[[Any], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, bool]:
+        """Result of ``fn`` for ``key``, and whether it was shared from an in-flight call.
+
+        ``state`` is kept with a new flight and handed to ``on_join`` for each
+        caller that joins it (e.g. to follow the leader's progress).
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(state)
+                self.leaders += 1
+            else:
+                flight.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            if on_join is not None:
+                on_join(flight.state)
+            return flight.future.result(timeout=timeout), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._land(key, flight)
+            flight.future.set_exception(e)
+            raise
+        self._land(key, flight)
+        flight.future.set_result(result)
+        return result, False
+
+    def join(self, key: str, on_join: Optional[Callable[[Any], None]] = None) -> Optional[Future]:
+        """Future of the in-flight call for ``key``, or None if nothing is in flight"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                return None
+            flight.waiters += 1
+            self.coalesced += 1
+        if on_join is not None:
+            on_join(flight.state)
+        return flight.future
+
+    def _land(self, key: str, flight: _Flight):
+        # Released before the result is published, so no one joins a finished call
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'in_flight': len(self._flights),
+                'joined': sum(flight.waiters - 1 for flight in self._flights.values()),
+                'leaders': self.leaders,
+                'coalesced': self.coalesced,
+            }
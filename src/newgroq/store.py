@@ -0,0 +1,263 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from newgroq.cache import DEFAULT_CACHE_DIR
+
+DEFAULT_STORE_PATH = Path(os.environ.get("NEWGROQ_STORE_PATH", DEFAULT_CACHE_DIR / "user_data.db"))
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    user_id TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    week TEXT NOT NULL,
+    progress INTEGER NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (user_id, plan_id, week)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resources_user_plan ON resources (user_id, plan_id);
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    rating TEXT NOT NULL,
+    comment TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS feedback_user_plan ON feedback (user_id, plan_id);
+"""
+
+# One statement per table; executemany reuses the prepared statement per batch
+_WRITES = {
+    'progress': (
+        "INSERT INTO progress (user_id, plan_id, week, progress, notes, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (user_id, plan_id, week) DO UPDATE SET "
+        "progress = excluded.progress, notes = excluded.notes, updated_at = excluded.updated_at"
+    ),
+    'resources': "INSERT INTO resources (user_id, plan_id, name, url, created_at) VALUES (?, ?, ?, ?, ?)",
+    'feedback': "INSERT INTO feedback (user_id, plan_id, rating, comment, created_at) VALUES (?, ?, ?, ?, ?)",
+}
+
+
+class UserStore:
+    """Progress, saved resources and feedback per (user, plan) in SQLite.
+
+    The database runs in WAL mode so readers never block the writer. Writes
+    are queued and committed by one background thread in batches of up to
+    ``batch_size`` rows (or every ``flush_interval`` seconds), so many
+    sessions recording progress share a few short transactions instead of
+    contending for the write lock. Reads wait for pending writes first.
+
+    A batch that fails to commit is rolled back and its rows are retried one
+    at a time, so a bad row drops only itself. Failed rows are logged, and
+    ``flush`` raises their error in the thread that queued them; reads never
+    raise for failed writes.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_STORE_PATH,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        # (table, row, ident of the queueing thread)
+        self._pending: List[Tuple[str, tuple, int]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        # Rows ever queued and rows committed or failed, so a flush knows which batches it waits on
+        self._queued = 0
+        self._finished = 0
+        # (row number, queueing thread, error) of recently failed rows
+        self._failures: deque = deque(maxlen=256)
+        self.batches = 0
+        self.failed_batches = 0
+        self.failed_rows = 0
+        self.rows_written = 0
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        self._writer = threading.Thread(target=self._write_loop, name="user-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _enqueue(self, table: str, row: tuple):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("UserStore is closed")
+            self._pending.append((table, row, threading.get_ident()))
+            self._queued += 1
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            with self._cond:
+                if not self._pending and not self._closed:
+                    self._cond.wait(self.flush_interval)
+                if not self._pending:
+                    if self._closed:
+                        return
+                    continue
+                batch = self._pending[:self.batch_size]
+                del self._pending[:self.batch_size]
+
+            failed = self._commit(conn, batch)
+            with self._cond:
+                first = self._finished + 1
+                self._finished += len(batch)
+                self.batches += 1
+                self.rows_written += len(batch) - len(failed)
+                if failed:
+                    self.failed_batches += 1
+                    self.failed_rows += len(failed)
+                for index, error in failed:
+                    self._failures.append((first + index, batch[index][2], error))
+                self._cond.notify_all()
+
+    def _commit(self, conn: sqlite3.Connection, batch: List[Tuple[str, tuple, int]]) -> List[Tuple[int, Exception]]:
+        """Write ``batch`` in one transaction, falling back to a row at a time.
+
+        Returns the index and error of every row that could not be written.
+        """
+        by_table: Dict[str, List[tuple]] = {}
+        for table, row, _ in batch:
+            by_table.setdefault(table, []).append(row)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for table, rows in by_table.items():
+                conn.executemany(_WRITES[table], rows)
+            conn.execute("COMMIT")
+            return []
+        except Exception:
+            logger.warning("UserStore batch of %d writes failed; retrying them one by one", len(batch), exc_info=True)
+            self._rollback(conn)
+        failed = []
+        # Autocommit: each row is its own transaction
+        for index, (table, row, _) in enumerate(batch):
+            try:
+                conn.execute(_WRITES[table], row)
+            except Exception as e:
+                logger.exception("UserStore dropped a write to %s", table)
+                self._rollback(conn)
+                failed.append((index, e))
+        return failed
+
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection):
+        if conn.in_transaction:
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                logger.exception("UserStore rollback failed")
+
+    def _wait(self, timeout: float = 30.0) -> Optional[int]:
+        """Wait for every write queued so far; the number of rows queued by then, or None on timeout"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            target = self._queued
+            self._cond.notify_all()
+            while self._finished < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+        return target
+
+    def flush(self, timeout: float = 30.0):
+        """Block until every queued write is committed.
+
+        Raises the error of any write this thread queued that could not be
+        committed and has not been reported by an earlier flush.
+        """
+        target = self._wait(timeout)
+        if target is None:
+            raise TimeoutError("UserStore writes did not flush in time")
+        reported, self._local.reported = getattr(self._local, 'reported', 0), target
+        me = threading.get_ident()
+        with self._cond:
+            errors = [error for row, owner, error in self._failures if reported < row <= target and owner == me]
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+
+    def save_progress(self, user_id: str, plan_id: str, week: str, progress: int, notes: str = ""):
+        self._enqueue('progress', (user_id, plan_id, week, int(progress), notes, time.time()))
+
+    def add_resource(self, user_id: str, plan_id: str, name: str, url: str = ""):
+        self._enqueue('resources', (user_id, plan_id, name, url, time.time()))
+
+    def add_feedback(self, user_id: str, plan_id: str, rating: str, comment: str = ""):
+        self._enqueue('feedback', (user_id, plan_id, rating, comment, time.time()))
+
+    def progress(self, user_id: str, plan_id: str) -> Dict[str, Dict[str, Any]]:
+        """Latest progress and notes per week"""
+        self._wait()
+        rows = self._connect().execute(
+            "SELECT week, progress, notes FROM progress WHERE user_id = ? AND plan_id = ? ORDER BY week",
+            (user_id, plan_id),
+        )
+        return {week: {'progress': progress, 'notes': notes} for week, progress, notes in rows}
+
+    def resources(self, user_id: str, plan_id: str) -> List[Dict[str, str]]:
+        self._wait()
+        rows = self._connect().execute(
+            "SELECT name, url FROM resources WHERE user_id = ? AND plan_id = ? ORDER BY id",
+            (user_id, plan_id),
+        )
+        return [{'name': name, 'url': url} for name, url in rows]
+
+    def feedback(self, user_id: str, plan_id: str) -> Optional[Dict[str, str]]:
+        """Most recent feedback the user left on a plan"""
+        self._wait()
+        row = self._connect().execute(
+            "SELECT rating, comment FROM feedback WHERE user_id = ? AND plan_id = ? ORDER BY id DESC LIMIT 1",
+            (user_id, plan_id),
+        ).fetchone()
+        return {'rating': row[0], 'comment': row[1]} if row else None
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            'pending_writes': pending,
+            'batches': self.batches,
+            'failed_batches': self.failed_batches,
+            'failed_rows': self.failed_rows,
+            'rows_written': self.rows_written,
+        }
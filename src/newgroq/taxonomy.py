@@ -0,0 +1,249 @@
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from newgroq.metrics import registry
+
+TAXONOMY_PATH = Path(__file__).resolve().parent / "data" / "skills.json"
+
+# "phrase": the analyzer LLM only words the computed gap;
+# "fast": the computed gap is the task output and the LLM call is skipped
+PHRASE = "phrase"
+FAST = "fast"
+SKILL_GAP_MODE = os.environ.get("NEWGROQ_SKILL_GAP_MODE", PHRASE)
+
+# How many gaps of each category the skill gap task asks for
+GAP_LIMITS = {'technical': 3, 'soft': 2, 'domain': 2}
+_CATEGORY_TITLES = {'technical': "Technical Skill Gaps", 'soft': "Soft Skill Gaps", 'domain': "Domain Skill Gaps"}
+_PRIORITIES = ("High", "Medium", "Low")
+# Seniority words are stripped before matching a role; they add these skills instead
+_SENIORITY_RE = re.compile(r"\b(senior|sr|lead|staff|principal|head)\b\.?", re.IGNORECASE)
+_SENIOR_SKILLS = ("leadership", "mentoring")
+_JUNIOR_RE = re.compile(r"\b(junior|jr|entry[- ]level|associate|intern|trainee|graduate)\b\.?", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"[a-z0-9+#&]+(?:[./\-][a-z0-9+#&]+)*")
+_ITEM_SPLIT_RE = re.compile(r"[,;\n|]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words, keeping joined forms like "ci/cd", "node.js" and "t-sql" whole"""
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+class AliasTrie:
+    """Token trie mapping multi-word aliases to an id, matched longest-first"""
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    def add(self, alias: str, value: str):
+        node = self._root
+        for token in tokenize(alias):
+            node = node.setdefault(token, {})
+        node[None] = value
+
+    def matches(self, tokens: List[str]) -> List[Tuple[int, int, str]]:
+        """Non-overlapping (start, end, id) spans, preferring the longest alias at each position"""
+        spans = []
+        start = 0
+        while start < len(tokens):
+            node, best = self._root, None
+            for end in range(start, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                if None in node:
+                    best = (start, end + 1, node[None])
+            if best is None:
+                start += 1
+            else:
+                spans.append(best)
+                start = best[1]
+        return spans
+
+
+@dataclass
+class SkillGap:
+    """Result of diffing a profile's skills against its target role"""
+
+    role: str
+    gaps: Dict[str, List[Tuple[str, str]]]
+    strengths: List[str]
+    unknown: List[str]
+    certifications: List[str]
+    seniority: str = ""
+    missing: int = 0
+    required: int = 0
+
+    def coverage(self) -> float:
+        return 1 - self.missing / self.required if self.required else 1.0
+
+    def facts(self) -> str:
+        """Computed gap as plain lines for the analyzer's prompt"""
+        lines = [f"Target role: {self.role}" + (f" ({self.seniority})" if self.seniority else "")]
+        for category, gaps in self.gaps.items():
+            names = ", ".join(f"{name} [{priority}]" for name, priority in gaps) or "none"
+            lines.append(f"{category.capitalize()} gaps: {names}")
+        lines.append(f"Already has: {', '.join(self.strengths) or 'none of the role skills'}")
+        if self.unknown:
+            lines.append(f"Also listed (not in the taxonomy): {', '.join(self.unknown)}")
+        if self.certifications:
+            lines.append(f"Key certifications: {', '.join(self.certifications)}")
+        return "\n".join(lines)
+
+    def to_markdown(self) -> str:
+        """The skill gap task's output, written without the LLM"""
+        lines = [f"## Skill Gap Analysis: {self.role}", ""]
+        for category, gaps in self.gaps.items():
+            lines.append(f"### {_CATEGORY_TITLES[category]}")
+            if gaps:
+                lines += [f"- **{name}** ({priority} priority)" for name, priority in gaps]
+            else:
+                lines.append("- No gaps: already covered")
+            lines.append("")
+        lines.append("### Current Strengths")
+        lines += [f"- {name}" for name in self.strengths] or ["- None of the core role skills yet"]
+        if self.certifications:
+            lines += ["", "### Key Certifications"]
+            lines += [f"- {name}" for name in self.certifications]
+        lines += ["", f"Coverage of core {self.role} skills: {self.coverage():.0%}"]
+        return "\n".join(lines)
+
+
+class SkillTaxonomy:
+    """Canonical skills and role requirements from skills.json, diffed as bitsets.
+
+    Every canonical skill gets one bit; a role's required skills and a
+    profile's normalized skills are ints, so the gap is ``required & ~have``.
+    """
+
+    def __init__(self, path: Path = TAXONOMY_PATH):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.skills: Dict[str, Dict[str, Any]] = data['skills']
+        self.roles: Dict[str, Dict[str, Any]] = data['roles']
+        self.industries: Dict[str, List[str]] = {
+            name.lower(): skills for name, skills in data.get('industries', {}).items()
+        }
+        self._bits = {skill_id: 1 << index for index, skill_id in enumerate(self.skills)}
+        self._skill_trie = AliasTrie()
+        for skill_id, skill in self.skills.items():
+            for alias in [skill['name'], *skill.get('aliases', [])]:
+                self._skill_trie.add(alias, skill_id)
+        self._role_trie = AliasTrie()
+        self._role_masks: Dict[str, int] = {}
+        for role_id, role in self.roles.items():
+            for alias in [role['name'], *role.get('aliases', [])]:
+                self._role_trie.add(alias, role_id)
+            self._role_masks[role_id] = self.mask(role['skills'])
+
+    def mask(self, skill_ids: List[str]) -> int:
+        value = 0
+        for skill_id in skill_ids:
+            value |= self._bits[skill_id]
+        return value
+
+    def normalize(self, skills: str) -> Tuple[List[str], List[str]]:
+        """Canonical skill ids in a comma-separated skills string, and the items that matched none"""
+        found: Dict[str, None] = {}
+        unknown = []
+        for item in _ITEM_SPLIT_RE.split(str(skills)):
+            spans = self._skill_trie.matches(tokenize(item))
+            if not spans and item.strip():
+                unknown.append(item.strip())
+            for _, _, skill_id in spans:
+                found[skill_id] = None
+        return list(found), unknown
+
+    def match_role(self, career_goal: str) -> Optional[str]:
+        """Role id for a free-text career goal, by its longest matching alias"""
+        spans = self._role_trie.matches(tokenize(_SENIORITY_RE.sub(" ", _JUNIOR_RE.sub(" ", career_goal))))
+        if not spans:
+            return None
+        return max(spans, key=lambda span: span[1] - span[0])[2]
+
+    def analyze(self, inputs: Dict[str, Any]) -> Optional[SkillGap]:
+        """Skill gap for a profile, or None when its career goal matches no known role"""
+        career_goal = str(inputs.get('career_goal', ""))
+        role_id = self.match_role(career_goal)
+        if role_id is None:
+            return None
+        role = self.roles[role_id]
+        seniority = ""
+        order = list(role['skills'])
+        if _SENIORITY_RE.search(career_goal):
+            seniority = "senior"
+            order += [skill for skill in _SENIOR_SKILLS if skill not in order]
+        elif _JUNIOR_RE.search(career_goal):
+            seniority = "junior"
+        order += [
+            skill for skill in self.industries.get(str(inputs.get('industry', "")).strip().lower(), [])
+            if skill not in order
+        ]
+
+        have_ids, unknown = self.normalize(inputs.get('current_skills', ""))
+        required = self._role_masks[role_id] | self.mask(order[len(role['skills']):])
+        gap = required & ~self.mask(have_ids)
+
+        gaps: Dict[str, List[Tuple[str, str]]] = {category: [] for category in GAP_LIMITS}
+        missing = [skill_id for skill_id in order if gap & self._bits[skill_id]]
+        # Priority follows the skill's rank within its category, so each list leads with High
+        for skill_id in missing:
+            skill = self.skills[skill_id]
+            listed = gaps[skill['category']]
+            if len(listed) < GAP_LIMITS[skill['category']]:
+                listed.append((skill['name'], _PRIORITIES[min(len(listed), len(_PRIORITIES) - 1)]))
+        strengths = [self.skills[skill_id]['name'] for skill_id in have_ids]
+        return SkillGap(
+            role=role['name'],
+            gaps=gaps,
+            strengths=strengths,
+            unknown=unknown,
+            certifications=list(role.get('certifications', []))[:2],
+            seniority=seniority,
+            missing=len(missing),
+            required=bin(required).count("1"),
+        )
+
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """Process-wide skill taxonomy, loaded on first use"""
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            _taxonomy = SkillTaxonomy()
+    return _taxonomy
+
+
+def skill_gap_facts(inputs: Dict[str, Any]) -> str:
+    """The ``{skill_gap_facts}`` text for the skill gap task's prompt"""
+    gap = get_taxonomy().analyze(inputs)
+    if gap is None:
+        # Unknown role: the analyzer works out the gap itself, as before
+        return f"Current skills: {inputs.get('current_skills', '') or 'none listed'}"
+    return gap.facts()
+
+
+def with_skill_gap_facts(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """``inputs`` plus ``skill_gap_facts``, unless already supplied"""
+    if 'skill_gap_facts' in inputs:
+        return inputs
+    return dict(inputs, skill_gap_facts=skill_gap_facts(inputs))
+
+
+def precomputed_outputs(inputs: Dict[str, Any], mode: str = SKILL_GAP_MODE) -> Dict[str, str]:
+    """Task outputs that need no LLM call: the skill gap in fast mode, when the role is known"""
+    if mode != FAST:
+        return {}
+    gap = get_taxonomy().analyze(inputs)
+    registry.inc("skill_gap_fast_path_total", labels={'result': 'hit' if gap is not None else 'unknown_role'})
+    if gap is None:
+        return {}
+    return {'skill_gap_analysis_task': gap.to_markdown()}
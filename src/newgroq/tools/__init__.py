@@ -0,0 +1,3 @@
+from newgroq.tools.course_search_tool import CourseSearchTool
+
+__all__ = ["CourseSearchTool"]
@@ -0,0 +1,50 @@
+from crewai.tools import BaseTool
+from typing import List, Optional, Type
+from pydantic import BaseModel, Field, field_validator
+
+from newgroq.catalog import format_results, get_course_index
+
+
+class CourseSearchInput(BaseModel):
+    """Input schema for CourseSearchTool."""
+    skills: List[str] = Field(
+        ..., description="Every skill or topic to find courses for, e.g. ['MLOps', 'Kubernetes']."
+    )
+    level: Optional[str] = Field(None, description="Learner level: beginner, intermediate or advanced.")
+
+    @field_validator('skills', mode='before')
+    @classmethod
+    def split_skills(cls, value):
+        # Models sometimes pass one comma-separated string instead of a list
+        if isinstance(value, str):
+            return value.split(",")
+        return value
+
+
+class CourseSearchTool(BaseTool):
+    name: str = "Course Catalog Search"
+    description: str = (
+        "Finds real courses, certifications, books and practice projects for a list of skills in the "
+        "bundled course catalog, optionally filtered by level. Returns a section per skill with one line "
+        "per resource: provider, type, level, estimated hours and URL. Call it once with every skill gap "
+        "instead of recalling courses."
+    )
+    args_schema: Type[BaseModel] = CourseSearchInput
+    limit: int = 3
+    max_skills: int = 12
+
+    def _run(self, skills: List[str], level: Optional[str] = None) -> str:
+        index = get_course_index()
+        sections = []
+        seen = set()
+        for skill in skills:
+            skill = skill.strip()
+            if not skill or skill.lower() in seen:
+                continue
+            if len(seen) == self.max_skills:
+                break
+            seen.add(skill.lower())
+            results = index.search(skill, level, self.limit)
+            body = format_results(results) if results else "No catalog entries; suggest a hands-on project instead."
+            sections.append(f"### {skill}\n{body}")
+        return "\n\n".join(sections) or "No skills given. Pass every skill gap in one call."
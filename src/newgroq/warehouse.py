@@ -0,0 +1,282 @@
+import bisect
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from newgroq.cache import DEFAULT_CACHE_DIR, _normalize_text, normalize_skills
+from newgroq.settings import load_settings
+
+DEFAULT_WAREHOUSE_PATH = Path(os.environ.get("NEWGROQ_WAREHOUSE_PATH", DEFAULT_CACHE_DIR / "warehouse.bin"))
+
+MAGIC = b"NGWH"
+VERSION = 1
+# magic, version, entry count, built_at
+_HEADER = struct.Struct("<4sHId")
+# key digest, blob offset, blob length, generated_at
+_ENTRY = struct.Struct("<16sQId")
+
+_YEARS_RE = re.compile(r"(\d+(?:\.\d+)?)\s*\+?\s*(?:years?|yrs?)", re.IGNORECASE)
+# Seconds between checks for a warehouse file rebuilt by another process
+_RELOAD_CHECK_SECONDS = 30.0
+
+
+def warehouse_settings() -> Dict[str, Any]:
+    return load_settings().get('warehouse', {})
+
+
+def experience_bucket(experience_level: str, buckets: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    """Bucket whose ``max_years`` first covers the years in ``experience_level``.
+
+    Text without a number of years only matches a bucket's own
+    representative ``experience_level``.
+    """
+    match = _YEARS_RE.search(str(experience_level))
+    if match is None:
+        text = _normalize_text(experience_level)
+        return next(
+            (name for name, bucket in buckets.items() if _normalize_text(bucket['experience_level']) == text),
+            None,
+        )
+    years = float(match.group(1))
+    for name, bucket in buckets.items():
+        if bucket.get('max_years') is None or years <= bucket['max_years']:
+            return name
+    return None
+
+
+def _digest(career_goal: str, industry: str, bucket: str, time_commitment: str) -> bytes:
+    canonical = json.dumps(
+        [_normalize_text(career_goal), _normalize_text(industry), bucket, _normalize_text(time_commitment)],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).digest()[:16]
+
+
+def warehouse_key(inputs: Dict[str, Any], settings: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+    """Warehouse key for ``inputs``, or None when the profile is outside the matrix.
+
+    Only the stock sidebar skills and education are precomputed, so any other
+    value never matches; experience is matched by bucket.
+    """
+    settings = warehouse_settings() if settings is None else settings
+    if not settings:
+        return None
+    if normalize_skills(inputs.get('current_skills', "")) != normalize_skills(settings.get('current_skills', "")):
+        return None
+    if _normalize_text(inputs.get('education', "")) != _normalize_text(settings.get('education', "")):
+        return None
+    bucket = experience_bucket(inputs.get('experience_level', ""), settings.get('experience_buckets', {}))
+    if bucket is None:
+        return None
+    return _digest(
+        inputs.get('career_goal', ""), inputs.get('industry', ""), bucket, str(inputs.get('time_commitment', ""))
+    )
+
+
+def matrix_profiles(settings: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[bytes, Dict[str, str]]]:
+    """Every (key, inputs) in the configured career_goal x industry x experience x time matrix"""
+    settings = warehouse_settings() if settings is None else settings
+    buckets = settings.get('experience_buckets', {})
+    for goal, industry, bucket, hours in itertools.product(
+        settings.get('career_goals', []),
+        settings.get('industries', []),
+        buckets,
+        settings.get('time_commitments', []),
+    ):
+        inputs = {
+            'career_goal': goal,
+            'industry': industry,
+            'current_skills': settings.get('current_skills', ""),
+            'experience_level': buckets[bucket]['experience_level'],
+            'education': settings.get('education', ""),
+            'time_commitment': str(hours),
+        }
+        yield _digest(goal, industry, bucket, str(hours)), inputs
+
+
+def write_warehouse(path: Path, entries: Dict[bytes, Tuple[float, bytes]], built_at: Optional[float] = None):
+    """Write ``key -> (generated_at, compressed plan)`` as a sorted, indexed file"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    keys = sorted(entries)
+    offset = _HEADER.size + _ENTRY.size * len(keys)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(keys), built_at or time.time()))
+        for key in keys:
+            generated_at, blob = entries[key]
+            f.write(_ENTRY.pack(key, offset, len(blob), generated_at))
+            offset += len(blob)
+        for key in keys:
+            f.write(entries[key][1])
+    # Rename so readers mapping the old file keep a consistent view
+    os.replace(tmp_path, path)
+
+
+def encode_plan(plan: Dict[str, Any]) -> bytes:
+    return zlib.compress(json.dumps({'tasks': plan['tasks']}, separators=(",", ":")).encode("utf-8"), 9)
+
+
+class PlanWarehouse:
+    """Precomputed plans for the stock sidebar profiles, memory-mapped from one file.
+
+    The file is a header, a fixed-width index sorted by key digest and the
+    zlib-compressed plans it points at, so a lookup is a binary search over
+    the mapped index and one decompression. Plans older than ``max_age_days``
+    are not served; ones older than ``refresh_days`` are served but counted
+    as stale until the precompute job regenerates them.
+    """
+
+    def __init__(self, path: Path = DEFAULT_WAREHOUSE_PATH, settings: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.settings = warehouse_settings() if settings is None else settings
+        self.built_at = 0.0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._keys: List[bytes] = []
+        self._mtime = 0.0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return
+        if stat.st_mtime == self._mtime or stat.st_size < _HEADER.size:
+            return
+        f = open(self.path, "rb")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, built_at = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != VERSION:
+            mapped.close()
+            f.close()
+            return
+        keys = [_ENTRY.unpack_from(mapped, _HEADER.size + i * _ENTRY.size)[0] for i in range(count)]
+        old_map, old_file = self._map, self._file
+        self._map, self._file, self._keys = mapped, f, keys
+        self.built_at, self._mtime = built_at, stat.st_mtime
+        if old_map is not None:
+            old_map.close()
+            old_file.close()
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now - self._checked_at >= _RELOAD_CHECK_SECONDS:
+            self._checked_at = now
+            self._load()
+
+    def _entry(self, key: bytes) -> Optional[Tuple[float, bytes]]:
+        index = bisect.bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            return None
+        _, offset, length, generated_at = _ENTRY.unpack_from(self._map, _HEADER.size + index * _ENTRY.size)
+        return generated_at, self._map[offset:offset + length]
+
+    def entries(self) -> Dict[bytes, Tuple[float, bytes]]:
+        """Every stored ``key -> (generated_at, compressed plan)``"""
+        with self._lock:
+            self._load()
+            return {key: self._entry(key) for key in self._keys}
+
+    def get(self, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = warehouse_key(inputs, self.settings)
+        with self._lock:
+            self._maybe_reload()
+            entry = self._entry(key) if key is not None and self._map is not None else None
+            age_days = (time.time() - entry[0]) / 86400 if entry is not None else 0.0
+            if entry is None or age_days > self.settings.get('max_age_days', 30):
+                self.misses += 1
+                return None
+            stale = age_days > self.settings.get('refresh_days', 7)
+            self.hits += 1
+            self.stale_hits += stale
+        plan = json.loads(zlib.decompress(entry[1]))
+        plan['warehouse'] = {'generated_at': entry[0], 'stale': stale}
+        return plan
+
+    def close(self):
+        """Unmap the file; lookups miss until it is reloaded"""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._file.close()
+            self._map, self._file, self._keys, self._mtime = None, None, [], 0.0
+
+    def __enter__(self) -> "PlanWarehouse":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'entries': len(self._keys),
+                'age_seconds': time.time() - self.built_at if self.built_at else 0.0,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+            }
+
+
+def precompute(
+    generate: Callable[[Dict[str, Any]], Dict[str, Any]],
+    path: Path = DEFAULT_WAREHOUSE_PATH,
+    concurrency: int = 4,
+    force: bool = False,
+    settings: Optional[Dict[str, Any]] = None,
+    on_error: Optional[Callable[[Dict[str, Any], BaseException], None]] = None,
+) -> Dict[str, int]:
+    """Generate the matrix's missing and stale plans and rewrite the warehouse file.
+
+    Plans younger than ``refresh_days`` are carried over unless ``force``;
+    a profile that fails to generate keeps its previous plan, if any.
+    """
+    settings = warehouse_settings() if settings is None else settings
+    # entries() copies the plans out, so the mapping can go before the file is rewritten
+    with PlanWarehouse(path, settings) as warehouse:
+        existing = warehouse.entries()
+    cutoff = time.time() - settings.get('refresh_days', 7) * 86400
+    profiles = dict(matrix_profiles(settings))
+    todo = [
+        key for key in profiles
+        if force or key not in existing or existing[key][0] < cutoff
+    ]
+    counts = {'profiles': len(profiles), 'kept': len(profiles) - len(todo), 'generated': 0, 'failed': 0}
+    entries = {key: existing[key] for key in profiles if key in existing}
+    lock = threading.Lock()
+
+    def build(key: bytes):
+        inputs = profiles[key]
+        try:
+            plan = generate(inputs)
+        except Exception as e:
+            with lock:
+                counts['failed'] += 1
+            if on_error is not None:
+                on_error(inputs, e)
+            return
+        with lock:
+            entries[key] = (time.time(), encode_plan(plan))
+            counts['generated'] += 1
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="warehouse") as pool:
+        list(pool.map(build, todo))
+    write_warehouse(path, entries)
+    return counts
+
@@ -0,0 +1,55 @@
+"""Offline test environment: stub LLM, no telemetry, caches in a temp directory.
+
+Settings and cache paths are read when newgroq modules are imported, so the
+environment is set here, before any test module imports them.
+"""
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+_WORKDIR = Path(tempfile.mkdtemp(prefix="newgroq-tests-"))
+(_WORKDIR / "crewai.json").write_text(json.dumps({
+    "rate_limits": {"requests_per_minute": 1_000_000, "tokens_per_minute": 1_000_000_000},
+}))
+os.environ.update({
+    "NEWGROQ_LLM_MODEL": "stub/test",
+    "NEWGROQ_SETTINGS": str(_WORKDIR / "crewai.json"),
+    "NEWGROQ_CACHE_DIR": str(_WORKDIR / "cache"),
+    "NEWGROQ_PREWARM": "0",
+    "CREWAI_DISABLE_TELEMETRY": "true",
+    "CREWAI_TRACING_ENABLED": "false",
+    "OTEL_SDK_DISABLED": "true",
+    "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+    "GROQ_API_KEY": "offline",
+})
+
+PROFILE = {
+    'career_goal': 'Data Engineer',
+    'industry': 'Data Science',
+    'current_skills': 'Python, SQL, Data analysis',
+    'experience_level': '2 years as Junior Data Analyst',
+    'education': "Bachelor's in Computer Science",
+    'time_commitment': '15',
+}
+
+
+@pytest.fixture
+def stub():
+    """The stub LLM provider, registered with litellm for this test"""
+    stub_llm = pytest.importorskip("stub_llm")
+    return stub_llm.register()
+
+
+@pytest.fixture
+def profile():
+    from newgroq.taxonomy import with_skill_gap_facts
+
+    return with_skill_gap_facts(PROFILE)
@@ -0,0 +1,17 @@
+import json
+
+from newgroq.batch import BatchRunner
+
+
+def test_resume_drops_a_truncated_last_line(tmp_path):
+    profiles = tmp_path / "profiles.jsonl"
+    profiles.write_text("".join(json.dumps({'id': i, 'career_goal': f"goal {i}"}) + "\n" for i in range(1, 4)))
+    output = tmp_path / "plans.jsonl"
+    # A crash while writing profile 2's result
+    output.write_text(json.dumps({'id': "1", 'status': 'ok', 'plan': {}}) + "\n" + '{"id": "2", "sta')
+
+    counts = BatchRunner(lambda inputs: {'goal': inputs['career_goal']}, log=None).run(profiles, output)
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert counts == {'ok': 2, 'error': 0, 'skipped': 1}
+    assert sorted(record['id'] for record in records) == ["1", "2", "3"]
@@ -0,0 +1,27 @@
+from newgroq.cache import ResultCache
+
+from conftest import PROFILE
+
+
+def test_callers_cannot_modify_cached_plans(tmp_path):
+    cache = ResultCache(cache_dir=tmp_path)
+    plan = {'tasks': {'skill_gap_analysis_task': "gap"}}
+    cache.set(PROFILE, plan)
+
+    plan['tasks']['skill_gap_analysis_task'] = "changed after set"
+    got = cache.get(PROFILE)
+    got['tasks']['skill_gap_analysis_task'] = "changed after get"
+
+    assert cache.get(PROFILE) == {'tasks': {'skill_gap_analysis_task': "gap"}}
+
+
+def test_disk_hits_are_remembered_and_copied(tmp_path):
+    ResultCache(cache_dir=tmp_path).set(PROFILE, {'tasks': {}})
+    cache = ResultCache(cache_dir=tmp_path)
+
+    first = cache.get(PROFILE)
+    first['tasks']['added'] = "by the caller"
+
+    assert cache.get(PROFILE) == {'tasks': {}}
+    assert cache.stats.as_dict()['disk_hits'] == 1
+    assert cache.stats.as_dict()['memory_hits'] == 1
@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("crewai")
+
+import newgroq.routing
+from newgroq.crew import Newgroq
+from newgroq.schedule import DAG
+from newgroq.settings import load_settings
+
+ROUTING = {
+    "tiers": {"brief": {"max_tokens": 600}, "extended": {"max_tokens": 1400}},
+    "tasks": {"action_plan_draft_task": {"tier": "brief"}, "action_plan_task": {"tier": "extended"}},
+}
+
+
+@pytest.fixture
+def routed(monkeypatch):
+    settings = dict(load_settings(), routing=ROUTING)
+    monkeypatch.setattr(newgroq.routing, 'load_settings', lambda: settings)
+
+
+def test_tasks_sharing_an_agent_get_their_own_route(routed):
+    newgroq = Newgroq()
+    newgroq.schedule = DAG
+    crew = newgroq.crew()
+    tasks = {task.name: task for task in crew.tasks}
+
+    draft = tasks['action_plan_draft_task'].agent
+    final = tasks['action_plan_task'].agent
+    assert draft.llm.max_tokens == 600
+    assert final.llm.max_tokens == 1400
+    assert draft.llm.stream and final.llm.stream
+    assert draft.role == final.role
+    # Every task's LLM is counted in the crew's token usage
+    assert {id(agent) for agent in crew.agents} == {id(task.agent) for task in crew.tasks}
+
+
+def test_tasks_on_the_agents_own_route_share_it(routed):
+    crew = Newgroq().crew()
+
+    assert len(crew.agents) == len(crew.tasks) == 3
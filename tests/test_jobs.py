@@ -0,0 +1,104 @@
+import threading
+from concurrent.futures import Future
+
+from newgroq.jobs import CANCELLED, DONE, FAILED, RUNNING, JobManager
+
+
+class Blocking:
+    """A run function that holds its worker until released"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def __call__(self, inputs, progress=None, user_id=None):
+        self.calls.append(inputs)
+        self.started.set()
+        self.release.wait(5)
+        return {'plan': inputs['career_goal']}
+
+
+def test_job_follows_an_in_flight_run_without_a_worker():
+    run = Blocking()
+    shared = Future()
+    joins = []
+
+    def join(inputs, progress=None, user_id=None):
+        joins.append(user_id)
+        return shared
+
+    jobs = JobManager(run, max_workers=1, join=join)
+    job_id = jobs.submit({'career_goal': "Data Engineer"}, user_id="alice")
+
+    assert jobs.get(job_id).status == RUNNING
+    shared.set_result({'plan': "shared"})
+    job = jobs.wait(job_id, timeout=5)
+
+    assert job.status == DONE and job.result == {'plan': "shared"}
+    assert run.calls == [] and joins == ["alice"]
+
+
+def test_worker_follows_a_run_that_started_while_the_job_was_queued():
+    run = Blocking()
+    shared = Future()
+    in_flight = []
+    jobs = JobManager(run, max_workers=1, join=lambda inputs, **kwargs: in_flight[0] if in_flight else None)
+
+    first = jobs.submit({'career_goal': "Data Scientist"})
+    run.started.wait(5)
+    second = jobs.submit({'career_goal': "Data Engineer"})
+    in_flight.append(shared)
+    run.release.set()
+    jobs.wait(first, timeout=5)
+    shared.set_exception(RuntimeError("shared run failed"))
+
+    job = jobs.wait(second, timeout=5)
+    assert job.status == FAILED and str(job.error) == "shared run failed"
+    assert [inputs['career_goal'] for inputs in run.calls] == ["Data Scientist"]
+
+
+def test_cancelling_a_followed_job_leaves_the_shared_run_alone():
+    shared = Future()
+    shared.set_running_or_notify_cancel()
+    followed = Future()
+    shared.add_done_callback(lambda done: followed.set_result(done.result()) if not followed.cancelled() else None)
+    jobs = JobManager(Blocking(), join=lambda inputs, **kwargs: followed)
+
+    job_id = jobs.submit({'career_goal': "Data Engineer"})
+    assert jobs.cancel(job_id)
+    shared.set_result({'plan': "shared"})
+
+    job = jobs.wait(job_id, timeout=5)
+    assert job.status == CANCELLED and job.result is None
+    assert shared.result() == {'plan': "shared"}
+
+
+def test_cancelling_a_running_job_drops_its_result():
+    run = Blocking()
+    jobs = JobManager(run, max_workers=1)
+
+    job_id = jobs.submit({'career_goal': "Data Engineer"})
+    run.started.wait(5)
+    assert jobs.cancel(job_id)
+    run.release.set()
+
+    job = jobs.wait(job_id, timeout=5)
+    assert job.status == CANCELLED and job.result is None
+    assert not jobs.cancel(job_id)
+
+
+def test_cancelling_a_queued_job_never_runs_it():
+    run = Blocking()
+    jobs = JobManager(run, max_workers=1)
+
+    first = jobs.submit({'career_goal': "Data Scientist"})
+    run.started.wait(5)
+    queued = jobs.submit({'career_goal': "Data Engineer"})
+    assert jobs.cancel(queued)
+    assert jobs.get(queued).done.is_set()
+    run.release.set()
+    jobs.wait(first, timeout=5)
+
+    assert [inputs['career_goal'] for inputs in run.calls] == ["Data Scientist"]
+    assert jobs.stats()[CANCELLED] == 1 and jobs.stats()[DONE] == 1
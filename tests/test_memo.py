@@ -0,0 +1,90 @@
+import pytest
+
+pytest.importorskip("crewai")
+
+from newgroq.cache import ResultCache
+from newgroq.crew import Newgroq
+from newgroq.memo import kickoff_memoized
+from newgroq.pool import reset_crew
+from newgroq.schedule import DAG, SEQUENTIAL
+from newgroq.taxonomy import with_skill_gap_facts
+
+
+def build_crew(schedule: str):
+    newgroq = Newgroq()
+    newgroq.schedule = schedule
+    return newgroq.crew()
+
+
+@pytest.fixture
+def memo(tmp_path):
+    return ResultCache(cache_dir=tmp_path, namespace="tasks")
+
+
+def test_dag_cold_run_memoizes_every_task(stub, profile, memo):
+    crew = build_crew(DAG)
+    assert any(task.async_execution for task in crew.tasks)
+
+    plan = kickoff_memoized(crew, profile, memo)
+
+    assert list(plan['tasks']) == [task.name for task in crew.tasks]
+    for task in crew.tasks:
+        assert plan['tasks'][task.name] == task.output.raw
+
+
+def test_dag_resume_reruns_only_the_changed_suffix(stub, profile, memo):
+    crew = build_crew(DAG)
+    cold = kickoff_memoized(crew, profile, memo)
+    reset_crew(crew)
+
+    # The skill gap task does not interpolate the weekly hours; every later task does
+    changed = with_skill_gap_facts(dict(profile, time_commitment='20'))
+    resumed = kickoff_memoized(crew, changed, memo)
+
+    assert list(resumed['tasks']) == list(cold['tasks'])
+    assert resumed['tasks']['skill_gap_analysis_task'] == cold['tasks']['skill_gap_analysis_task']
+    assert resumed['tasks']['learning_path_design_task'] != cold['tasks']['learning_path_design_task']
+
+    reset_crew(crew)
+    calls = stub.calls
+    assert kickoff_memoized(crew, changed, memo) == resumed
+    assert stub.calls == calls
+
+
+@pytest.mark.parametrize("schedule", [SEQUENTIAL, DAG])
+def test_warm_run_makes_no_llm_calls(stub, profile, memo, schedule):
+    crew = build_crew(schedule)
+    cold = kickoff_memoized(crew, profile, memo)
+    reset_crew(crew)
+
+    calls = stub.calls
+    assert kickoff_memoized(crew, profile, memo) == cold
+    assert stub.calls == calls
+
+
+@pytest.mark.parametrize("schedule", [SEQUENTIAL, DAG])
+def test_resume_gives_tasks_the_context_of_a_full_run(stub, profile, tmp_path, monkeypatch, schedule):
+    from newgroq.crew import CompactingCrew
+
+    contexts = []
+    get_context = CompactingCrew._get_context
+
+    def recording(self, task, task_outputs):
+        context = get_context(self, task, task_outputs)
+        contexts.append((task.name, context))
+        return context
+
+    monkeypatch.setattr(CompactingCrew, '_get_context', recording)
+    changed = with_skill_gap_facts(dict(profile, time_commitment='20'))
+
+    full = kickoff_memoized(build_crew(schedule), changed, ResultCache(cache_dir=tmp_path / "full"))
+    full_contexts = dict(contexts)
+
+    memo = ResultCache(cache_dir=tmp_path / "resumed")
+    kickoff_memoized(build_crew(schedule), profile, memo)
+    contexts.clear()
+    resumed = kickoff_memoized(build_crew(schedule), changed, memo)
+
+    assert contexts and 'skill_gap_analysis_task' not in dict(contexts)
+    assert dict(contexts) == {name: full_contexts[name] for name, _ in contexts}
+    assert resumed == full
@@ -0,0 +1,10 @@
+from newgroq.metrics import MetricsRegistry
+
+
+def test_prometheus_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.inc("llm_calls_total", labels={'agent': 'Path C:\\plans "draft"\nv2'})
+
+    line = next(line for line in registry.to_prometheus().splitlines() if line.startswith("newgroq_llm_calls_total{"))
+
+    assert line == 'newgroq_llm_calls_total{agent="Path C:\\\\plans \\"draft\\"\\nv2"} 1'
@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+
+from newgroq.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+    joined_states = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {'plan': 1}
+
+    results = {}
+    leader = threading.Thread(target=lambda: results.update(leader=flight.do("key", fn, state="progress")))
+    leader.start()
+    started.wait()
+    follower = threading.Thread(
+        target=lambda: results.update(follower=flight.do("key", fn, on_join=joined_states.append))
+    )
+    follower.start()
+    while flight.stats()['joined'] < 1:
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert calls == [1]
+    assert results == {'leader': ({'plan': 1}, False), 'follower': ({'plan': 1}, True)}
+    assert joined_states == ["progress"]
+    assert flight.stats() == {'in_flight': 0, 'joined': 0, 'leaders': 1, 'coalesced': 1}
+
+
+def test_errors_reach_every_waiter_and_release_the_key():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait()
+        raise RuntimeError("crew failed")
+
+    leader = threading.Thread(target=lambda: pytest.raises(RuntimeError, flight.do, "key", fail))
+    leader.start()
+    started.wait()
+    joined = flight.join("key")
+    release.set()
+    leader.join()
+
+    with pytest.raises(RuntimeError, match="crew failed"):
+        joined.result(timeout=5)
+    assert flight.do("key", lambda: "fresh") == ("fresh", False)
+
+
+def test_join_without_a_flight_returns_none():
+    flight = SingleFlight()
+
+    assert flight.join("key") is None
+    flight.do("key", lambda: "done")
+    assert flight.join("key") is None
+    assert flight.stats()['coalesced'] == 0
+
+
+def test_joined_futures_cannot_cancel_the_shared_call():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fn():
+        started.set()
+        release.wait()
+        return "plan"
+
+    leader = threading.Thread(target=flight.do, args=("key", fn))
+    leader.start()
+    started.wait()
+
+    joined = flight.join("key")
+    assert not joined.cancel()
+    release.set()
+    leader.join()
+    assert joined.result(timeout=5) == "plan"
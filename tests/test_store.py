@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from newgroq.store import UserStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    # A long interval and large batches so every row queued by a test commits in one batch
+    store = UserStore(tmp_path / "user_data.db", flush_interval=0.5)
+    yield store
+    store.close()
+
+
+def in_thread(fn):
+    result = {}
+
+    def run():
+        try:
+            result['value'] = fn()
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    return result
+
+
+def test_a_bad_row_drops_only_itself(store):
+    store.save_progress("alice", "plan", "Week 1", 40, "notes")
+    # rating is NOT NULL
+    store.add_feedback("bob", "plan", None)
+    store.add_resource("carol", "plan", "SQL course", "https://example.com")
+
+    with pytest.raises(Exception):
+        store.flush()
+
+    assert store.progress("alice", "plan") == {'Week 1': {'progress': 40, 'notes': "notes"}}
+    assert store.resources("carol", "plan") == [{'name': "SQL course", 'url': "https://example.com"}]
+    assert store.feedback("bob", "plan") is None
+    assert store.stats()['failed_rows'] == 1
+    assert store.stats()['rows_written'] == 2
+
+
+def test_only_the_thread_that_queued_a_failed_row_sees_its_error(store):
+    store.save_progress("alice", "plan", "Week 1", 40)
+    queued = threading.Event()
+    release = threading.Event()
+
+    def bad_write():
+        store.add_feedback("bob", "plan", None)
+        queued.set()
+        release.wait()
+        store.flush()
+
+    writer = threading.Thread(target=lambda: result.update(in_thread(bad_write)))
+    result = {}
+    writer.start()
+    queued.wait()
+
+    other = in_thread(store.flush)
+    read = in_thread(lambda: store.progress("alice", "plan"))
+    release.set()
+    writer.join()
+
+    assert 'error' not in other
+    assert read['value'] == {'Week 1': {'progress': 40, 'notes': ""}}
+    assert isinstance(result['error'], Exception)
+
+
+def test_reads_never_raise_for_failed_writes(store):
+    store.add_feedback("bob", "plan", None)
+
+    assert store.feedback("bob", "plan") is None
+    assert store.progress("bob", "plan") == {}
+    assert store.resources("bob", "plan") == []
@@ -0,0 +1,31 @@
+import newgroq.warehouse
+from newgroq.warehouse import PlanWarehouse, matrix_profiles, precompute
+
+SETTINGS = {
+    'current_skills': "Python, SQL",
+    'education': "Bachelor's in Computer Science",
+    'career_goals': ["Data Engineer", "Data Scientist"],
+    'industries': ["Data Science"],
+    'experience_buckets': {'junior': {'experience_level': "1 year", 'max_years': 2}},
+    'time_commitments': ["10"],
+}
+
+
+def test_precompute_closes_the_warehouse_it_reads(tmp_path, monkeypatch):
+    path = tmp_path / "plans.warehouse"
+    opened = []
+
+    class Recording(PlanWarehouse):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            opened.append(self)
+
+    monkeypatch.setattr(newgroq.warehouse, 'PlanWarehouse', Recording)
+    precompute(lambda inputs: {'tasks': {'goal': inputs['career_goal']}}, path, settings=SETTINGS)
+    counts = precompute(lambda inputs: {'tasks': {'goal': "regenerated"}}, path, settings=SETTINGS)
+
+    assert counts['kept'] == counts['profiles'] == 2
+    assert opened and all(warehouse._map is None for warehouse in opened)
+    with PlanWarehouse(path, SETTINGS) as warehouse:
+        for _, inputs in matrix_profiles(SETTINGS):
+            assert warehouse.get(inputs)['tasks']['goal'] == inputs['career_goal']